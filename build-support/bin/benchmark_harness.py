@@ -0,0 +1,131 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+"""The harness shared by the benchmark scripts in this directory.
+
+Each script emits its results as JSON of the form:
+
+    {"commit": ..., <config_key>: ..., "benchmarks": {<name>: <stats>}}
+
+where `<stats>` is either a summary of the samples of the benchmark (see `summarize`), or a dict of
+such summaries for each phase of the benchmark (e.g. "cold" and "warm").
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Any, Iterable
+
+
+def add_arguments(parser: argparse.ArgumentParser, benchmarks: Iterable[str]) -> None:
+    """Add the arguments to select benchmarks, and to write and compare their results."""
+    parser.add_argument(
+        "--benchmark",
+        action="append",
+        choices=sorted(benchmarks),
+        help="A benchmark to run (may be repeated). Defaults to all benchmarks.",
+    )
+    parser.add_argument("--output", help="A file to write the JSON results to, vs. stdout.")
+    parser.add_argument(
+        "--compare",
+        help=(
+            "A file containing the JSON results of a previous run to compare against. Exits "
+            "non-zero if any median time regressed by more than `--threshold`."
+        ),
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="The fractional slowdown of a median time which is considered a regression.",
+    )
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "max": max(samples),
+    }
+
+
+def current_commit() -> str | None:
+    result = subprocess.run(
+        ["git", "rev-parse", "HEAD"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    return result.stdout.decode().strip() if result.returncode == 0 else None
+
+
+def _medians(benchmarks: dict[str, Any]) -> dict[str, float]:
+    medians = {}
+    for name, stats in benchmarks.items():
+        if "median" in stats:
+            medians[name] = stats["median"]
+        else:
+            for phase, phase_stats in stats.items():
+                medians[f"{name} ({phase})"] = phase_stats["median"]
+    return medians
+
+
+def find_regressions(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    threshold: float,
+    config_key: str,
+    time_format: str,
+) -> list[str]:
+    """Describe each median time in `current` which is slower than `baseline` by > `threshold`.
+
+    The results may only be compared if they were run with the same `config_key` value.
+    `time_format` is a format string for a single time, e.g. "{:.3f}s".
+    """
+    if baseline[config_key] != current[config_key]:
+        raise ValueError(
+            f"Cannot compare results for different `{config_key}`s: {baseline[config_key]} vs "
+            f"{current[config_key]}."
+        )
+    baseline_medians = _medians(baseline["benchmarks"])
+    regressions = []
+    for name, median in sorted(_medians(current["benchmarks"]).items()):
+        baseline_median = baseline_medians.get(name)
+        if not baseline_median:
+            continue
+        ratio = median / baseline_median
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{name} regressed by {ratio - 1:.0%}: "
+                f"{time_format.format(baseline_median)} -> {time_format.format(median)}"
+            )
+    return regressions
+
+
+def report_results(
+    results: dict[str, Any], args: argparse.Namespace, *, config_key: str, time_format: str
+) -> None:
+    """Write the results as requested by `args`, and exit non-zero if any regressed."""
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    else:
+        json.dump(results, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(
+            baseline,
+            results,
+            threshold=args.threshold,
+            config_key=config_key,
+            time_format=time_format,
+        )
+        for regression in regressions:
+            print(regression, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
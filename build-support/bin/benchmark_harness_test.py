@@ -0,0 +1,47 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import pytest
+from benchmark_harness import find_regressions, summarize
+
+
+def test_summarize() -> None:
+    assert summarize([3.0, 1.0, 2.0]) == {"min": 1.0, "median": 2.0, "max": 3.0}
+
+
+def test_find_regressions() -> None:
+    def results(**medians: float) -> dict:
+        return {"size": 100, "benchmarks": {name: {"median": m} for name, m in medians.items()}}
+
+    baseline = results(copy=1.0, construct=1.0)
+    current = results(copy=0.1, construct=1.5, eq=1.0)
+    assert find_regressions(
+        baseline, current, threshold=0.2, config_key="size", time_format="{:.2f}us"
+    ) == ["construct regressed by 50%: 1.00us -> 1.50us"]
+
+
+def test_find_regressions_by_phase() -> None:
+    def results(**medians: float) -> dict:
+        return {
+            "repo": {"build_files": 1},
+            "benchmarks": {name: {"cold": {"median": m}} for name, m in medians.items()},
+        }
+
+    baseline = results(find_owners=1.0, coarsened_targets=1.0)
+    current = results(find_owners=1.1, coarsened_targets=1.5, options_for_scope=1.0)
+    assert find_regressions(
+        baseline, current, threshold=0.05, config_key="repo", time_format="{:.3f}s"
+    ) == [
+        "coarsened_targets (cold) regressed by 50%: 1.000s -> 1.500s",
+        "find_owners (cold) regressed by 10%: 1.000s -> 1.100s",
+    ]
+
+
+def test_find_regressions_different_config() -> None:
+    baseline = {"size": 100, "benchmarks": {}}
+    with pytest.raises(ValueError):
+        find_regressions(
+            baseline, {**baseline, "size": 10}, threshold=0.2, config_key="size", time_format="{}"
+        )
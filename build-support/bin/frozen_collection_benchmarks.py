@@ -0,0 +1,184 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+"""Times the operations of `FrozenDict` and `FrozenOrderedSet` which are hot in the engine.
+
+Results are emitted as JSON (in microseconds per operation), and may be compared against the
+results for another commit:
+
+    pants run build-support/bin/frozen_collection_benchmarks.py -- --output=before.json
+    git checkout <other commit>
+    pants run build-support/bin/frozen_collection_benchmarks.py -- --compare=before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+from typing import Any, Callable
+
+from benchmark_harness import add_arguments, current_commit, report_results, summarize
+
+from pants.util.frozendict import FrozenDict
+from pants.util.ordered_set import FrozenOrderedSet
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Times the operations of `FrozenDict` and `FrozenOrderedSet`."
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=1000,
+        help="The number of entries in each collection.",
+    )
+    parser.add_argument(
+        "--number",
+        type=int,
+        default=1000,
+        help="The number of times to run each operation per sample.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="The number of samples to take of each benchmark.",
+    )
+    add_arguments(parser, BENCHMARKS)
+    return parser
+
+
+def main() -> None:
+    args = create_parser().parse_args()
+    results = run_benchmarks(
+        benchmarks=args.benchmark or sorted(BENCHMARKS),
+        size=args.size,
+        number=args.number,
+        repeat=args.repeat,
+    )
+    report_results(results, args, config_key="size", time_format="{:.2f}us")
+
+
+# A benchmark is given the size of the collections to prepare (untimed), and returns the operation
+# to time.
+Benchmark = Callable[[int], Callable[[], Any]]
+
+
+def _dict(size: int, *, last_value: int = 0) -> dict[str, int]:
+    return {**{f"key{i}": i for i in range(size - 1)}, f"key{size - 1}": last_value}
+
+
+def frozendict_construct(size: int) -> Callable[[], Any]:
+    data = _dict(size)
+    return lambda: FrozenDict(data)
+
+
+def frozendict_copy(size: int) -> Callable[[], Any]:
+    fd = FrozenDict(_dict(size))
+    return lambda: FrozenDict(fd)
+
+
+def frozendict_eq_identical(size: int) -> Callable[[], Any]:
+    fd = FrozenDict(_dict(size))
+    return lambda: fd == fd
+
+
+def frozendict_eq_equal(size: int) -> Callable[[], Any]:
+    fd1 = FrozenDict(_dict(size))
+    fd2 = FrozenDict(_dict(size))
+    return lambda: fd1 == fd2
+
+
+def frozendict_eq_unequal(size: int) -> Callable[[], Any]:
+    fd1 = FrozenDict(_dict(size))
+    fd2 = FrozenDict(_dict(size, last_value=-1))
+    return lambda: fd1 == fd2
+
+
+def frozen_ordered_set_construct(size: int) -> Callable[[], Any]:
+    items = list(range(size))
+    return lambda: FrozenOrderedSet(items)
+
+
+def frozen_ordered_set_copy(size: int) -> Callable[[], Any]:
+    fos = FrozenOrderedSet(range(size))
+    return lambda: FrozenOrderedSet(fos)
+
+
+def frozen_ordered_set_eq_equal(size: int) -> Callable[[], Any]:
+    fos1 = FrozenOrderedSet(range(size))
+    fos2 = FrozenOrderedSet(range(size))
+    return lambda: fos1 == fos2
+
+
+def frozen_ordered_set_eq_unequal(size: int) -> Callable[[], Any]:
+    fos1 = FrozenOrderedSet(range(size))
+    fos2 = FrozenOrderedSet([*range(size - 1), -1])
+    # Equality may use the hashes of the sets once they have been computed, as for engine keys.
+    hash(fos1), hash(fos2)
+    return lambda: fos1 == fos2
+
+
+def frozen_ordered_set_union_subset(size: int) -> Callable[[], Any]:
+    fos = FrozenOrderedSet(range(size))
+    other = FrozenOrderedSet(range(0, size, 2))
+    return lambda: fos.union(other)
+
+
+def frozen_ordered_set_union_disjoint(size: int) -> Callable[[], Any]:
+    fos = FrozenOrderedSet(range(size))
+    other = FrozenOrderedSet(range(size, 2 * size))
+    return lambda: fos.union(other)
+
+
+def frozen_ordered_set_difference_disjoint(size: int) -> Callable[[], Any]:
+    fos = FrozenOrderedSet(range(size))
+    other = FrozenOrderedSet(range(size, 2 * size))
+    return lambda: fos.difference(other)
+
+
+def frozen_ordered_set_difference_half(size: int) -> Callable[[], Any]:
+    fos = FrozenOrderedSet(range(size))
+    other = FrozenOrderedSet(range(0, size, 2))
+    return lambda: fos.difference(other)
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    "frozendict_construct": frozendict_construct,
+    "frozendict_copy": frozendict_copy,
+    "frozendict_eq_identical": frozendict_eq_identical,
+    "frozendict_eq_equal": frozendict_eq_equal,
+    "frozendict_eq_unequal": frozendict_eq_unequal,
+    "frozen_ordered_set_construct": frozen_ordered_set_construct,
+    "frozen_ordered_set_copy": frozen_ordered_set_copy,
+    "frozen_ordered_set_eq_equal": frozen_ordered_set_eq_equal,
+    "frozen_ordered_set_eq_unequal": frozen_ordered_set_eq_unequal,
+    "frozen_ordered_set_union_subset": frozen_ordered_set_union_subset,
+    "frozen_ordered_set_union_disjoint": frozen_ordered_set_union_disjoint,
+    "frozen_ordered_set_difference_disjoint": frozen_ordered_set_difference_disjoint,
+    "frozen_ordered_set_difference_half": frozen_ordered_set_difference_half,
+}
+
+
+def run_benchmarks(
+    *, benchmarks: list[str], size: int, number: int, repeat: int
+) -> dict[str, Any]:
+    results = {}
+    for name in benchmarks:
+        operation = BENCHMARKS[name](size)
+        samples = timeit.repeat(operation, number=number, repeat=repeat)
+        # In microseconds per operation.
+        results[name] = summarize([sample / number * 1_000_000 for sample in samples])
+        print(f"{name}: {json.dumps(results[name])}", file=sys.stderr)
+    return {
+        "commit": current_commit(),
+        "size": size,
+        "benchmarks": results,
+    }
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from frozen_collection_benchmarks import BENCHMARKS, run_benchmarks
+
+
+def test_run_benchmarks() -> None:
+    results = run_benchmarks(benchmarks=sorted(BENCHMARKS), size=10, number=2, repeat=2)
+    assert results["size"] == 10
+    assert sorted(results["benchmarks"]) == sorted(BENCHMARKS)
+    for stats in results["benchmarks"].values():
+        assert stats["min"] <= stats["median"] <= stats["max"]
+
@@ -0,0 +1,278 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+"""Times hot paths of the rule graph against a synthetic monorepo.
+
+Each benchmark is run "cold" (as the first request against a fresh `RuleRunner`) and "warm" (as a
+repeated request in a new session against the same `RuleRunner`, as with `pantsd`). Results are
+emitted as JSON, and may be compared against the results for another commit:
+
+    pants run build-support/bin/rule_benchmarks.py -- --build-files=500 --output=before.json
+    git checkout <other commit>
+    pants run build-support/bin/rule_benchmarks.py -- --build-files=500 --compare=before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import sys
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Callable
+
+from benchmark_harness import add_arguments, current_commit, report_results, summarize
+
+from pants.backend.python import register as python_backend
+from pants.backend.python.dependency_inference.parse_python_dependencies import (
+    ParsedPythonDependencies,
+    ParsePythonDependenciesRequest,
+)
+from pants.backend.python.target_types import PythonSourceField
+from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
+from pants.engine.addresses import Address, Addresses
+from pants.engine.internals.build_files import AddressFamilyDir, OptionalAddressFamily
+from pants.engine.internals.graph import Owners, OwnersRequest
+from pants.engine.target import (
+    CoarsenedTargets,
+    CoarsenedTargetsRequest,
+    TransitiveTargets,
+    TransitiveTargetsRequest,
+)
+from pants.testutil.rule_runner import PYTHON_BOOTSTRAP_ENV, QueryRule, RuleRunner
+
+INTERPRETER_CONSTRAINTS = InterpreterConstraints(["CPython>=3.7,<4"])
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Times hot paths of the rule graph against a synthetic monorepo."
+    )
+    parser.add_argument(
+        "--build-files",
+        type=int,
+        default=100,
+        help="The number of directories (each containing one BUILD file) to generate.",
+    )
+    parser.add_argument(
+        "--files-per-build-file",
+        type=int,
+        default=5,
+        help="The number of Python files to generate in each directory.",
+    )
+    parser.add_argument(
+        "--fan-out",
+        type=int,
+        default=3,
+        help="The number of other directories that each Python file imports from.",
+    )
+    parser.add_argument(
+        "--cold-iterations",
+        type=int,
+        default=3,
+        help="The number of times to run each benchmark against a fresh `RuleRunner`.",
+    )
+    parser.add_argument(
+        "--warm-iterations",
+        type=int,
+        default=5,
+        help="The number of times to re-run each benchmark after each cold run.",
+    )
+    add_arguments(parser, BENCHMARKS)
+    return parser
+
+
+def main() -> None:
+    args = create_parser().parse_args()
+    repo = SyntheticRepo(
+        build_files=args.build_files,
+        files_per_build_file=args.files_per_build_file,
+        fan_out=args.fan_out,
+    )
+    results = run_benchmarks(
+        repo,
+        benchmarks=args.benchmark or sorted(BENCHMARKS),
+        cold_iterations=args.cold_iterations,
+        warm_iterations=args.warm_iterations,
+    )
+    report_results(results, args, config_key="repo", time_format="{:.3f}s")
+
+
+@dataclass(frozen=True)
+class SyntheticRepo:
+    """A repo of `python_sources` targets, whose files import from the directories after them.
+
+    The imports always point "forward", so the dependency graph is acyclic, and the first directory
+    has the deepest transitive closure.
+    """
+
+    build_files: int
+    files_per_build_file: int
+    fan_out: int
+
+    def directory(self, index: int) -> str:
+        return f"src/pkg{index}"
+
+    @property
+    def directories(self) -> list[str]:
+        return [self.directory(i) for i in range(self.build_files)]
+
+    @property
+    def source_files(self) -> list[str]:
+        return [
+            f"{directory}/mod{j}.py"
+            for directory in self.directories
+            for j in range(self.files_per_build_file)
+        ]
+
+    @property
+    def target_addresses(self) -> Addresses:
+        return Addresses(Address(directory) for directory in self.directories)
+
+    @property
+    def file_addresses(self) -> Addresses:
+        return Addresses(
+            Address(directory, relative_file_path=f"mod{j}.py")
+            for directory in self.directories
+            for j in range(self.files_per_build_file)
+        )
+
+    def files(self) -> dict[str, str]:
+        files = {}
+        for i, directory in enumerate(self.directories):
+            files[f"{directory}/BUILD"] = "python_sources()\n"
+            files[f"{directory}/__init__.py"] = ""
+            for j in range(self.files_per_build_file):
+                imports = [
+                    f"from pkg{dep} import mod{j}\n"
+                    for dep in range(i + 1, min(i + 1 + self.fan_out, self.build_files))
+                ]
+                files[f"{directory}/mod{j}.py"] = "".join(imports) + f"\n\nVALUE = {j}\n"
+        return files
+
+
+def create_rule_runner(repo: SyntheticRepo) -> RuleRunner:
+    rule_runner = RuleRunner(
+        rules=[
+            *python_backend.rules(),
+            QueryRule(OptionalAddressFamily, [AddressFamilyDir]),
+            QueryRule(TransitiveTargets, [TransitiveTargetsRequest]),
+            QueryRule(CoarsenedTargets, [CoarsenedTargetsRequest]),
+            QueryRule(Owners, [OwnersRequest]),
+            QueryRule(ParsedPythonDependencies, [ParsePythonDependenciesRequest]),
+        ],
+        target_types=python_backend.target_types(),
+        aliases=[python_backend.build_file_aliases()],
+    )
+    rule_runner.set_options(["--source-root-patterns=['src']"], env_inherit=PYTHON_BOOTSTRAP_ENV)
+    rule_runner.write_files(repo.files())
+    return rule_runner
+
+
+# A benchmark is given a RuleRunner to prepare any (untimed) inputs, and returns the function to
+# time. The first call of that function is the cold run, and subsequent calls are warm.
+Benchmark = Callable[[RuleRunner, SyntheticRepo], Callable[[], Any]]
+
+
+def parse_build_files(rule_runner: RuleRunner, repo: SyntheticRepo) -> Callable[[], Any]:
+    def run() -> None:
+        for directory in repo.directories:
+            rule_runner.request(OptionalAddressFamily, [AddressFamilyDir(directory)])
+
+    return run
+
+
+def transitive_dependency_mapping(
+    rule_runner: RuleRunner, repo: SyntheticRepo
+) -> Callable[[], Any]:
+    request = TransitiveTargetsRequest(repo.target_addresses)
+    return lambda: rule_runner.request(TransitiveTargets, [request])
+
+
+def coarsened_targets(rule_runner: RuleRunner, repo: SyntheticRepo) -> Callable[[], Any]:
+    request = CoarsenedTargetsRequest(repo.file_addresses)
+    return lambda: rule_runner.request(CoarsenedTargets, [request])
+
+
+def find_owners(rule_runner: RuleRunner, repo: SyntheticRepo) -> Callable[[], Any]:
+    request = OwnersRequest(tuple(repo.source_files))
+    return lambda: rule_runner.request(Owners, [request])
+
+
+def parse_python_dependencies(rule_runner: RuleRunner, repo: SyntheticRepo) -> Callable[[], Any]:
+    requests = [
+        ParsePythonDependenciesRequest(
+            rule_runner.get_target(address)[PythonSourceField], INTERPRETER_CONSTRAINTS
+        )
+        for address in repo.file_addresses
+    ]
+
+    def run() -> None:
+        for request in requests:
+            rule_runner.request(ParsedPythonDependencies, [request])
+
+    return run
+
+
+def options_for_scope(rule_runner: RuleRunner, repo: SyntheticRepo) -> Callable[[], Any]:
+    options = rule_runner.options_bootstrapper.full_options(
+        rule_runner.build_config, rule_runner.union_membership
+    )
+
+    def run() -> None:
+        for scope in options.known_scope_to_info:
+            options.for_scope(scope)
+
+    return run
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    "parse_build_files": parse_build_files,
+    "transitive_dependency_mapping": transitive_dependency_mapping,
+    "coarsened_targets": coarsened_targets,
+    "find_owners": find_owners,
+    "parse_python_dependencies": parse_python_dependencies,
+    "options_for_scope": options_for_scope,
+}
+
+
+TimeInSeconds = float
+
+
+def run_benchmarks(
+    repo: SyntheticRepo,
+    *,
+    benchmarks: list[str],
+    cold_iterations: int,
+    warm_iterations: int,
+) -> dict[str, Any]:
+    results = {}
+    for name in benchmarks:
+        cold: list[TimeInSeconds] = []
+        warm: list[TimeInSeconds] = []
+        for _ in range(cold_iterations):
+            rule_runner = create_rule_runner(repo)
+            run = BENCHMARKS[name](rule_runner, repo)
+            start = perf_counter()
+            run()
+            cold.append(perf_counter() - start)
+            for i in range(warm_iterations):
+                rule_runner.new_session(f"{name}_warm_{i}")
+                start = perf_counter()
+                run()
+                warm.append(perf_counter() - start)
+        results[name] = {
+            "cold": summarize(cold),
+            **({"warm": summarize(warm)} if warm else {}),
+        }
+        print(f"{name}: {json.dumps(results[name])}", file=sys.stderr)
+    return {
+        "commit": current_commit(),
+        "repo": dataclasses.asdict(repo),
+        "benchmarks": results,
+    }
+
+
+if __name__ == "__main__":
+    main()
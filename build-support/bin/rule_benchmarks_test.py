@@ -0,0 +1,21 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+from rule_benchmarks import SyntheticRepo
+
+
+def test_synthetic_repo() -> None:
+    repo = SyntheticRepo(build_files=3, files_per_build_file=2, fan_out=2)
+    files = repo.files()
+    assert sorted(f for f in files if f.endswith("BUILD")) == [
+        "src/pkg0/BUILD",
+        "src/pkg1/BUILD",
+        "src/pkg2/BUILD",
+    ]
+    assert len(repo.source_files) == len(repo.file_addresses) == 6
+    assert files["src/pkg0/mod1.py"].startswith("from pkg1 import mod1\nfrom pkg2 import mod1\n")
+    assert files["src/pkg1/mod0.py"].startswith("from pkg2 import mod0\n\n")
+    assert "import" not in files["src/pkg2/mod0.py"]
+
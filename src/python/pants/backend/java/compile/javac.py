@@ -15,9 +15,16 @@ from pants.backend.java.dependency_inference.rules import rules as java_dep_infe
 from pants.backend.java.subsystems.javac import JavacSubsystem
 from pants.backend.java.target_types import JavaFieldSet, JavaGeneratorFieldSet, JavaSourceField
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
-from pants.core.util_rules.system_binaries import BashBinary, ZipBinary
-from pants.engine.fs import EMPTY_DIGEST, CreateDigest, Digest, Directory, MergeDigests, Snapshot
-from pants.engine.process import FallibleProcessResult, Process, ProcessResult
+from pants.engine.fs import (
+    EMPTY_DIGEST,
+    CreateDigest,
+    Digest,
+    Directory,
+    MergeDigests,
+    RemovePrefix,
+    Snapshot,
+)
+from pants.engine.process import FallibleProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import CoarsenedTarget, SourcesField
 from pants.engine.unions import UnionRule
@@ -33,8 +40,7 @@ from pants.jvm.compile import (
 )
 from pants.jvm.compile import rules as jvm_compile_rules
 from pants.jvm.jdk_rules import JdkEnvironment, JdkRequest, JvmProcess
-from pants.jvm.strip_jar.strip_jar import StripJarRequest
-from pants.jvm.subsystems import JvmSubsystem
+from pants.jvm.strip_jar.strip_jar import CreateJarRequest
 from pants.util.logging import LogLevel
 
 logger = logging.getLogger(__name__)
@@ -51,10 +57,7 @@ def compute_output_jar_filename(ctgt: CoarsenedTarget) -> str:
 
 @rule(desc="Compile with javac")
 async def compile_java_source(
-    bash: BashBinary,
     javac: JavacSubsystem,
-    zip_binary: ZipBinary,
-    jvm: JvmSubsystem,
     request: CompileJavaSourceRequest,
 ) -> FallibleClasspathEntry:
     # Request the component's direct dependency classpath, and additionally any prerequisite.
@@ -193,40 +196,22 @@ async def compile_java_source(
         )
 
     # Jar.
-    # NB: We jar up the outputs in a separate process because the nailgun runner cannot support
-    # invoking via a `bash` wrapper (since the trailing portion of the command is executed by
-    # the nailgun server). We might be able to resolve this in the future via a Javac wrapper shim.
-    output_snapshot = await Get(Snapshot, Digest, compile_result.output_digest)
+    # NB: The jar is assembled in-process, and is always reproducible, so it does not need to be
+    # stripped.
+    output_digest = await Get(Digest, RemovePrefix(compile_result.output_digest, dest_dir))
+    output_snapshot = await Get(Snapshot, Digest, output_digest)
     output_file = compute_output_jar_filename(request.component)
     output_files: tuple[str, ...] = (output_file,)
     if output_snapshot.files:
-        jar_result = await Get(
-            ProcessResult,
-            Process(
-                argv=[
-                    bash.path,
-                    "-c",
-                    " ".join(
-                        ["cd", dest_dir, ";", zip_binary.path, "-r", f"../{output_file}", "."]
-                    ),
-                ],
-                input_digest=compile_result.output_digest,
-                output_files=output_files,
-                description=f"Capture outputs of {request.component} for javac",
-                level=LogLevel.TRACE,
-            ),
+        jar_output_digest = await Get(
+            Digest, CreateJarRequest(digest=output_digest, path=output_file)
         )
-        jar_output_digest = jar_result.output_digest
     else:
         # If there was no output, then do not create a jar file. This may occur, for example, when compiling
         # a `package-info.java` in a single partition.
         output_files = ()
         jar_output_digest = EMPTY_DIGEST
 
-    if jvm.reproducible_jars:
-        jar_output_digest = await Get(
-            Digest, StripJarRequest(digest=jar_output_digest, filenames=output_files)
-        )
     output_classpath = ClasspathEntry(
         jar_output_digest, output_files, direct_dependency_classpath_entries
     )
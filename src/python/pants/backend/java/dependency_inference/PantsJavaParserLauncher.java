@@ -25,6 +25,8 @@ import com.github.javaparser.ast.type.ClassOrInterfaceType;
 import com.github.javaparser.ast.type.Type;
 import com.github.javaparser.ast.type.WildcardType;
 import java.io.File;
+import java.nio.file.Path;
+import java.nio.file.Paths;
 import java.util.ArrayList;
 import java.util.HashSet;
 import java.util.List;
@@ -116,15 +118,40 @@ public class PantsJavaParserLauncher {
   }
 
   public static void main(String[] args) throws Exception {
-    String analysisOutputPath = args[0];
-    String sourceToAnalyze = args[1];
-
     // NB: We hardcode the most permissive language level in order to capture all potential
     // sources of symbols. If certain syntax ends up deprecated in future versions, we may need to
     // allow this to be configured.
     StaticJavaParser.setConfiguration(
         new ParserConfiguration()
             .setLanguageLevel(ParserConfiguration.LanguageLevel.JAVA_17_PREVIEW));
+    ObjectMapper mapper = new ObjectMapper();
+    mapper.registerModule(new Jdk8Module());
+
+    if (args[0].equals("--batch")) {
+      // Usage: --batch <outputDir> <source>...
+      // The analysis of each source is written to `<outputDir>/<source>.json`.
+      Path outputDir = Paths.get(args[1]);
+      for (int i = 2; i < args.length; i++) {
+        String sourceToAnalyze = args[i];
+        CompilationUnitAnalysis analysis;
+        try {
+          analysis = analyze(sourceToAnalyze);
+        } catch (Exception e) {
+          throw new Exception("Failed to analyze " + sourceToAnalyze, e);
+        }
+        File analysisOutputFile = outputDir.resolve(sourceToAnalyze + ".json").toFile();
+        analysisOutputFile.getParentFile().mkdirs();
+        mapper.writeValue(analysisOutputFile, analysis);
+      }
+    } else {
+      // Usage: <outputFile> <source>
+      String analysisOutputPath = args[0];
+      String sourceToAnalyze = args[1];
+      mapper.writeValue(new File(analysisOutputPath), analyze(sourceToAnalyze));
+    }
+  }
+
+  private static CompilationUnitAnalysis analyze(String sourceToAnalyze) throws Exception {
     CompilationUnit cu = StaticJavaParser.parse(new File(sourceToAnalyze));
 
     // Get the source's declare package.
@@ -227,11 +254,7 @@ public class PantsJavaParserLauncher {
 
     ArrayList<String> consumedTypes = new ArrayList<>(consumedIdentifiers);
     ArrayList<String> exportTypes = new ArrayList<>(exportIdentifiers);
-    CompilationUnitAnalysis analysis =
-        new CompilationUnitAnalysis(
-            declaredPackage, imports, topLevelTypes, consumedTypes, exportTypes);
-    ObjectMapper mapper = new ObjectMapper();
-    mapper.registerModule(new Jdk8Module());
-    mapper.writeValue(new File(analysisOutputPath), analysis);
+    return new CompilationUnitAnalysis(
+        declaredPackage, imports, topLevelTypes, consumedTypes, exportTypes);
   }
 }
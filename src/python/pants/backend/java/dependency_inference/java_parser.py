@@ -22,8 +22,10 @@ from pants.jvm.jdk_rules import InternalJdk, JvmProcess
 from pants.jvm.resolve.coursier_fetch import ToolClasspath, ToolClasspathRequest
 from pants.jvm.resolve.jvm_tool import GenerateJvmLockfileFromTool, GenerateJvmToolLockfileSentinel
 from pants.option.global_options import KeepSandboxes
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet
+from pants.util.strutil import pluralize
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +47,24 @@ class FallibleJavaSourceDependencyAnalysisResult:
     process_result: FallibleProcessResult
 
 
+@dataclass(frozen=True)
+class JavaSourceDependencyAnalysisBatchRequest:
+    """Analyze all of the given source files with a single invocation of the parser."""
+
+    source_files: SourceFiles
+
+
+@dataclass(frozen=True)
+class JavaSourceDependencyAnalysisBatch:
+    """The analysis of each file in a `JavaSourceDependencyAnalysisBatchRequest`, by path.
+
+    If the batch could not be analyzed, this is empty, and the files should be analyzed
+    individually.
+    """
+
+    analyses: FrozenDict[str, JavaSourceDependencyAnalysis]
+
+
 @dataclass(frozen=True)
 class JavaParserCompiledClassfiles:
     digest: Digest
@@ -142,6 +162,87 @@ async def analyze_java_source_dependencies(
     return FallibleJavaSourceDependencyAnalysisResult(process_result=process_result)
 
 
+@rule(level=LogLevel.DEBUG)
+async def analyze_java_source_dependencies_batch(
+    processor_classfiles: JavaParserCompiledClassfiles,
+    jdk: InternalJdk,
+    request: JavaSourceDependencyAnalysisBatchRequest,
+) -> JavaSourceDependencyAnalysisBatch:
+    source_files = request.source_files
+    source_prefix = "__source_to_analyze"
+    processorcp_relpath = "__processorcp"
+    toolcp_relpath = "__toolcp"
+
+    parser_lockfile_request = await Get(
+        GenerateJvmLockfileFromTool, JavaParserToolLockfileSentinel()
+    )
+    tool_classpath, prefixed_source_files_digest = await MultiGet(
+        Get(
+            ToolClasspath,
+            ToolClasspathRequest(lockfile=parser_lockfile_request),
+        ),
+        Get(Digest, AddPrefix(source_files.snapshot.digest, source_prefix)),
+    )
+
+    extra_immutable_input_digests = {
+        toolcp_relpath: tool_classpath.digest,
+        processorcp_relpath: processor_classfiles.digest,
+    }
+
+    analysis_output_dir = "__source_analysis"
+
+    process_result = await Get(
+        FallibleProcessResult,
+        JvmProcess(
+            jdk=jdk,
+            classpath_entries=[
+                *tool_classpath.classpath_entries(toolcp_relpath),
+                processorcp_relpath,
+            ],
+            argv=[
+                "org.pantsbuild.javaparser.PantsJavaParserLauncher",
+                "--batch",
+                analysis_output_dir,
+                *(os.path.join(source_prefix, file) for file in source_files.files),
+            ],
+            input_digest=prefixed_source_files_digest,
+            extra_immutable_input_digests=extra_immutable_input_digests,
+            output_directories=(analysis_output_dir,),
+            extra_nailgun_keys=extra_immutable_input_digests,
+            description=f"Analyzing {pluralize(len(source_files.files), 'Java source')}",
+            level=LogLevel.DEBUG,
+        ),
+    )
+    if process_result.exit_code != 0:
+        # The files are analyzed individually instead, so that the failure is reported for the
+        # file(s) which caused it, and does not prevent the analysis of the other files.
+        logger.debug(
+            f"Failed to analyze a batch of {pluralize(len(source_files.files), 'Java source')}: "
+            f"falling back to analyzing them individually.\n"
+            f"stdout:\n{process_result.stdout.decode()}\nstderr:\n{process_result.stderr.decode()}"
+        )
+        return JavaSourceDependencyAnalysisBatch(FrozenDict())
+
+    # Split the output into the analysis of each file.
+    analysis_contents = await Get(DigestContents, Digest, process_result.output_digest)
+    analysis_by_output_path = {fc.path: fc.content for fc in analysis_contents}
+    return JavaSourceDependencyAnalysisBatch(
+        FrozenDict(
+            (
+                file,
+                JavaSourceDependencyAnalysis.from_json_dict(
+                    json.loads(
+                        analysis_by_output_path[
+                            os.path.join(analysis_output_dir, source_prefix, f"{file}.json")
+                        ]
+                    )
+                ),
+            )
+            for file in source_files.files
+        )
+    )
+
+
 def _load_javaparser_launcher_source() -> bytes:
     return pkg_resources.resource_string(__name__, _LAUNCHER_BASENAME)
 
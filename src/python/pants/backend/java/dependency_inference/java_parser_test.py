@@ -9,6 +9,8 @@ import pytest
 
 from pants.backend.java.dependency_inference.java_parser import (
     FallibleJavaSourceDependencyAnalysisResult,
+    JavaSourceDependencyAnalysisBatch,
+    JavaSourceDependencyAnalysisBatchRequest,
 )
 from pants.backend.java.dependency_inference.java_parser import rules as java_parser_rules
 from pants.backend.java.dependency_inference.types import JavaImport, JavaSourceDependencyAnalysis
@@ -38,6 +40,9 @@ def rule_runner() -> RuleRunner:
             *jdk_rules.rules(),
             QueryRule(FallibleJavaSourceDependencyAnalysisResult, (SourceFiles,)),
             QueryRule(JavaSourceDependencyAnalysis, (SourceFiles,)),
+            QueryRule(
+                JavaSourceDependencyAnalysisBatch, (JavaSourceDependencyAnalysisBatchRequest,)
+            ),
             QueryRule(SourceFiles, (SourceFilesRequest,)),
         ],
         target_types=[JavaSourceTarget],
@@ -287,3 +292,67 @@ def test_java_parser_consumed_types(rule_runner: RuleRunner) -> None:
         "String",
         "provider",  # note: false positive on a variable identifier
     ]
+
+
+@maybe_skip_jdk_test
+def test_java_parser_batch(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "src/BUILD": dedent(
+                """\
+                java_source(name='A', source='A.java')
+                java_source(name='B', source='B.java')
+                """
+            ),
+            "src/A.java": dedent(
+                """\
+                package org.pantsbuild.a;
+                import org.pantsbuild.b.B;
+                public class A {}
+                """
+            ),
+            "src/B.java": "package org.pantsbuild.b;\npublic class B {}\n",
+        }
+    )
+    targets = [rule_runner.get_target(Address("src", target_name=name)) for name in ("A", "B")]
+    source_files = rule_runner.request(
+        SourceFiles, [SourceFilesRequest(tgt[JavaSourceField] for tgt in targets)]
+    )
+    batch = rule_runner.request(
+        JavaSourceDependencyAnalysisBatch, [JavaSourceDependencyAnalysisBatchRequest(source_files)]
+    )
+
+    assert sorted(batch.analyses) == ["src/A.java", "src/B.java"]
+    a_analysis = batch.analyses["src/A.java"]
+    assert a_analysis.declared_package == "org.pantsbuild.a"
+    assert a_analysis.imports == (JavaImport(name="org.pantsbuild.b.B"),)
+    assert a_analysis.top_level_types == ("org.pantsbuild.a.A",)
+    b_analysis = batch.analyses["src/B.java"]
+    assert b_analysis.imports == ()
+    assert b_analysis.top_level_types == ("org.pantsbuild.b.B",)
+
+
+@maybe_skip_jdk_test
+def test_java_parser_batch_failure(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "src/BUILD": dedent(
+                """\
+                java_source(name='A', source='A.java')
+                java_source(name='B', source='B.java')
+                """
+            ),
+            "src/A.java": "package org.pantsbuild.a;\npublic class A {}\n",
+            "src/B.java": "syntax error!\n",
+        }
+    )
+    targets = [rule_runner.get_target(Address("src", target_name=name)) for name in ("A", "B")]
+    source_files = rule_runner.request(
+        SourceFiles, [SourceFilesRequest(tgt[JavaSourceField] for tgt in targets)]
+    )
+    batch = rule_runner.request(
+        JavaSourceDependencyAnalysisBatch, [JavaSourceDependencyAnalysisBatchRequest(source_files)]
+    )
+
+    # The failure is not raised for the batch: instead, its files should be analyzed individually.
+    assert not batch.analyses
@@ -4,12 +4,19 @@
 from __future__ import annotations
 
 import logging
+import os
 from collections import defaultdict
+from dataclasses import dataclass
 from typing import Mapping
 
+from pants.backend.java.dependency_inference.java_parser import (
+    JavaSourceDependencyAnalysisBatch,
+    JavaSourceDependencyAnalysisBatchRequest,
+)
 from pants.backend.java.dependency_inference.types import JavaSourceDependencyAnalysis
 from pants.backend.java.target_types import JavaSourceField
-from pants.core.util_rules.source_files import SourceFilesRequest
+from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
+from pants.engine.addresses import Address
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import AllTargets, Targets
 from pants.engine.unions import UnionRule
@@ -18,6 +25,7 @@ from pants.jvm.dependency_inference.artifact_mapper import MutableTrieNode
 from pants.jvm.dependency_inference.symbol_mapper import FirstPartyMappingRequest, SymbolMap
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import JvmResolveField
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 
 logger = logging.getLogger(__name__)
@@ -32,6 +40,67 @@ def find_all_java_targets(tgts: AllTargets) -> AllJavaTargets:
     return AllJavaTargets(tgt for tgt in tgts if tgt.has_field(JavaSourceField))
 
 
+# The maximum number of sources to analyze with a single invocation of the parser.
+_MAX_SOURCES_PER_ANALYSIS_BATCH = 128
+
+
+@dataclass(frozen=True)
+class JavaSourceAnalysisBatches:
+    """The sources of all Java targets, partitioned into batches which are each analyzed by a single
+    invocation of the parser.
+
+    Batches are formed from the sources in each directory, so that editing a file only causes the
+    other files in its directory to be re-analyzed.
+    """
+
+    batches: tuple[tuple[JavaSourceField, ...], ...]
+    batch_for_address: FrozenDict[Address, int]
+
+
+@rule(desc="Partition Java sources for analysis", level=LogLevel.DEBUG)
+def partition_java_sources_for_analysis(java_targets: AllJavaTargets) -> JavaSourceAnalysisBatches:
+    sources_by_directory: dict[str, list[JavaSourceField]] = defaultdict(list)
+    for tgt in java_targets:
+        source = tgt[JavaSourceField]
+        sources_by_directory[os.path.dirname(source.file_path)].append(source)
+    batches = [
+        tuple(sources[i : i + _MAX_SOURCES_PER_ANALYSIS_BATCH])
+        for _, sources in sorted(sources_by_directory.items())
+        for i in range(0, len(sources), _MAX_SOURCES_PER_ANALYSIS_BATCH)
+    ]
+    return JavaSourceAnalysisBatches(
+        tuple(batches),
+        FrozenDict(
+            (source.address, index) for index, batch in enumerate(batches) for source in batch
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class BatchedJavaSourceDependencyAnalysisRequest:
+    """Analyze the source of a Java target, along with the other sources in its batch."""
+
+    source: JavaSourceField
+
+
+@rule(level=LogLevel.DEBUG)
+async def analyze_java_source_in_batch(
+    request: BatchedJavaSourceDependencyAnalysisRequest, batches: JavaSourceAnalysisBatches
+) -> JavaSourceDependencyAnalysis:
+    index = batches.batch_for_address.get(request.source.address)
+    if index is not None:
+        source_files = await Get(SourceFiles, SourceFilesRequest(batches.batches[index]))
+        batch = await Get(
+            JavaSourceDependencyAnalysisBatch,
+            JavaSourceDependencyAnalysisBatchRequest(source_files),
+        )
+        analysis = batch.analyses.get(request.source.file_path)
+        if analysis is not None:
+            return analysis
+    # The source is not in a batch, or its batch could not be analyzed.
+    return await Get(JavaSourceDependencyAnalysis, SourceFilesRequest([request.source]))
+
+
 class FirstPartyJavaTargetsMappingRequest(FirstPartyMappingRequest):
     pass
 
@@ -43,7 +112,10 @@ async def map_first_party_java_targets_to_symbols(
     jvm: JvmSubsystem,
 ) -> SymbolMap:
     source_analysis = await MultiGet(
-        Get(JavaSourceDependencyAnalysis, SourceFilesRequest([target[JavaSourceField]]))
+        Get(
+            JavaSourceDependencyAnalysis,
+            BatchedJavaSourceDependencyAnalysisRequest(target[JavaSourceField]),
+        )
         for target in java_targets
     )
     address_and_analysis = zip(
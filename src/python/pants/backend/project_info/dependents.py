@@ -1,20 +1,30 @@
 # Copyright 2020 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+import os
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Iterable, Set
+from typing import DefaultDict, Iterable, Set
 
+from pants.base.glob_match_error_behavior import GlobMatchErrorBehavior
+from pants.base.specs import DirLiteralSpec, RawSpecsWithoutFileOwners, RecursiveGlobSpec
 from pants.engine.addresses import Address, Addresses
 from pants.engine.collection import DeduplicatedCollection
 from pants.engine.console import Console
+from pants.engine.fs import PathGlobs, Paths
 from pants.engine.goal import Goal, GoalSubsystem, LineOriented
+from pants.engine.internals.build_files import BuildFileOptions
+from pants.engine.internals.synthetic_targets import (
+    SyntheticTargetsSpecPaths,
+    SyntheticTargetsSpecPathsRequest,
+)
 from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule, rule
 from pants.engine.target import (
-    AllUnexpandedTargets,
     AlwaysTraverseDeps,
     Dependencies,
     DependenciesRequest,
+    Targets,
+    UnexpandedTargets,
 )
 from pants.option.option_types import BoolOption
 from pants.util.frozendict import FrozenDict
@@ -27,8 +37,49 @@ class AddressToDependents:
     mapping: FrozenDict[Address, FrozenOrderedSet[Address]]
 
 
-@rule(desc="Map all targets to their dependents", level=LogLevel.DEBUG)
-async def map_addresses_to_dependents(all_targets: AllUnexpandedTargets) -> AddressToDependents:
+@dataclass(frozen=True)
+class _DirectoryDependentsRequest:
+    """The targets declared in a single directory (including the targets that they generate)."""
+
+    directory: str
+
+
+@dataclass(frozen=True)
+class _DirectoryDependents:
+    """The dependents within a single directory of each of their dependencies.
+
+    This is one "row" of `AddressToDependents`: because it is memoized per directory, and only
+    depends on the BUILD files which declare that directory's targets, an edit only causes the
+    rows of the directories whose targets changed to be recomputed.
+    """
+
+    mapping: FrozenDict[Address, tuple[Address, ...]]
+
+
+@rule(desc="Map targets in a directory to their dependencies", level=LogLevel.DEBUG)
+async def map_directory_addresses_to_dependents(
+    request: _DirectoryDependentsRequest,
+) -> _DirectoryDependents:
+    addresses = await Get(
+        Addresses,
+        RawSpecsWithoutFileOwners(
+            dir_literals=(DirLiteralSpec(request.directory),),
+            description_of_origin="the `dependents` rules",
+            unmatched_glob_behavior=GlobMatchErrorBehavior.ignore,
+        ),
+    )
+    # NB: The targets which reside in the directory may have been generated by a target in another
+    # directory, in which case they are part of that directory's row.
+    declared_addresses = Addresses(
+        address
+        for address in addresses
+        if address.spec_path == request.directory and not address.is_generated_target
+    )
+    unexpanded_targets, expanded_targets = await MultiGet(
+        Get(UnexpandedTargets, Addresses, declared_addresses),
+        Get(Targets, Addresses, declared_addresses),
+    )
+    targets = FrozenOrderedSet((*unexpanded_targets, *expanded_targets))
     dependencies_per_target = await MultiGet(
         Get(
             Addresses,
@@ -36,13 +87,48 @@ async def map_addresses_to_dependents(all_targets: AllUnexpandedTargets) -> Addr
                 tgt.get(Dependencies), should_traverse_deps_predicate=AlwaysTraverseDeps()
             ),
         )
-        for tgt in all_targets
+        for tgt in targets
     )
 
-    address_to_dependents = defaultdict(set)
-    for tgt, dependencies in zip(all_targets, dependencies_per_target):
+    address_to_dependents = defaultdict(list)
+    for tgt, dependencies in zip(targets, dependencies_per_target):
         for dependency in dependencies:
-            address_to_dependents[dependency].add(tgt.address)
+            address_to_dependents[dependency].append(tgt.address)
+    return _DirectoryDependents(
+        FrozenDict((addr, tuple(dependents)) for addr, dependents in address_to_dependents.items())
+    )
+
+
+@rule(desc="Map all targets to their dependents", level=LogLevel.DEBUG)
+async def map_addresses_to_dependents(build_file_options: BuildFileOptions) -> AddressToDependents:
+    # NB: Rather than depending on `AllUnexpandedTargets`, which is invalidated by an edit to any
+    # BUILD file, only the paths of the directories which may declare targets are requested here.
+    build_file_paths, synthetic_target_dirs = await MultiGet(
+        Get(
+            Paths,
+            PathGlobs(
+                globs=(
+                    *(os.path.join("**", p) for p in build_file_options.patterns),
+                    *(f"!{p}" for p in build_file_options.ignores),
+                )
+            ),
+        ),
+        Get(
+            SyntheticTargetsSpecPaths,
+            SyntheticTargetsSpecPathsRequest((RecursiveGlobSpec(""),)),
+        ),
+    )
+    directories = {os.path.dirname(path) for path in build_file_paths.files}
+    directories.update(synthetic_target_dirs)
+    directory_dependents = await MultiGet(
+        Get(_DirectoryDependents, _DirectoryDependentsRequest(directory))
+        for directory in sorted(directories)
+    )
+
+    address_to_dependents: DefaultDict[Address, Set[Address]] = defaultdict(set)
+    for row in directory_dependents:
+        for addr, dependents in row.mapping.items():
+            address_to_dependents[addr].update(dependents)
     return AddressToDependents(
         FrozenDict(
             {
@@ -75,22 +161,22 @@ class Dependents(DeduplicatedCollection[Address]):
 def find_dependents(
     request: DependentsRequest, address_to_dependents: AddressToDependents
 ) -> Dependents:
-    check = set(request.addresses)
-    known_dependents: Set[Address] = set()
-    while True:
-        dependents = set(known_dependents)
-        for target in check:
-            target_dependents = address_to_dependents.mapping.get(target, FrozenOrderedSet())
-            dependents.update(target_dependents)
-        check = dependents - known_dependents
-        if not check or not request.transitive:
-            result = (
-                dependents | set(request.addresses)
-                if request.include_roots
-                else dependents - set(request.addresses)
-            )
-            return Dependents(result)
-        known_dependents = dependents
+    # A breadth-first walk which only expands the newly discovered frontier in each round.
+    dependents: Set[Address] = set()
+    frontier: Iterable[Address] = request.addresses
+    while frontier:
+        new_dependents = {
+            dependent
+            for address in frontier
+            for dependent in address_to_dependents.mapping.get(address, ())
+            if dependent not in dependents
+        }
+        dependents.update(new_dependents)
+        frontier = new_dependents if request.transitive else ()
+
+    if request.include_roots:
+        return Dependents(dependents.union(request.addresses))
+    return Dependents(dependents.difference(request.addresses))
 
 
 class DependentsSubsystem(LineOriented, GoalSubsystem):
@@ -5,10 +5,16 @@ from typing import List
 
 import pytest
 
-from pants.backend.project_info.dependents import DependentsGoal
+from pants.backend.project_info.dependents import (
+    DependentsGoal,
+    _DirectoryDependents,
+    _DirectoryDependentsRequest,
+)
 from pants.backend.project_info.dependents import rules as dependent_rules
+from pants.engine.addresses import Address
 from pants.engine.target import Dependencies, SpecialCasedDependencies, Target
-from pants.testutil.rule_runner import RuleRunner
+from pants.testutil.rule_runner import QueryRule, RuleRunner
+from pants.util.frozendict import FrozenDict
 
 
 class SpecialDeps(SpecialCasedDependencies):
@@ -102,3 +108,24 @@ def test_special_cased_dependencies(rule_runner: RuleRunner) -> None:
         transitive=True,
         expected=["intermediate:intermediate", "leaf:leaf", "special:special"],
     )
+
+
+def test_directory_rows() -> None:
+    rule_runner = RuleRunner(
+        rules=[
+            *dependent_rules(),
+            QueryRule(_DirectoryDependents, [_DirectoryDependentsRequest]),
+        ],
+        target_types=[MockTarget],
+    )
+    rule_runner.write_files(
+        {
+            "base/BUILD": "tgt()",
+            "dir/BUILD": "tgt(name='a', dependencies=['base'])",
+            "dir/sub/BUILD": "tgt(name='b', dependencies=['base'])",
+        }
+    )
+    # Each row only contains the dependents declared in its own directory.
+    row = rule_runner.request(_DirectoryDependents, [_DirectoryDependentsRequest("dir")])
+    assert row.mapping == FrozenDict({Address("base"): (Address("dir", target_name="a"),)})
+    assert_dependents(rule_runner, targets=["base"], expected=["dir:a", "dir/sub:b"])
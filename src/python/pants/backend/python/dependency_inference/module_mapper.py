@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 import enum
 import itertools
 import logging
@@ -135,6 +136,12 @@ class FirstPartyPythonMappingImplMarker:
     """
 
 
+# The possible providers of a module, and of the symbols within it.
+_ModuleAndChildProviders = Tuple[
+    Tuple[PossibleModuleProvider, ...], Tuple[PossibleModuleProvider, ...]
+]
+
+
 @dataclass(frozen=True)
 class FirstPartyPythonModuleMapping:
     resolves_to_modules_to_providers: FrozenDict[
@@ -148,31 +155,24 @@ class FirstPartyPythonModuleMapping:
     implementations for each codegen backends.
     """
 
-    def _providers_for_resolve(
-        self, module: str, resolve: str
-    ) -> tuple[PossibleModuleProvider, ...]:
-        mapping = self.resolves_to_modules_to_providers.get(resolve)
-        if not mapping:
-            return ()
-
-        result = mapping.get(module, ())
-        if result:
-            return tuple(PossibleModuleProvider(provider, 0) for provider in result)
+    # The providers of each module in each resolve, as `PossibleModuleProvider`s for the module
+    # itself and for its child symbols. This is computed once, so that each lookup is a couple of
+    # dict lookups which return the same tuples.
+    _index: dict[str, dict[ResolveName, _ModuleAndChildProviders]] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
 
-        # If the module is not found, try the parent, if any. This is to handle `from` imports
-        # where the "module" we were handed was actually a symbol inside the module.
-        # E.g., with `from my_project.app import App`, we would be passed "my_project.app.App".
-        #
-        # We do not look past the direct parent, as this could cause multiple ambiguous owners to
-        # be resolved. This contrasts with the third-party module mapping, which will try every
-        # ancestor.
-        # TODO: Now that we capture the ancestry, we could look past the direct parent.
-        #  One reason to do so would be to unify more of the FirstParty and ThirdParty impls.
-        if "." not in module:
-            return ()
-        parent_module = module.rsplit(".", maxsplit=1)[0]
-        parent_providers = mapping.get(parent_module, ())
-        return tuple(PossibleModuleProvider(mp, 1) for mp in parent_providers)
+    def __post_init__(self) -> None:
+        index: DefaultDict[str, dict[ResolveName, _ModuleAndChildProviders]] = defaultdict(dict)
+        for resolve, modules_to_providers in self.resolves_to_modules_to_providers.items():
+            for module, providers in modules_to_providers.items():
+                if not providers:
+                    continue
+                index[module][resolve] = (
+                    tuple(PossibleModuleProvider(provider, 0) for provider in providers),
+                    tuple(PossibleModuleProvider(provider, 1) for provider in providers),
+                )
+        object.__setattr__(self, "_index", dict(index))
 
     def providers_for_module(
         self, module: str, resolve: str | None
@@ -182,14 +182,35 @@ class FirstPartyPythonModuleMapping:
         If `resolve` is None, will not consider resolves, i.e. any `python_source` et al can be
         used. Otherwise, providers can only come from first-party targets with the resolve.
         """
+        in_module = self._index.get(module, {})
+        # If the module is not found in a resolve, try the parent, if any. This is to handle `from`
+        # imports where the "module" we were handed was actually a symbol inside the module.
+        # E.g., with `from my_project.app import App`, we would be passed "my_project.app.App".
+        #
+        # We do not look past the direct parent, as this could cause multiple ambiguous owners to
+        # be resolved. This contrasts with the third-party module mapping, which will try every
+        # ancestor.
+        # TODO: Now that we capture the ancestry, we could look past the direct parent.
+        #  One reason to do so would be to unify more of the FirstParty and ThirdParty impls.
+        in_parent = self._index.get(module.rpartition(".")[0], {}) if "." in module else {}
+
         if resolve:
-            return self._providers_for_resolve(module, resolve)
-        return tuple(
-            itertools.chain.from_iterable(
-                self._providers_for_resolve(module, resolve)
-                for resolve in list(self.resolves_to_modules_to_providers.keys())
-            )
-        )
+            if resolve in in_module:
+                return in_module[resolve][0]
+            if resolve in in_parent:
+                return in_parent[resolve][1]
+            return ()
+
+        if len(in_module) == 1 and not in_parent:
+            ((providers, _),) = in_module.values()
+            return providers
+        result: list[PossibleModuleProvider] = []
+        for resolve in self.resolves_to_modules_to_providers:
+            if resolve in in_module:
+                result.extend(in_module[resolve][0])
+            elif resolve in in_parent:
+                result.extend(in_parent[resolve][1])
+        return tuple(result)
 
 
 @rule(level=LogLevel.DEBUG)
@@ -303,7 +324,7 @@ class ThirdPartyPythonModuleMapping:
         return tuple(
             itertools.chain.from_iterable(
                 self._providers_for_resolve(module, resolve)
-                for resolve in list(self.resolves_to_modules_to_providers.keys())
+                for resolve in self.resolves_to_modules_to_providers
             )
         )
 
@@ -146,6 +146,11 @@ def test_first_party_modules_mapping() -> None:
     assert_addresses("two_resolves", (root_provider0,), resolve="default")
     assert_addresses("two_resolves", (test_provider0,), resolve="another")
 
+    # Lookups return the providers computed when the mapping was created.
+    assert mapping.providers_for_module("util.strutil", resolve=None) is (
+        mapping.providers_for_module("util.strutil", resolve="default")
+    )
+
 
 def test_third_party_modules_mapping() -> None:
     colors_provider = ModuleProvider(Address("", target_name="ansicolors"), ModuleProviderType.IMPL)
@@ -5,28 +5,33 @@ from __future__ import annotations
 import json
 import logging
 import os
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Iterable
 
 from pants.backend.python.dependency_inference.subsystem import PythonInferSubsystem
-from pants.backend.python.target_types import PythonSourceField
+from pants.backend.python.subsystems.setup import PythonSetup
+from pants.backend.python.target_types import InterpreterConstraintsField, PythonSourceField
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
 from pants.backend.python.util_rules.pex_environment import PythonExecutable
 from pants.base.deprecated import warn_or_error
+from pants.base.specs import DirGlobSpec, RawSpecs
 from pants.core.util_rules.source_files import SourceFilesRequest
 from pants.core.util_rules.stripped_source_files import StrippedSourceFiles
+from pants.engine.addresses import Address
 from pants.engine.collection import DeduplicatedCollection
 from pants.engine.environment import EnvironmentName
-from pants.engine.fs import CreateDigest, Digest, FileContent, MergeDigests
+from pants.engine.fs import CreateDigest, Digest, DigestContents, FileContent, MergeDigests
 from pants.engine.internals.native_dep_inference import NativeParsedPythonDependencies
 from pants.engine.internals.native_engine import NativeDependenciesRequest
 from pants.engine.process import Process, ProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
+from pants.engine.target import Targets
 from pants.engine.unions import UnionMembership, UnionRule, union
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.resources import read_resource
-from pants.util.strutil import softwrap
+from pants.util.strutil import pluralize, softwrap
 
 logger = logging.getLogger(__name__)
 
@@ -173,16 +178,142 @@ async def general_parser_script(
     )
 
 
+@dataclass(frozen=True)
+class ParsePythonDependenciesBatchRequest:
+    """Parse the dependencies of many Python source files at once.
+
+    When a custom `PythonDependencyVisitor` is installed, this parses all of the files with a single
+    invocation of the parser script, rather than with one process per file. Dependency inference
+    requests the batch for the directory of each file: see `PythonDependencyParsingBatches`.
+    """
+
+    sources: tuple[PythonSourceField, ...]
+    interpreter_constraints: InterpreterConstraints
+
+
+class ParsedPythonDependenciesBatch(FrozenDict[Address, ParsedPythonDependencies]):
+    """The parsed dependencies of each source, keyed by the address of its target."""
+
+
+def _native_parsed_dependencies(
+    native_result: NativeParsedPythonDependencies, python_infer_subsystem: PythonInferSubsystem
+) -> ParsedPythonDependencies:
+    imports = dict(native_result.imports)
+    assets = set()
+
+    if python_infer_subsystem.string_imports or python_infer_subsystem.assets:
+        for string, line in native_result.string_candidates.items():
+            slash_count = string.count("/")
+            if (
+                python_infer_subsystem.string_imports
+                and not slash_count
+                and string.count(".") >= python_infer_subsystem.string_imports_min_dots
+            ):
+                imports.setdefault(string, (line, True))
+            if (
+                python_infer_subsystem.assets
+                and slash_count >= python_infer_subsystem.assets_min_slashes
+            ):
+                assets.add(string)
+
+    return ParsedPythonDependencies(
+        ParsedPythonImports(
+            (key, ParsedPythonImportInfo(*value)) for key, value in imports.items()
+        ),
+        ParsedPythonAssetPaths(sorted(assets)),
+    )
+
+
+def _uses_parser_script(
+    union_membership: UnionMembership, python_infer_subsystem: PythonInferSubsystem
+) -> bool:
+    has_custom_dep_inferences = len(union_membership[PythonDependencyVisitorRequest]) > 1
+    return not python_infer_subsystem.use_rust_parser or has_custom_dep_inferences
+
+
+# The maximum number of sources to parse with a single invocation of the parser script.
+_MAX_SOURCES_PER_PARSING_BATCH = 128
+
+
+@dataclass(frozen=True)
+class PythonDependencyParsingBatchesRequest:
+    """Partition the Python sources which reside in `directory` for parsing."""
+
+    directory: str
+
+
+@dataclass(frozen=True)
+class PythonDependencyParsingBatches:
+    """The sources of the Python targets in a directory, partitioned into batches which are each
+    parsed by a single invocation of the parser script.
+
+    Batches are only formed from the files in a single directory (with the same interpreter
+    constraints), so that editing a file or a BUILD file only invalidates that directory's batches.
+    """
+
+    batches: tuple[ParsePythonDependenciesBatchRequest, ...]
+    batch_for_address: FrozenDict[Address, int]
+
+
+@rule(desc="Partition Python sources for dependency parsing", level=LogLevel.DEBUG)
+async def partition_python_sources_for_parsing(
+    request: PythonDependencyParsingBatchesRequest, python_setup: PythonSetup
+) -> PythonDependencyParsingBatches:
+    candidate_targets = await Get(
+        Targets,
+        RawSpecs(
+            dir_globs=(DirGlobSpec(request.directory),),
+            description_of_origin="the Python dependency parsing rules",
+        ),
+    )
+    constraints_by_field_value: dict[tuple[str, ...] | None, InterpreterConstraints] = {}
+    grouped: dict[InterpreterConstraints, list[PythonSourceField]] = defaultdict(list)
+    for tgt in candidate_targets:
+        if not tgt.has_fields((PythonSourceField, InterpreterConstraintsField)):
+            continue
+        source = tgt[PythonSourceField]
+        if os.path.dirname(source.file_path) != request.directory:
+            continue
+        ic_field = tgt[InterpreterConstraintsField]
+        constraints = constraints_by_field_value.get(ic_field.value)
+        if constraints is None:
+            constraints = InterpreterConstraints.create_from_compatibility_fields(
+                [ic_field], python_setup
+            )
+            constraints_by_field_value[ic_field.value] = constraints
+        grouped[constraints].append(source)
+
+    batches = [
+        ParsePythonDependenciesBatchRequest(
+            tuple(sources[i : i + _MAX_SOURCES_PER_PARSING_BATCH]), constraints
+        )
+        for constraints, sources in sorted(grouped.items(), key=lambda item: str(item[0]))
+        for i in range(0, len(sources), _MAX_SOURCES_PER_PARSING_BATCH)
+    ]
+    return PythonDependencyParsingBatches(
+        tuple(batches),
+        FrozenDict(
+            (source.address, index)
+            for index, batch in enumerate(batches)
+            for source in batch.sources
+        ),
+    )
+
+
 @rule(level=LogLevel.DEBUG)
-async def parse_python_dependencies(
-    request: ParsePythonDependenciesRequest,
+async def parse_python_dependencies_batch(
+    request: ParsePythonDependenciesBatchRequest,
     parser_script: ParserScript,
     union_membership: UnionMembership,
     python_infer_subsystem: PythonInferSubsystem,
-) -> ParsedPythonDependencies:
-    stripped_sources = await Get(StrippedSourceFiles, SourceFilesRequest([request.source]))
-    # We operate on PythonSourceField, which should be one file.
-    assert len(stripped_sources.snapshot.files) == 1
+) -> ParsedPythonDependenciesBatch:
+    # NB: Each source is stripped individually (rather than all at once) so that the stripped file
+    # can be attributed to its source, and so that the results are memoized per source.
+    all_stripped_sources = await MultiGet(
+        Get(StrippedSourceFiles, SourceFilesRequest([source])) for source in request.sources
+    )
+    # We operate on PythonSourceFields, which should each be one file.
+    assert all(len(stripped.snapshot.files) == 1 for stripped in all_stripped_sources)
 
     if not python_infer_subsystem.options.is_default("use_rust_parser"):
         # NB: In 2.19, we remove the option altogether and remove the old code.
@@ -192,69 +323,123 @@ async def parse_python_dependencies(
             hint="Read the help for [python-infer].use_rust_parser, then stop setting the value in pants.toml.",
         )
 
-    has_custom_dep_inferences = len(union_membership[PythonDependencyVisitorRequest]) > 1
-    if python_infer_subsystem.use_rust_parser and not has_custom_dep_inferences:
-        native_result = await Get(
-            NativeParsedPythonDependencies,
-            NativeDependenciesRequest(stripped_sources.snapshot.digest),
+    if not _uses_parser_script(union_membership, python_infer_subsystem):
+        native_results = await MultiGet(
+            Get(NativeParsedPythonDependencies, NativeDependenciesRequest(stripped.snapshot.digest))
+            for stripped in all_stripped_sources
         )
-        imports = dict(native_result.imports)
-        assets = set()
-
-        if python_infer_subsystem.string_imports or python_infer_subsystem.assets:
-            for string, line in native_result.string_candidates.items():
-                slash_count = string.count("/")
-                if (
-                    python_infer_subsystem.string_imports
-                    and not slash_count
-                    and string.count(".") >= python_infer_subsystem.string_imports_min_dots
-                ):
-                    imports.setdefault(string, (line, True))
-                if (
-                    python_infer_subsystem.assets
-                    and slash_count >= python_infer_subsystem.assets_min_slashes
-                ):
-                    assets.add(string)
-
-        return ParsedPythonDependencies(
-            ParsedPythonImports(
-                (key, ParsedPythonImportInfo(*value)) for key, value in imports.items()
-            ),
-            ParsedPythonAssetPaths(sorted(assets)),
+        return ParsedPythonDependenciesBatch(
+            (source.address, _native_parsed_dependencies(native_result, python_infer_subsystem))
+            for source, native_result in zip(request.sources, native_results)
         )
 
-    file = stripped_sources.snapshot.files[0]
+    # Sources from different source roots may strip to the same path, so split the sources into
+    # as few chunks without colliding paths as possible, and run the parser script once per chunk.
+    chunks: list[dict[str, tuple[PythonSourceField, StrippedSourceFiles]]] = []
+    for source, stripped in zip(request.sources, all_stripped_sources):
+        file = stripped.snapshot.files[0]
+        for chunk in chunks:
+            if file not in chunk:
+                chunk[file] = (source, stripped)
+                break
+        else:
+            chunks.append({file: (source, stripped)})
+
+    python_interpreter = await Get(
+        PythonExecutable, InterpreterConstraints, request.interpreter_constraints
+    )
+    input_digests = await MultiGet(
+        Get(
+            Digest,
+            MergeDigests(
+                [
+                    parser_script.digest,
+                    *(stripped.snapshot.digest for _, stripped in chunk.values()),
+                ]
+            ),
+        )
+        for chunk in chunks
+    )
 
-    python_interpreter, input_digest = await MultiGet(
-        Get(PythonExecutable, InterpreterConstraints, request.interpreter_constraints),
-        Get(Digest, MergeDigests([parser_script.digest, stripped_sources.snapshot.digest])),
+    def description(chunk: dict[str, tuple[PythonSourceField, StrippedSourceFiles]]) -> str:
+        if len(chunk) == 1:
+            ((source, _),) = chunk.values()
+            return f"Determine Python dependencies for {source.address}"
+        return f"Determine Python dependencies for {pluralize(len(chunk), 'file')}"
+
+    output_path = "__parsed_dependencies.json"
+    process_results = await MultiGet(
+        Get(
+            ProcessResult,
+            Process(
+                argv=[
+                    python_interpreter.path,
+                    "pants/backend/python/dependency_inference/scripts/main.py",
+                    f"--output={output_path}",
+                    *chunk,
+                ],
+                input_digest=input_digest,
+                output_files=(output_path,),
+                append_only_caches=python_interpreter.append_only_caches,
+                description=description(chunk),
+                env=parser_script.env,
+                level=LogLevel.DEBUG,
+            ),
+        )
+        for chunk, input_digest in zip(chunks, input_digests)
     )
-    process_result = await Get(
-        ProcessResult,
-        Process(
-            argv=[
-                python_interpreter.path,
-                "pants/backend/python/dependency_inference/scripts/main.py",
-                file,
-            ],
-            input_digest=input_digest,
-            append_only_caches=python_interpreter.append_only_caches,
-            description=f"Determine Python dependencies for {request.source.address}",
-            env=parser_script.env,
-            level=LogLevel.DEBUG,
-        ),
+    all_output_contents = await MultiGet(
+        Get(DigestContents, Digest, process_result.output_digest)
+        for process_result in process_results
     )
-    # See in script for where we explicitly encoded as utf8. Even though utf8 is the
-    # default for decode(), we make that explicit here for emphasis.
-    process_output = process_result.stdout.decode("utf8") or "{}"
-    output = json.loads(process_output)
 
-    return ParsedPythonDependencies(
-        imports=ParsedPythonImports(
-            (key, ParsedPythonImportInfo(**val)) for key, val in output.get("imports", {}).items()
-        ),
-        assets=ParsedPythonAssetPaths(output.get("assets", [])),
+    result = {}
+    for chunk, output_contents in zip(chunks, all_output_contents):
+        # See in script for where we explicitly encoded as utf8. Even though utf8 is the
+        # default for decode(), we make that explicit here for emphasis.
+        outputs = json.loads(output_contents[0].content.decode("utf8"))
+        for file, (source, _) in chunk.items():
+            output = outputs[file]
+            result[source.address] = ParsedPythonDependencies(
+                imports=ParsedPythonImports(
+                    (key, ParsedPythonImportInfo(**val))
+                    for key, val in output.get("imports", {}).items()
+                ),
+                assets=ParsedPythonAssetPaths(output.get("assets", [])),
+            )
+    return ParsedPythonDependenciesBatch(result)
+
+
+@rule
+async def parse_python_dependencies(
+    request: ParsePythonDependenciesRequest,
+    union_membership: UnionMembership,
+    python_infer_subsystem: PythonInferSubsystem,
+) -> ParsedPythonDependencies:
+    batch_request = ParsePythonDependenciesBatchRequest(
+        (request.source,), request.interpreter_constraints
+    )
+    # Since the parser script costs a process per batch, each source is parsed along with the
+    # other sources in its directory. The identical requests for those sources are memoized, and
+    # only the targets of that directory are consulted, so an edit elsewhere invalidates nothing.
+    if _uses_parser_script(union_membership, python_infer_subsystem):
+        batches = await Get(
+            PythonDependencyParsingBatches,
+            PythonDependencyParsingBatchesRequest(os.path.dirname(request.source.file_path)),
+        )
+        index = batches.batch_for_address.get(request.source.address)
+        if index is not None:
+            candidate = batches.batches[index]
+            if (
+                candidate.interpreter_constraints == request.interpreter_constraints
+                and request.source in candidate.sources
+            ):
+                batch_request = candidate
+
+    batch = await Get(
+        ParsedPythonDependenciesBatch, ParsePythonDependenciesBatchRequest, batch_request
     )
+    return batch[request.source.address]
 
 
 def rules():
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from textwrap import dedent
 
 import pytest
@@ -10,24 +11,34 @@ import pytest
 from pants.backend.python.dependency_inference import parse_python_dependencies
 from pants.backend.python.dependency_inference.parse_python_dependencies import (
     ParsedPythonDependencies,
+    ParsedPythonDependenciesBatch,
 )
 from pants.backend.python.dependency_inference.parse_python_dependencies import (
     ParsedPythonImportInfo as ImpInfo,
 )
 from pants.backend.python.dependency_inference.parse_python_dependencies import (
+    ParsePythonDependenciesBatchRequest,
     ParsePythonDependenciesRequest,
+    PythonDependencyParsingBatches,
+    PythonDependencyParsingBatchesRequest,
+    PythonDependencyVisitor,
+    PythonDependencyVisitorRequest,
 )
 from pants.backend.python.target_types import PythonSourceField, PythonSourceTarget
 from pants.backend.python.util_rules import pex
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
 from pants.core.util_rules import stripped_source_files
 from pants.engine.addresses import Address
+from pants.engine.fs import CreateDigest, Digest, FileContent
+from pants.engine.rules import Get, rule
+from pants.engine.unions import UnionRule
 from pants.testutil.python_interpreter_selection import (
     skip_unless_python27_present,
     skip_unless_python38_present,
     skip_unless_python39_present,
 )
 from pants.testutil.rule_runner import QueryRule, RuleRunner
+from pants.util.frozendict import FrozenDict
 
 
 @pytest.fixture
@@ -38,6 +49,7 @@ def rule_runner() -> RuleRunner:
             *stripped_source_files.rules(),
             *pex.rules(),
             QueryRule(ParsedPythonDependencies, [ParsePythonDependenciesRequest]),
+            QueryRule(ParsedPythonDependenciesBatch, [ParsePythonDependenciesBatchRequest]),
         ],
         target_types=[PythonSourceTarget],
     )
@@ -599,3 +611,126 @@ def test_assets(rule_runner: RuleRunner, min_slashes: int) -> None:
         rule_runner, content, expected_assets=expected, assets_min_slashes=min_slashes
     )
     assert_deps_parsed(rule_runner, content, assets=False, expected_assets=[])
+
+
+@pytest.mark.parametrize("use_rust_parser", [True, False])
+def test_batch(rule_runner: RuleRunner, use_rust_parser: bool) -> None:
+    rule_runner.set_options(
+        [f"--python-infer-use-rust-parser={use_rust_parser}"],
+        env_inherit={"PATH", "PYENV_ROOT", "HOME"},
+    )
+    # NB: Both files strip to `project/f.py`, so must be parsed separately by the script.
+    rule_runner.write_files(
+        {
+            "src/python/project/f.py": "import os",
+            "src/python/project/BUILD": "python_source(name='t', source='f.py')",
+            "src/project/f.py": "import sys",
+            "src/project/BUILD": "python_source(name='t', source='f.py')",
+            "project/g.py": "import json\nimport demo.data",
+            "project/BUILD": "python_source(name='t', source='g.py')",
+        }
+    )
+    addresses = [
+        Address("src/python/project", target_name="t"),
+        Address("src/project", target_name="t"),
+        Address("project", target_name="t"),
+    ]
+    result = rule_runner.request(
+        ParsedPythonDependenciesBatch,
+        [
+            ParsePythonDependenciesBatchRequest(
+                tuple(rule_runner.get_target(addr)[PythonSourceField] for addr in addresses),
+                InterpreterConstraints([">=3.6"]),
+            )
+        ],
+    )
+    assert {addr: dict(parsed.imports) for addr, parsed in result.items()} == {
+        addresses[0]: {"os": ImpInfo(lineno=1, weak=False)},
+        addresses[1]: {"sys": ImpInfo(lineno=1, weak=False)},
+        addresses[2]: {
+            "json": ImpInfo(lineno=1, weak=False),
+            "demo.data": ImpInfo(lineno=2, weak=False),
+        },
+    }
+
+
+@dataclass(frozen=True)
+class NoisyDependencyVisitorRequest(PythonDependencyVisitorRequest):
+    pass
+
+
+@rule
+async def noisy_dependency_visitor(_: NoisyDependencyVisitorRequest) -> PythonDependencyVisitor:
+    visitor = dedent(
+        """\
+        from pants.backend.python.dependency_inference.scripts.dependency_visitor_base import (
+            DependencyVisitorBase,
+        )
+
+        class NoisyVisitor(DependencyVisitorBase):
+            def visit_Module(self, node):
+                print("Not the parser's output.")
+                self.generic_visit(node)
+        """
+    )
+    digest = await Get(Digest, CreateDigest([FileContent("noisy_visitor.py", visitor.encode())]))
+    return PythonDependencyVisitor(
+        digest=digest, classname="noisy_visitor.NoisyVisitor", env=FrozenDict()
+    )
+
+
+def test_batches_with_custom_visitor() -> None:
+    rule_runner = RuleRunner(
+        rules=[
+            *parse_python_dependencies.rules(),
+            *stripped_source_files.rules(),
+            *pex.rules(),
+            noisy_dependency_visitor,
+            UnionRule(PythonDependencyVisitorRequest, NoisyDependencyVisitorRequest),
+            QueryRule(ParsedPythonDependencies, [ParsePythonDependenciesRequest]),
+            QueryRule(PythonDependencyParsingBatches, [PythonDependencyParsingBatchesRequest]),
+        ],
+        target_types=[PythonSourceTarget],
+    )
+    rule_runner.set_options([], env_inherit={"PATH", "PYENV_ROOT", "HOME"})
+    rule_runner.write_files(
+        {
+            "project/f.py": "import os",
+            "project/g.py": "import json",
+            "project/BUILD": "python_source(name='f', source='f.py')\n"
+            + "python_source(name='g', source='g.py')",
+            "other/h.py": "import sys",
+            "other/BUILD": "python_source(name='h', source='h.py')",
+        }
+    )
+
+    # Sources are batched by directory, and only the targets of that directory are consulted.
+    batches = {
+        directory: rule_runner.request(
+            PythonDependencyParsingBatches, [PythonDependencyParsingBatchesRequest(directory)]
+        )
+        for directory in ("project", "other")
+    }
+    assert {
+        directory: [sorted(str(s.address) for s in batch.sources) for batch in b.batches]
+        for directory, b in batches.items()
+    } == {"project": [["project:f", "project:g"]], "other": [["other:h"]]}
+
+    # Each source is parsed with its batch, and the results are attributed by path, regardless of
+    # what the visitors print.
+    for address, expected_import in [
+        (Address("project", target_name="f"), "os"),
+        (Address("project", target_name="g"), "json"),
+        (Address("other", target_name="h"), "sys"),
+    ]:
+        (batch,) = batches[address.spec_path].batches
+        result = rule_runner.request(
+            ParsedPythonDependencies,
+            [
+                ParsePythonDependenciesRequest(
+                    rule_runner.get_target(address)[PythonSourceField],
+                    batch.interpreter_constraints,
+                )
+            ],
+        )
+        assert dict(result.imports) == {expected_import: ImpInfo(lineno=1, weak=False)}
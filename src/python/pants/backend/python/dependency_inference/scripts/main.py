@@ -6,7 +6,8 @@
 # NB: An easy way to debug this is to just invoke it on a file.
 #   E.g.
 #   $ PYTHONPATH=src/python STRING_IMPORTS=y python \
-#     src/python/pants/backend/python/dependency_inference/scripts/main.py FILE
+#     src/python/pants/backend/python/dependency_inference/scripts/main.py FILE [FILE ...]
+#   Pass `--output=PATH` as the first argument to write the results to PATH rather than stdout.
 #   Or
 #   $ ./pants --no-python-infer-imports run \
 #     src/python/pants/backend/python/dependency_inference/scripts/main.py -- FILE
@@ -25,33 +26,22 @@ from pants.backend.python.dependency_inference.scripts.dependency_visitor_base i
 )
 
 
-def main(filename):
+def parse_file(filename, visitor_classes):
     with open(filename, "rb") as f:
         content = f.read()
     try:
         tree = ast.parse(content, filename=filename)
     except SyntaxError:
-        return
+        return {}
 
     package_parts = os.path.dirname(filename).split(os.path.sep)
-    visitor_classnames = os.environ.get(
-        "VISITOR_CLASSNAMES",
-        "pants.backend.python.dependency_inference.scripts.general_dependency_visitor.GeneralDependencyVisitor",
-    ).split("|")
-    visitors = []
     found_dependencies = FoundDependencies()
-    for visitor_classname in visitor_classnames:
-        module_name, _, class_name = visitor_classname.rpartition(".")
-        module = importlib.import_module(module_name)
-        visitor_cls = getattr(module, class_name)
-        visitors.append(visitor_cls(found_dependencies, package_parts, content))
+    visitors = [
+        visitor_cls(found_dependencies, package_parts, content) for visitor_cls in visitor_classes
+    ]
     for visitor in visitors:
         visitor.visit(tree)
 
-    # We have to be careful to set the encoding explicitly and write raw bytes ourselves.
-    # See below for where we explicitly decode.
-    buffer = sys.stdout if sys.version_info[0:2] == (2, 7) else sys.stdout.buffer
-
     # N.B. Start with weak and `update` with definitive so definite "wins"
     imports_result = {
         module_name: {"lineno": lineno, "weak": True}
@@ -64,15 +54,42 @@ def main(filename):
         }
     )
 
-    buffer.write(
-        json.dumps(
-            {
-                "imports": imports_result,
-                "assets": sorted(found_dependencies.assets),
-            }
-        ).encode("utf8")
-    )
+    return {
+        "imports": imports_result,
+        "assets": sorted(found_dependencies.assets),
+    }
+
+
+def main(args):
+    output_path = None
+    if args and args[0].startswith("--output="):
+        output_path = args[0][len("--output=") :]
+        args = args[1:]
+
+    visitor_classnames = os.environ.get(
+        "VISITOR_CLASSNAMES",
+        "pants.backend.python.dependency_inference.scripts.general_dependency_visitor.GeneralDependencyVisitor",
+    ).split("|")
+    visitor_classes = []
+    for visitor_classname in visitor_classnames:
+        module_name, _, class_name = visitor_classname.rpartition(".")
+        module = importlib.import_module(module_name)
+        visitor_classes.append(getattr(module, class_name))
+
+    # The results are keyed by filename, and written to a file (when given) so that anything which
+    # a visitor prints cannot be mistaken for them.
+    result = json.dumps({filename: parse_file(filename, visitor_classes) for filename in args})
+
+    # We have to be careful to set the encoding explicitly and write raw bytes ourselves.
+    # See the rule for where we explicitly decode.
+    if output_path:
+        with open(output_path, "wb") as f:
+            f.write(result.encode("utf8"))
+    else:
+        buffer = sys.stdout if sys.version_info[0:2] == (2, 7) else sys.stdout.buffer
+        buffer.write(result.encode("utf8"))
+        buffer.write(b"\n")
 
 
 if __name__ == "__main__":
-    main(sys.argv[1])
+    main(sys.argv[1:])
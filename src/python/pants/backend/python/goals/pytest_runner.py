@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 import logging
 import re
 from abc import ABC, abstractmethod
@@ -175,6 +176,9 @@ class TestMetadata:
     resolve: str
     environment: str
     compatability_tag: str | None = None
+    # If set, the addresses whose requirements are installed in the pytest runner for every batch
+    # of the partition (see `[pytest].share_runner_across_batches`), rather than only the batch's.
+    requirements_addresses: tuple[Address, ...] | None = None
 
     # Prevent this class from being detected by pytest as a test class.
     __test__ = False
@@ -259,7 +263,9 @@ async def setup_pytest_for_target(
 
     interpreter_constraints = request.metadata.interpreter_constraints
 
-    requirements_pex_get = Get(Pex, RequirementsPexRequest(addresses))
+    requirements_pex_get = Get(
+        Pex, RequirementsPexRequest(request.metadata.requirements_addresses or addresses)
+    )
     pytest_pex_get = Get(
         Pex, PexRequest, pytest.to_pex_request(interpreter_constraints=interpreter_constraints)
     )
@@ -466,6 +472,7 @@ class PyTestRequest(TestRequest):
 async def partition_python_tests(
     request: PyTestRequest.PartitionRequest[PythonTestFieldSet],
     python_setup: PythonSetup,
+    pytest: PyTest,
 ) -> Partitions[PythonTestFieldSet, TestMetadata]:
     partitions = []
     compatible_tests = defaultdict(list)
@@ -490,6 +497,11 @@ async def partition_python_tests(
             compatible_tests[metadata].append(field_set)
 
     for metadata, field_sets in compatible_tests.items():
+        if pytest.share_runner_across_batches:
+            metadata = dataclasses.replace(
+                metadata,
+                requirements_addresses=tuple(field_set.address for field_set in field_sets),
+            )
         partitions.append(Partition(tuple(field_sets), metadata))
 
     return Partitions(partitions)
@@ -924,6 +924,45 @@ def test_partition(
     assert sorted_partitions == expected_partitions
 
 
+def test_partition_share_runner_across_batches(rule_runner: PythonRuleRunner) -> None:
+    _configure_pytest_runner(rule_runner, extra_args=["--pytest-share-runner-across-batches"])
+    rule_runner.write_files(
+        {
+            f"{PACKAGE}/test_1.py": GOOD_TEST,
+            f"{PACKAGE}/test_2.py": GOOD_TEST,
+            f"{PACKAGE}/test_3.py": GOOD_TEST,
+            f"{PACKAGE}/BUILD": dedent(
+                """\
+                python_tests(
+                    batch_compatibility_tag='default',
+                    overrides={'test_3.py': {'batch_compatibility_tag': None}},
+                )
+                """
+            ),
+        }
+    )
+    field_sets = tuple(
+        PythonTestFieldSet.create(rule_runner.get_target(Address(PACKAGE, relative_file_path=path)))
+        for path in ("test_1.py", "test_2.py", "test_3.py")
+    )
+
+    partitions = rule_runner.request(
+        Partitions[PythonTestFieldSet, TestMetadata], [PyTestRequest.PartitionRequest(field_sets)]
+    )
+    requirements_addresses = {
+        partition.elements[0].address.spec: partition.metadata.requirements_addresses
+        for partition in partitions
+    }
+    assert requirements_addresses == {
+        f"{PACKAGE}/test_1.py": (
+            Address(PACKAGE, relative_file_path="test_1.py"),
+            Address(PACKAGE, relative_file_path="test_2.py"),
+        ),
+        # Tests without a compatibility tag are never batched, so have nothing to share.
+        f"{PACKAGE}/test_3.py": None,
+    }
+
+
 @pytest.mark.platform_specific_behavior
 @pytest.mark.parametrize(
     "major_minor_interpreter",
@@ -129,6 +129,28 @@ class PyTest(PythonToolBase):
             """
         ),
     )
+    share_runner_across_batches = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            If true, every batch of tests in a partition (i.e. tests which share a
+            `batch_compatibility_tag`, resolve and interpreter constraints) will run in the same
+            pytest runner venv, which contains the requirements of all of the tests in the
+            partition, rather than only those of the tests in the batch.
+
+            This means that the runner venv is built and warmed once per partition, rather than
+            once per batch, which can significantly speed up test suites with many batches and
+            large sets of requirements. The tradeoffs are that adding a requirement to any test in
+            the partition invalidates the cached results of every batch in it, and that every
+            batch sees the requirements of the whole partition. In particular, pytest
+            automatically loads plugins from any installed distribution which declares a
+            `pytest11` entry point, so a pytest plugin which is a requirement of one test in the
+            partition will be active for every batch in it. If that is a problem, give the tests
+            which depend on such plugins a different `batch_compatibility_tag`.
+            """
+        ),
+    )
 
     skip = SkipOption("test")
 
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import dataclasses
+import hashlib
 import json
 import logging
 import os
@@ -57,7 +58,18 @@ from pants.engine.addresses import Addresses, UnparsedAddressInputs
 from pants.engine.collection import Collection, DeduplicatedCollection
 from pants.engine.engine_aware import EngineAwareParameter
 from pants.engine.environment import EnvironmentName
-from pants.engine.fs import EMPTY_DIGEST, AddPrefix, CreateDigest, Digest, FileContent, MergeDigests
+from pants.engine.fs import (
+    EMPTY_DIGEST,
+    AddPrefix,
+    CreateDigest,
+    Digest,
+    DigestContents,
+    DigestSubset,
+    FileContent,
+    MergeDigests,
+    PathGlobs,
+    RemovePrefix,
+)
 from pants.engine.internals.native_engine import Snapshot
 from pants.engine.internals.selectors import MultiGet
 from pants.engine.process import Process, ProcessCacheScope, ProcessResult
@@ -795,8 +807,105 @@ async def _build_pex_description(
     return f"Building {request.output_filename} {desc_suffix}"
 
 
+def _can_subset_repository_pex_natively(request: PexRequest) -> bool:
+    """Whether the request is for nothing more than a subset of a (PACKED) repository PEX."""
+    return (
+        isinstance(request.requirements, PexRequirements)
+        and isinstance(request.requirements.from_superset, Pex)
+        and request.internal_only
+        and request.layout == PexLayout.PACKED
+        and request.python is None
+        and not request.platforms
+        and not request.complete_platforms
+        and request.sources in (None, EMPTY_DIGEST)
+        and request.additional_inputs == EMPTY_DIGEST
+        and request.main is None
+        and not request.inject_args
+        and not request.inject_env
+        and not request.additional_args
+        and not request.pex_path
+    )
+
+
+async def _subset_repository_pex_natively(request: PexRequest) -> Pex | None:
+    """Assemble a subset of a repository PEX by rewriting the requirements in its PEX-INFO.
+
+    The PEX runtime only activates the distributions that are needed to satisfy the requirements
+    in PEX-INFO, so the subset can share all of the repository PEX's distributions.
+
+    Returns None if the repository PEX was built for different interpreter constraints than the
+    request (or for a different interpreter than they select), in which case `pex` must be used.
+    """
+    assert isinstance(request.requirements, PexRequirements)
+    repository_pex = request.requirements.from_superset
+    assert isinstance(repository_pex, Pex)
+
+    pex_info_path = os.path.join(repository_pex.name, "PEX-INFO")
+    pex_info_contents = await Get(
+        DigestContents, DigestSubset(repository_pex.digest, PathGlobs([pex_info_path]))
+    )
+    pex_info = json.loads(pex_info_contents[0].content)
+
+    # NB: Internal only PEXes are built for a specific interpreter (via `--python`) rather than
+    # for interpreter constraints, in which case we compare the interpreter the request selects.
+    repository_interpreter_constraints = InterpreterConstraints(
+        pex_info.get("interpreter_constraints", ())
+    )
+    if repository_interpreter_constraints:
+        if repository_interpreter_constraints != request.interpreter_constraints:
+            return None
+    elif request.interpreter_constraints:
+        python = await Get(
+            PythonExecutable, InterpreterConstraints, request.interpreter_constraints
+        )
+        if python != repository_pex.python:
+            return None
+
+    req_strings, repository_pex_digest = await MultiGet(
+        Get(ReqStrings, PexRequirements, request.requirements),
+        Get(
+            Digest,
+            DigestSubset(
+                repository_pex.digest, PathGlobs([f"{repository_pex.name}/**", f"!{pex_info_path}"])
+            ),
+        ),
+    )
+
+    pex_info["requirements"] = sorted(req_strings.req_strings)
+    # The venv that a PEX runs in is keyed by its hash, so each subset must have its own.
+    pex_info["pex_hash"] = hashlib.sha1(
+        "\n".join([pex_info.get("pex_hash") or "", *pex_info["requirements"]]).encode()
+    ).hexdigest()
+
+    distributions_digest = await Get(
+        Digest, RemovePrefix(repository_pex_digest, repository_pex.name)
+    )
+    distributions_digest, pex_info_digest = await MultiGet(
+        Get(Digest, AddPrefix(distributions_digest, request.output_filename)),
+        Get(
+            Digest,
+            CreateDigest(
+                [
+                    FileContent(
+                        os.path.join(request.output_filename, "PEX-INFO"),
+                        json.dumps(pex_info).encode(),
+                    )
+                ]
+            ),
+        ),
+    )
+    digest = await Get(Digest, MergeDigests([distributions_digest, pex_info_digest]))
+    return Pex(digest=digest, name=request.output_filename, python=repository_pex.python)
+
+
 @rule
-async def create_pex(request: PexRequest) -> Pex:
+async def create_pex(request: PexRequest, pex_subsystem: PexSubsystem) -> Pex:
+    if pex_subsystem.subset_repository_pex_natively and _can_subset_repository_pex_natively(
+        request
+    ):
+        pex = await _subset_repository_pex_natively(request)
+        if pex is not None:
+            return pex
     result = await Get(BuildPexResult, PexRequest, request)
     return result.create_pex()
 
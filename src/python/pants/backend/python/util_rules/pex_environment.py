@@ -82,6 +82,23 @@ class PexSubsystem(Subsystem):
         ),
         advanced=True,
     )
+    subset_repository_pex_natively = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            When extracting a subset of requirements from a repository PEX (which is used with
+            `[python].resolve_all_constraints` and with non-PEX-native lockfiles), assemble the
+            subset PEX directly from the repository PEX's contents, rather than by running Pex.
+
+            The subset shares all of the repository PEX's distributions, and is restricted to
+            the requested requirements (and their transitive dependencies) when it is run. This
+            makes subsetting nearly free, at the cost of any errors about requirements that are
+            missing from the repository PEX being reported when the PEX is run, rather than when
+            it is built.
+            """
+        ),
+        advanced=True,
+    )
 
     @property
     def verbosity(self) -> int:
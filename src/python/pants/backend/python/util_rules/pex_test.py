@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import json
 import os.path
 import re
 import shutil
@@ -20,7 +21,7 @@ from pants.backend.python.goals import lockfile
 from pants.backend.python.goals.lockfile import GeneratePythonLockfile
 from pants.backend.python.pip_requirement import PipRequirement
 from pants.backend.python.subsystems.setup import PythonSetup
-from pants.backend.python.target_types import EntryPoint
+from pants.backend.python.target_types import EntryPoint, PexLayout
 from pants.backend.python.util_rules import pex_test_utils
 from pants.backend.python.util_rules.interpreter_constraints import InterpreterConstraints
 from pants.backend.python.util_rules.lockfile_metadata import PythonLockfileMetadata
@@ -54,8 +55,10 @@ from pants.backend.python.util_rules.pex_requirements import (
     ResolvePexConfigRequest,
 )
 from pants.backend.python.util_rules.pex_test_utils import (
+    PexData,
     create_pex_and_get_all_data,
     create_pex_and_get_pex_info,
+    get_all_data,
     parse_requirements,
 )
 from pants.core.goals.generate_lockfiles import GenerateLockfileResult
@@ -805,6 +808,112 @@ def test_setup_pex_requirements() -> None:
     )
 
 
+def test_subset_repository_pex_natively(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(
+        ["--pex-subset-repository-pex-natively"], env_inherit=PYTHON_BOOTSTRAP_ENV
+    )
+    repository_pex_info = {"pex_hash": "abc123", "requirements": ["req1", "req2"]}
+    repository_pex_digest = rule_runner.request(
+        Digest,
+        [
+            CreateDigest(
+                [
+                    FileContent("repo.pex/PEX-INFO", json.dumps(repository_pex_info).encode()),
+                    FileContent("repo.pex/.deps/req1-1.0-py3-none-any.whl/req1.py", b""),
+                ]
+            )
+        ],
+    )
+    pex = rule_runner.request(
+        Pex,
+        [
+            PexRequest(
+                output_filename="requirements.pex",
+                internal_only=True,
+                requirements=PexRequirements(
+                    ["req1"],
+                    from_superset=Pex(digest=repository_pex_digest, name="repo.pex", python=None),
+                ),
+            )
+        ],
+    )
+    assert pex.name == "requirements.pex"
+    contents = {
+        fc.path: fc.content for fc in rule_runner.request(DigestContents, [pex.digest])
+    }
+    assert set(contents) == {
+        "requirements.pex/PEX-INFO",
+        "requirements.pex/.deps/req1-1.0-py3-none-any.whl/req1.py",
+    }
+    pex_info = json.loads(contents["requirements.pex/PEX-INFO"])
+    assert pex_info["requirements"] == ["req1"]
+    assert pex_info["pex_hash"] != repository_pex_info["pex_hash"]
+
+
+def test_subset_real_repository_pex_natively(rule_runner: RuleRunner) -> None:
+    rule_runner.set_options(
+        ["--pex-subset-repository-pex-natively"], env_inherit=PYTHON_BOOTSTRAP_ENV
+    )
+    interpreter_constraints = InterpreterConstraints([">=3.7"])
+    repository_pex = rule_runner.request(
+        Pex,
+        [
+            PexRequest(
+                output_filename="repository.pex",
+                internal_only=False,
+                layout=PexLayout.PACKED,
+                interpreter_constraints=interpreter_constraints,
+                requirements=PexRequirements(["six==1.12.0", "jsonschema==2.6.0"]),
+            )
+        ],
+    )
+
+    def subset(interpreter_constraints: InterpreterConstraints) -> PexData:
+        pex = rule_runner.request(
+            Pex,
+            [
+                PexRequest(
+                    output_filename="requirements.pex",
+                    internal_only=True,
+                    layout=PexLayout.PACKED,
+                    interpreter_constraints=interpreter_constraints,
+                    requirements=PexRequirements(["six==1.12.0"], from_superset=repository_pex),
+                )
+            ],
+        )
+        return get_all_data(rule_runner, pex)
+
+    pex_data = subset(interpreter_constraints)
+    assert pex_data.info["requirements"] == ["six==1.12.0"]
+    assert (
+        InterpreterConstraints(pex_data.info["interpreter_constraints"]) == interpreter_constraints
+    )
+
+    # Only the subset's requirements should be importable, even though the distributions of the
+    # whole repository PEX are present.
+    process = Process(
+        argv=(
+            os.path.join(pex_data.sandbox_path, "__main__.py"),
+            "-c",
+            "import importlib.util; "
+            "print([bool(importlib.util.find_spec(m)) for m in ('six', 'jsonschema')])",
+        ),
+        env={"PATH": os.getenv("PATH", "")},
+        input_digest=pex_data.pex.digest,
+        description="Run the subset of the repository pex",
+    )
+    result = rule_runner.request(ProcessResult, [process])
+    assert result.stdout == b"[True, False]\n"
+
+    # If the interpreter constraints differ from the repository PEX's, `pex` is used instead.
+    pex_data = subset(InterpreterConstraints([">=3.6"]))
+    assert pex_data.info["requirements"] == ["six==1.12.0"]
+    assert (
+        InterpreterConstraints(pex_data.info.get("interpreter_constraints", ()))
+        != interpreter_constraints
+    )
+
+
 def test_build_pex_description(rule_runner: RuleRunner) -> None:
     def assert_description(
         requirements: PexRequirements | EntireLockfile,
@@ -486,13 +486,7 @@ object ScalaParser {
     analysisTraverser.toAnalysis
   }
 
-  def main(args: Array[String]): Unit = {
-    val outputPath = java.nio.file.Paths.get(args(0))
-    val pathStr = args(1)
-    val scalaVersion = args(2)
-    val source3 = args(3).toBoolean
-    val analysis = analyze(pathStr, scalaVersion, source3)
-
+  def writeAnalysis(outputPath: java.nio.file.Path, analysis: Analysis): Unit = {
     val json = analysis.asJson.noSpaces
     java.nio.file.Files.write(
       outputPath,
@@ -501,4 +495,31 @@ object ScalaParser {
       java.nio.file.StandardOpenOption.WRITE
     )
   }
+
+  def main(args: Array[String]): Unit = {
+    if (args(0) == "--batch") {
+      // Usage: --batch <outputDir> <scalaVersion> <source3> <source>...
+      // The analysis of each source is written to `<outputDir>/<source>.json`.
+      val outputDir = java.nio.file.Paths.get(args(1))
+      val scalaVersion = args(2)
+      val source3 = args(3).toBoolean
+      args.drop(4).foreach { pathStr =>
+        val analysis =
+          try analyze(pathStr, scalaVersion, source3)
+          catch {
+            case e: Exception => throw new Exception(s"Failed to analyze $pathStr", e)
+          }
+        val outputPath = outputDir.resolve(pathStr + ".json")
+        java.nio.file.Files.createDirectories(outputPath.getParent)
+        writeAnalysis(outputPath, analysis)
+      }
+    } else {
+      // Usage: <outputFile> <source> <scalaVersion> <source3>
+      val outputPath = java.nio.file.Paths.get(args(0))
+      val pathStr = args(1)
+      val scalaVersion = args(2)
+      val source3 = args(3).toBoolean
+      writeAnalysis(outputPath, analyze(pathStr, scalaVersion, source3))
+    }
+  }
 }
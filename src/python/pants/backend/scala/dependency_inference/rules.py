@@ -11,6 +11,9 @@ from pants.backend.scala.compile.scalac_plugins import (
 )
 from pants.backend.scala.dependency_inference import scala_parser, symbol_mapper
 from pants.backend.scala.dependency_inference.scala_parser import ScalaSourceDependencyAnalysis
+from pants.backend.scala.dependency_inference.symbol_mapper import (
+    BatchedScalaSourceDependencyAnalysisRequest,
+)
 from pants.backend.scala.subsystems.scala import ScalaSubsystem
 from pants.backend.scala.subsystems.scala_infer import ScalaInferSubsystem
 from pants.backend.scala.target_types import ScalaDependenciesField, ScalaSourceField
@@ -20,7 +23,6 @@ from pants.backend.scala.util_rules.versions import (
     ScalaArtifactsForVersionResult,
 )
 from pants.build_graph.address import Address
-from pants.core.util_rules.source_files import SourceFilesRequest
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import (
     DependenciesRequest,
@@ -69,7 +71,10 @@ async def infer_scala_dependencies_via_source_analysis(
     address = request.field_set.address
     explicitly_provided_deps, analysis = await MultiGet(
         Get(ExplicitlyProvidedDependencies, DependenciesRequest(request.field_set.dependencies)),
-        Get(ScalaSourceDependencyAnalysis, SourceFilesRequest([request.field_set.source])),
+        Get(
+            ScalaSourceDependencyAnalysis,
+            BatchedScalaSourceDependencyAnalysisRequest(request.field_set.source),
+        ),
     )
 
     symbols: OrderedSet[str] = OrderedSet()
@@ -40,6 +40,7 @@ from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.resources import read_resource
+from pants.util.strutil import pluralize
 
 logger = logging.getLogger(__name__)
 
@@ -199,6 +200,26 @@ class AnalyzeScalaSourceRequest:
     source3: bool
 
 
+@dataclass(frozen=True)
+class AnalyzeScalaSourcesBatchRequest:
+    """Analyze all of the given source files with a single invocation of the parser."""
+
+    source_files: SourceFiles
+    scala_version: str
+    source3: bool
+
+
+@dataclass(frozen=True)
+class ScalaSourceDependencyAnalysisBatch:
+    """The analysis of each file in an `AnalyzeScalaSourcesBatchRequest`, by path.
+
+    If the batch could not be analyzed, this is empty, and the files should be analyzed
+    individually.
+    """
+
+    analyses: FrozenDict[str, ScalaSourceDependencyAnalysis]
+
+
 @rule(level=LogLevel.DEBUG)
 async def create_analyze_scala_source_request(
     scala_subsystem: ScalaSubsystem, jvm: JvmSubsystem, scalac: Scalac, request: SourceFilesRequest
@@ -312,6 +333,90 @@ async def resolve_fallible_result_to_analysis(
     )
 
 
+@rule(level=LogLevel.DEBUG)
+async def analyze_scala_source_dependencies_batch(
+    jdk: InternalJdk,
+    processor_classfiles: ScalaParserCompiledClassfiles,
+    request: AnalyzeScalaSourcesBatchRequest,
+) -> ScalaSourceDependencyAnalysisBatch:
+    source_files = request.source_files
+    source_prefix = "__source_to_analyze"
+    processorcp_relpath = "__processorcp"
+    toolcp_relpath = "__toolcp"
+
+    parser_lockfile_request = await Get(
+        GenerateJvmLockfileFromTool, ScalaParserToolLockfileSentinel()
+    )
+
+    tool_classpath, prefixed_source_files_digest = await MultiGet(
+        Get(
+            ToolClasspath,
+            ToolClasspathRequest(lockfile=parser_lockfile_request),
+        ),
+        Get(Digest, AddPrefix(source_files.snapshot.digest, source_prefix)),
+    )
+
+    extra_immutable_input_digests = {
+        toolcp_relpath: tool_classpath.digest,
+        processorcp_relpath: processor_classfiles.digest,
+    }
+
+    analysis_output_dir = "__source_analysis"
+
+    process_result = await Get(
+        FallibleProcessResult,
+        JvmProcess(
+            jdk=jdk,
+            classpath_entries=[
+                *tool_classpath.classpath_entries(toolcp_relpath),
+                processorcp_relpath,
+            ],
+            argv=[
+                "org.pantsbuild.backend.scala.dependency_inference.ScalaParser",
+                "--batch",
+                analysis_output_dir,
+                request.scala_version,
+                str(request.source3),
+                *(os.path.join(source_prefix, file) for file in source_files.files),
+            ],
+            input_digest=prefixed_source_files_digest,
+            extra_immutable_input_digests=extra_immutable_input_digests,
+            output_directories=(analysis_output_dir,),
+            extra_nailgun_keys=extra_immutable_input_digests,
+            description=f"Analyzing {pluralize(len(source_files.files), 'Scala source')}",
+            level=LogLevel.DEBUG,
+        ),
+    )
+    if process_result.exit_code != 0:
+        # The files are analyzed individually instead, so that the failure is reported for the
+        # file(s) which caused it, and does not prevent the analysis of the other files.
+        logger.debug(
+            f"Failed to analyze a batch of {pluralize(len(source_files.files), 'Scala source')}: "
+            f"falling back to analyzing them individually.\n"
+            f"stdout:\n{process_result.stdout.decode()}\nstderr:\n{process_result.stderr.decode()}"
+        )
+        return ScalaSourceDependencyAnalysisBatch(FrozenDict())
+
+    # Split the output into the analysis of each file.
+    analysis_contents = await Get(DigestContents, Digest, process_result.output_digest)
+    analysis_by_output_path = {fc.path: fc.content for fc in analysis_contents}
+    return ScalaSourceDependencyAnalysisBatch(
+        FrozenDict(
+            (
+                file,
+                ScalaSourceDependencyAnalysis.from_json_dict(
+                    json.loads(
+                        analysis_by_output_path[
+                            os.path.join(analysis_output_dir, source_prefix, f"{file}.json")
+                        ]
+                    )
+                ),
+            )
+            for file in source_files.files
+        )
+    )
+
+
 # TODO(13879): Consolidate compilation of wrapper binaries to common rules.
 @rule
 async def setup_scala_parser_classfiles(jdk: InternalJdk) -> ScalaParserCompiledClassfiles:
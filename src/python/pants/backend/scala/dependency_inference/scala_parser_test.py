@@ -8,14 +8,16 @@ from pants.backend.scala import target_types
 from pants.backend.scala.dependency_inference import scala_parser
 from pants.backend.scala.dependency_inference.scala_parser import (
     AnalyzeScalaSourceRequest,
+    AnalyzeScalaSourcesBatchRequest,
     ScalaImport,
     ScalaProvidedSymbol,
     ScalaSourceDependencyAnalysis,
+    ScalaSourceDependencyAnalysisBatch,
 )
 from pants.backend.scala.target_types import ScalaSourceField, ScalaSourceTarget
 from pants.build_graph.address import Address
 from pants.core.util_rules import source_files
-from pants.core.util_rules.source_files import SourceFilesRequest
+from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
 from pants.engine.target import SourcesField
 from pants.jvm import jdk_rules
 from pants.jvm import util_rules as jvm_util_rules
@@ -37,6 +39,8 @@ def rule_runner() -> RuleRunner:
             *jvm_util_rules.rules(),
             QueryRule(AnalyzeScalaSourceRequest, (SourceFilesRequest,)),
             QueryRule(ScalaSourceDependencyAnalysis, (AnalyzeScalaSourceRequest,)),
+            QueryRule(ScalaSourceDependencyAnalysisBatch, (AnalyzeScalaSourcesBatchRequest,)),
+            QueryRule(SourceFiles, (SourceFilesRequest,)),
         ],
         target_types=[ScalaSourceTarget],
     )
@@ -677,3 +681,31 @@ def test_type_context_bounds(rule_runner: RuleRunner) -> None:
         "foo.Applicative",
         "foo.Functor",
     ]
+
+
+def test_batch(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "src/BUILD": textwrap.dedent(
+                """\
+                scala_source(name="A", source="A.scala")
+                scala_source(name="B", source="B.scala")
+                """
+            ),
+            "src/A.scala": "package foo\nclass A extends B\n",
+            "src/B.scala": "package foo\nimport bar.C\nclass B\n",
+        }
+    )
+    targets = [rule_runner.get_target(Address("src", target_name=name)) for name in ("A", "B")]
+    source_files = rule_runner.request(
+        SourceFiles, [SourceFilesRequest(tgt[ScalaSourceField] for tgt in targets)]
+    )
+    batch = rule_runner.request(
+        ScalaSourceDependencyAnalysisBatch,
+        [AnalyzeScalaSourcesBatchRequest(source_files, scala_version="2.13.8", source3=False)],
+    )
+
+    assert sorted(batch.analyses) == ["src/A.scala", "src/B.scala"]
+    assert [symbol.name for symbol in batch.analyses["src/A.scala"].provided_symbols] == ["foo.A"]
+    assert [symbol.name for symbol in batch.analyses["src/B.scala"].provided_symbols] == ["foo.B"]
+    assert list(batch.analyses["src/B.scala"].all_imports()) == ["bar.C"]
@@ -2,12 +2,20 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 from __future__ import annotations
 
+import os
 from collections import defaultdict
+from dataclasses import dataclass
 from typing import Mapping
 
-from pants.backend.scala.dependency_inference.scala_parser import ScalaSourceDependencyAnalysis
+from pants.backend.scala.dependency_inference.scala_parser import (
+    AnalyzeScalaSourcesBatchRequest,
+    ScalaSourceDependencyAnalysis,
+    ScalaSourceDependencyAnalysisBatch,
+)
+from pants.backend.scala.subsystems.scala import ScalaSubsystem
+from pants.backend.scala.subsystems.scalac import Scalac
 from pants.backend.scala.target_types import ScalaSourceField
-from pants.core.util_rules.source_files import SourceFilesRequest
+from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
 from pants.engine.addresses import Address
 from pants.engine.internals.selectors import Get, MultiGet
 from pants.engine.rules import collect_rules, rule
@@ -22,6 +30,7 @@ from pants.jvm.dependency_inference.artifact_mapper import (
 from pants.jvm.dependency_inference.symbol_mapper import FirstPartyMappingRequest, SymbolMap
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import JvmResolveField
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 
 
@@ -40,6 +49,81 @@ def find_all_scala_targets(targets: AllTargets) -> AllScalaTargets:
     return AllScalaTargets(tgt for tgt in targets if tgt.has_field(ScalaSourceField))
 
 
+# The maximum number of sources to analyze with a single invocation of the parser.
+_MAX_SOURCES_PER_ANALYSIS_BATCH = 128
+
+
+@dataclass(frozen=True)
+class ScalaSourceAnalysisBatches:
+    """The sources of all Scala targets, partitioned into batches (along with their resolve) which
+    are each analyzed by a single invocation of the parser.
+
+    Batches are formed from the sources in each directory and resolve, so that editing a file only
+    causes the other files in its directory to be re-analyzed.
+    """
+
+    batches: tuple[tuple[str, tuple[ScalaSourceField, ...]], ...]
+    batch_for_address: FrozenDict[Address, int]
+
+
+@rule(desc="Partition Scala sources for analysis", level=LogLevel.DEBUG)
+def partition_scala_sources_for_analysis(
+    scala_targets: AllScalaTargets, jvm: JvmSubsystem
+) -> ScalaSourceAnalysisBatches:
+    # Keyed by directory and resolve.
+    sources_by_key: dict[tuple[str, str], list[ScalaSourceField]] = defaultdict(list)
+    for tgt in scala_targets:
+        source = tgt[ScalaSourceField]
+        resolve = tgt[JvmResolveField].normalized_value(jvm)
+        sources_by_key[(os.path.dirname(source.file_path), resolve)].append(source)
+    batches = [
+        (resolve, tuple(sources[i : i + _MAX_SOURCES_PER_ANALYSIS_BATCH]))
+        for (_, resolve), sources in sorted(sources_by_key.items())
+        for i in range(0, len(sources), _MAX_SOURCES_PER_ANALYSIS_BATCH)
+    ]
+    return ScalaSourceAnalysisBatches(
+        tuple(batches),
+        FrozenDict(
+            (source.address, index)
+            for index, (_, sources) in enumerate(batches)
+            for source in sources
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class BatchedScalaSourceDependencyAnalysisRequest:
+    """Analyze the source of a Scala target, along with the other sources in its batch."""
+
+    source: ScalaSourceField
+
+
+@rule(level=LogLevel.DEBUG)
+async def analyze_scala_source_in_batch(
+    request: BatchedScalaSourceDependencyAnalysisRequest,
+    batches: ScalaSourceAnalysisBatches,
+    scala_subsystem: ScalaSubsystem,
+    scalac: Scalac,
+) -> ScalaSourceDependencyAnalysis:
+    index = batches.batch_for_address.get(request.source.address)
+    if index is not None:
+        resolve, sources = batches.batches[index]
+        source_files = await Get(SourceFiles, SourceFilesRequest(sources))
+        batch = await Get(
+            ScalaSourceDependencyAnalysisBatch,
+            AnalyzeScalaSourcesBatchRequest(
+                source_files,
+                scala_version=scala_subsystem.version_for_resolve(resolve),
+                source3="-Xsource:3" in scalac.args,
+            ),
+        )
+        analysis = batch.analyses.get(request.source.file_path)
+        if analysis is not None:
+            return analysis
+    # The source is not in a batch, or its batch could not be analyzed.
+    return await Get(ScalaSourceDependencyAnalysis, SourceFilesRequest([request.source]))
+
+
 SCALA_PACKAGE_OBJECT_NAMESPACE: SymbolNamespace = "package object"
 
 
@@ -61,7 +145,10 @@ async def map_first_party_scala_targets_to_symbols(
     jvm: JvmSubsystem,
 ) -> SymbolMap:
     source_analysis = await MultiGet(
-        Get(ScalaSourceDependencyAnalysis, SourceFilesRequest([target[ScalaSourceField]]))
+        Get(
+            ScalaSourceDependencyAnalysis,
+            BatchedScalaSourceDependencyAnalysisRequest(target[ScalaSourceField]),
+        )
         for target in scala_targets
     )
     address_and_analysis = zip(
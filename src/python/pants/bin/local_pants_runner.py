@@ -263,6 +263,7 @@ class LocalPantsRunner:
                 global_options.pantsd and global_options.streaming_workunits_complete_async
             ),
             max_workunit_verbosity=global_options.streaming_workunits_level,
+            build_file_parser=self.graph_session.build_file_parser,
         )
         try:
             with streaming_reporter:
@@ -3,9 +3,10 @@
 
 from __future__ import annotations
 
+import dataclasses
 import itertools
 import logging
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
 from typing import Any, Callable, Iterable, Iterator, NamedTuple, Sequence, Tuple, Type, TypeVar
 
@@ -20,14 +21,29 @@ from pants.core.goals.lint import (
     _get_partitions_by_request_type,
     _MultiToolGoalSubsystem,
 )
-from pants.core.goals.multi_tool_goal_helper import BatchSizeOption, OnlyOption
+from pants.core.goals.multi_tool_goal_helper import (
+    BatchSizeOption,
+    OnlyOption,
+    ReuseFileResultsOption,
+)
 from pants.core.util_rules.partitions import PartitionerType, PartitionMetadataT
 from pants.core.util_rules.partitions import Partitions as UntypedPartitions
 from pants.engine.collection import Collection
 from pants.engine.console import Console
 from pants.engine.engine_aware import EngineAwareReturnType
 from pants.engine.environment import EnvironmentName
-from pants.engine.fs import Digest, MergeDigests, PathGlobs, Snapshot, SnapshotDiff, Workspace
+from pants.engine.fs import (
+    Digest,
+    DigestEntries,
+    DigestSubset,
+    FileDigest,
+    FileEntry,
+    MergeDigests,
+    PathGlobs,
+    Snapshot,
+    SnapshotDiff,
+    Workspace,
+)
 from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.process import FallibleProcessResult, ProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule, rule
@@ -166,12 +182,28 @@ class _FixBatchElement(NamedTuple):
     tool_name: str
     files: tuple[str, ...]
     key: Any
+    reuse_file_results: bool = False
 
 
 class _FixBatchRequest(Collection[_FixBatchElement]):
     """Request to serially fix all the elements in the given batch."""
 
 
+class _FileResultKey(NamedTuple):
+    request_type: type[AbstractFixRequest.Batch]
+    tool_name: str
+    partition_metadata: Any
+    path: str
+    file_digest: FileDigest
+
+
+# For `--reuse-file-results`, the most recent batch that each file was fixed in, by its content.
+# This is only an index of the results memoized by the engine (see `_fix_reusing_file_results`),
+# and so only holds the least recently used entries up to a maximum.
+_MAX_FILE_RESULT_BATCHES = 100_000
+_file_result_batches: OrderedDict[_FileResultKey, AbstractFixRequest.Batch] = OrderedDict()
+
+
 @dataclass(frozen=True)
 class _FixBatchResult:
     results: tuple[FixResult, ...]
@@ -203,6 +235,7 @@ class FixSubsystem(GoalSubsystem):
         ),
     )
     batch_size = BatchSizeOption(uppercase="Fixer", lowercase="fixer")
+    reuse_file_results = ReuseFileResultsOption(lowercase="fixer")
 
 
 class Fix(Goal):
@@ -256,6 +289,7 @@ _GoalT = TypeVar("_GoalT", bound=Goal)
 
 class _BatchableMultiToolGoalSubsystem(_MultiToolGoalSubsystem, Protocol):
     batch_size: BatchSizeOption
+    reuse_file_results: ReuseFileResultsOption
 
 
 async def _do_fix(
@@ -316,6 +350,7 @@ async def _do_fix(
                         request_type.tool_name,
                         batch,
                         partition_metadata,
+                        subsystem.reuse_file_results,
                     )
                     for request_type, partition_metadata in partition_infos
                 )
@@ -372,6 +407,78 @@ async def fix(
     )
 
 
+async def _fix_reusing_file_results(batch: AbstractFixRequest.Batch) -> FixResult:
+    """Fix the batch, reusing the result for each file which was already fixed (with the same
+    content) as part of another batch, and running the tool on the rest of the files together.
+
+    The results are reused by requesting the batches which produced them again, so they are
+    memoized by the engine, and re-run as usual if the tool's version or config has changed.
+    """
+    entries = await Get(DigestEntries, Digest, batch.snapshot.digest)
+    result_keys = {
+        entry.path: _FileResultKey(
+            type(batch), batch.tool_name, batch.partition_metadata, entry.path, entry.file_digest
+        )
+        for entry in entries
+        if isinstance(entry, FileEntry)
+    }
+    reused_files: dict[AbstractFixRequest.Batch, list[str]] = defaultdict(list)
+    uncached_files = []
+    for file in batch.files:
+        previous_batch = _file_result_batches.get(result_keys[file])
+        if previous_batch is None:
+            uncached_files.append(file)
+        else:
+            _file_result_batches.move_to_end(result_keys[file])
+            reused_files[previous_batch].append(file)
+
+    if not reused_files or list(reused_files) == [batch]:
+        result = await Get(FixResult, AbstractFixRequest.Batch, batch)
+        _record_file_result_batch(batch, [result_keys[file] for file in uncached_files])
+        return result
+
+    batches_to_files = dict(reused_files)
+    if uncached_files:
+        uncached_snapshot = await Get(
+            Snapshot, DigestSubset(batch.snapshot.digest, PathGlobs(uncached_files))
+        )
+        uncached_batch = dataclasses.replace(
+            batch, elements=tuple(uncached_files), snapshot=uncached_snapshot
+        )
+        batches_to_files[uncached_batch] = uncached_files
+    results = await MultiGet(
+        Get(FixResult, AbstractFixRequest.Batch, previous_batch)
+        for previous_batch in batches_to_files
+    )
+    if uncached_files:
+        _record_file_result_batch(uncached_batch, [result_keys[file] for file in uncached_files])
+
+    outputs = await MultiGet(
+        Get(Digest, DigestSubset(result.output.digest, PathGlobs(files)))
+        for result, files in zip(results, batches_to_files.values())
+    )
+    output = await Get(Snapshot, MergeDigests(outputs))
+    # Only the output of the tool for the files which it actually ran on is reported: the rest
+    # was reported when it was first computed.
+    uncached_result = results[-1] if uncached_files else None
+    return FixResult(
+        input=batch.snapshot,
+        output=output,
+        stdout=uncached_result.stdout if uncached_result else "",
+        stderr=uncached_result.stderr if uncached_result else "",
+        tool_name=batch.tool_name,
+    )
+
+
+def _record_file_result_batch(
+    batch: AbstractFixRequest.Batch, result_keys: Iterable[_FileResultKey]
+) -> None:
+    for result_key in result_keys:
+        _file_result_batches[result_key] = batch
+    while len(_file_result_batches) > _MAX_FILE_RESULT_BATCHES:
+        _file_result_batches.popitem(last=False)
+
+
 @rule
 async def fix_batch(
     request: _FixBatchRequest,
@@ -379,11 +486,16 @@ async def fix_batch(
     current_snapshot = await Get(Snapshot, PathGlobs(request[0].files))
 
     results = []
-    for request_type, tool_name, files, key in request:
+    for request_type, tool_name, files, key, reuse_file_results in request:
         batch = request_type(tool_name, files, key, current_snapshot)
-        result = await Get(  # noqa: PNT30: this is inherently sequential
-            FixResult, AbstractFixRequest.Batch, batch
-        )
+        if reuse_file_results:
+            result = await _fix_reusing_file_results(  # noqa: PNT30: this is inherently sequential
+                batch
+            )
+        else:
+            result = await Get(  # noqa: PNT30: this is inherently sequential
+                FixResult, AbstractFixRequest.Batch, batch
+            )
         results.append(result)
 
         assert set(result.output.files) == set(
@@ -22,6 +22,9 @@ from pants.core.goals.fix import (
     FixResult,
     FixTargetsRequest,
     Partitions,
+    _FixBatchElement,
+    _FixBatchRequest,
+    _FixBatchResult,
 )
 from pants.core.goals.fix import rules as fix_rules
 from pants.core.goals.fmt import FmtResult, FmtTargetsRequest
@@ -232,7 +235,7 @@ async def fix_with_bricky(request: BrickyBuildFileFixer.Batch) -> FixResult:
     return FixResult(
         input=snapshot,
         output=output_snapshot,
-        stdout="",
+        stdout=f"Bricked {', '.join(request.files)}.\n",
         stderr="",
         tool_name=BrickyBuildFileFixer.tool_name,
     )
@@ -332,6 +335,60 @@ def test_summary() -> None:
     )
 
 
+def test_reuse_file_results() -> None:
+    rule_runner = RuleRunner(
+        rules=[
+            *collect_rules(),
+            *fix_rules(),
+            *BrickyBuildFileFixer.rules(),
+            QueryRule(_FixBatchResult, [_FixBatchRequest]),
+            QueryRule(DigestContents, [Digest]),
+        ]
+    )
+    rule_runner.write_files({"reuse/a/BUILD": "# a\nbrick\n", "reuse/b/BUILD": "# b\nbricks\n"})
+
+    def fix_batch(*files: str, reuse_file_results: bool) -> FixResult:
+        element = _FixBatchElement(
+            BrickyBuildFileFixer.Batch,
+            BrickyBuildFileFixer.tool_name,
+            files,
+            None,
+            reuse_file_results,
+        )
+        batch_result = rule_runner.request(_FixBatchResult, [_FixBatchRequest([element])])
+        assert len(batch_result.results) == 1
+        return batch_result.results[0]
+
+    result = fix_batch("reuse/a/BUILD", "reuse/b/BUILD", reuse_file_results=False)
+    assert result.stdout == "Bricked reuse/a/BUILD, reuse/b/BUILD.\n"
+
+    result = fix_batch("reuse/a/BUILD", "reuse/b/BUILD", reuse_file_results=True)
+    assert result.stdout == "Bricked reuse/a/BUILD, reuse/b/BUILD.\n"
+    assert result.did_change
+
+    # Only the file which wasn't already fixed in another batch is run through the tool.
+    rule_runner.write_files({"reuse/d/BUILD": "# d\nbricks\n"})
+    result = fix_batch("reuse/b/BUILD", "reuse/d/BUILD", reuse_file_results=True)
+    assert result.stdout == "Bricked reuse/d/BUILD.\n"
+    assert result.input.files == ("reuse/b/BUILD", "reuse/d/BUILD")
+    assert result.output.files == ("reuse/b/BUILD", "reuse/d/BUILD")
+    assert result.did_change
+    assert rule_runner.request(DigestContents, [result.output.digest]) == DigestContents(
+        [
+            FileContent("reuse/b/BUILD", b"# b\nbrick\n"),
+            FileContent("reuse/d/BUILD", b"# d\nbrick\n"),
+        ]
+    )
+
+    # The end-to-end result is the same as when batching.
+    rule_runner.write_files({"reuse/c/BUILD": "# c\nbricks\n"})
+    stderr = run_fix(rule_runner, target_specs=["reuse::"], extra_args=["--fix-reuse-file-results"])
+    assert stderr == "\n+ Bricky Bobby made changes.\n"
+    assert Path(rule_runner.build_root, "reuse/a/BUILD").read_text() == "# a\nbrick\n"
+    assert Path(rule_runner.build_root, "reuse/b/BUILD").read_text() == "# b\nbrick\n"
+    assert Path(rule_runner.build_root, "reuse/c/BUILD").read_text() == "# c\nbrick\n"
+
+
 def test_skip_formatters() -> None:
     rule_runner = fix_rule_runner(
         target_types=[FortranTarget, SmalltalkTarget],
@@ -10,7 +10,11 @@ from pants.base.specs import Specs
 from pants.core.goals.fix import AbstractFixRequest, FixFilesRequest, FixResult, FixTargetsRequest
 from pants.core.goals.fix import Partitions as Partitions  # re-export
 from pants.core.goals.fix import _do_fix
-from pants.core.goals.multi_tool_goal_helper import BatchSizeOption, OnlyOption
+from pants.core.goals.multi_tool_goal_helper import (
+    BatchSizeOption,
+    OnlyOption,
+    ReuseFileResultsOption,
+)
 from pants.engine.console import Console
 from pants.engine.fs import Workspace
 from pants.engine.goal import Goal, GoalSubsystem
@@ -59,6 +63,7 @@ class FmtSubsystem(GoalSubsystem):
 
     only = OnlyOption("formatter", "isort", "shfmt")
     batch_size = BatchSizeOption(uppercase="Formatter", lowercase="formatter")
+    reuse_file_results = ReuseFileResultsOption(lowercase="formatter")
 
 
 class Fmt(Goal):
@@ -11,7 +11,7 @@ from typing_extensions import Protocol
 
 from pants.core.util_rules.distdir import DistDir
 from pants.engine.fs import EMPTY_DIGEST, Digest, Workspace
-from pants.option.option_types import IntOption, SkipOption, StrListOption
+from pants.option.option_types import BoolOption, IntOption, SkipOption, StrListOption
 from pants.util.strutil import path_safe, softwrap
 
 logger = logging.getLogger(__name__)
@@ -74,6 +74,34 @@ class BatchSizeOption(IntOption):
         )
 
 
+class ReuseFileResultsOption(BoolOption):
+    """A --reuse-file-results option to reuse the output of a tool for unchanged files across
+    batches."""
+
+    def __new__(cls, lowercase: str):
+        return super().__new__(
+            cls,  # type: ignore[arg-type]
+            "--reuse-file-results",
+            advanced=True,
+            default=False,
+            help=softwrap(
+                f"""
+                If true, reuse the output of each {lowercase} for each file which it has already
+                run on with the same content, even if the batch that the file lands in has changed.
+                The {lowercase} only runs on the remaining files of each batch, together.
+
+                Adding or removing a file can shift the boundaries of many batches (see
+                `--batch-size`), which would otherwise cause {lowercase}s to re-run on every file in
+                those batches. Reused output is that of the earlier batch that the file was in,
+                which is memoized and cached like that of any other process, and so is re-run if the
+                {lowercase}'s version or config has changed.
+
+                The output is only reused within the same `pantsd` process.
+                """
+            ),
+        )
+
+
 def determine_specified_tool_ids(
     goal_name: str,
     only_option: Iterable[str],
@@ -4,12 +4,15 @@
 from __future__ import annotations
 
 import itertools
+import json
 import logging
+import os
+import xml.etree.ElementTree as ET
 from abc import ABC, ABCMeta
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import PurePath
-from typing import Any, ClassVar, Iterable, Optional, Sequence, TypeVar, cast
+from typing import Any, ClassVar, Iterable, Mapping, Optional, Sequence, TypeVar, cast
 
 from pants.base.deprecated import deprecated
 from pants.core.goals.multi_tool_goal_helper import SkippableSubsystem
@@ -34,7 +37,19 @@ from pants.engine.console import Console
 from pants.engine.desktop import OpenFiles, OpenFilesRequest
 from pants.engine.engine_aware import EngineAwareReturnType
 from pants.engine.env_vars import EnvironmentVars, EnvironmentVarsRequest
-from pants.engine.fs import EMPTY_FILE_DIGEST, Digest, FileDigest, MergeDigests, Snapshot, Workspace
+from pants.engine.fs import (
+    EMPTY_FILE_DIGEST,
+    CreateDigest,
+    Digest,
+    DigestContents,
+    FileContent,
+    FileDigest,
+    GlobMatchErrorBehavior,
+    MergeDigests,
+    PathGlobs,
+    Snapshot,
+    Workspace,
+)
 from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.internals.session import RunId
 from pants.engine.process import (
@@ -61,6 +76,7 @@ from pants.engine.target import (
     parse_shard_spec,
 )
 from pants.engine.unions import UnionMembership, UnionRule, distinct_union_type_per_subclass, union
+from pants.option.global_options import GlobalOptions
 from pants.option.option_types import BoolOption, EnumOption, IntOption, StrListOption, StrOption
 from pants.util.collections import partition_sequentially
 from pants.util.docutil import bin_name
@@ -275,6 +291,13 @@ class ShowOutput(Enum):
     NONE = "none"
 
 
+class ShardStrategy(Enum):
+    """How to partition test targets into shards."""
+
+    HASH = "hash"
+    DURATION = "duration"
+
+
 @dataclass(frozen=True)
 class TestDebugRequest:
     process: InteractiveProcess
@@ -568,6 +591,38 @@ class TestSubsystem(GoalSubsystem):
         advanced=True,
         help="Path to write test reports to. Must be relative to the build root.",
     )
+    incremental_reports = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            Write test reports (and `[test].report_summary_file`) as test batches complete, rather
+            than once all tests have completed.
+
+            The batches are run in waves as wide as `[GLOBAL].process_execution_local_parallelism`,
+            and the summaries and reports of each wave are printed and written as soon as it
+            completes, so the reports of an interrupted run are preserved. Otherwise, the summary
+            of each batch is only printed once all tests have completed. Since each wave waits for
+            its slowest batch, this may make the run as a whole slower.
+
+            Has no effect with `[test].fail_fast`.
+            """
+        ),
+    )
+    _report_summary_file = StrOption(
+        default=None,
+        advanced=True,
+        help=softwrap(
+            """
+            Path to write a JUnit XML summary of the test reports to, when `[test].report` is set.
+            Must be relative to the build root, and may use `{distdir}` like `[test].report_dir`.
+
+            The summary contains one `<testsuite>` element (without its test cases) per test suite
+            in the reports, under a `<testsuites>` element with the totals for the run. The report
+            that each suite came from is recorded as its `file` property.
+            """
+        ),
+    )
     shard = StrOption(
         default="",
         help=softwrap(
@@ -582,9 +637,58 @@ class TestSubsystem(GoalSubsystem):
             Useful for splitting large numbers of test files across multiple machines in CI.
             For example, you can run three shards with --shard=0/3, --shard=1/3, --shard=2/3.
 
-            Note that the shards are roughly equal in size as measured by number of files.
-            No attempt is made to consider the size of different files, the time they have
-            taken to run in the past, or other such sophisticated measures.
+            Note that by default the shards are roughly equal in size as measured by number of
+            files. See `[test].shard_strategy` to instead balance them by the time the tests have
+            taken to run in the past.
+            """
+        ),
+    )
+    shard_strategy = EnumOption(
+        default=ShardStrategy.HASH,
+        advanced=True,
+        help=softwrap(
+            f"""
+            How to partition the input targets into shards when `[test].shard` is set.
+
+            * `{ShardStrategy.HASH.value}`: Assign each target to a shard by a hash of its address.
+            The shards are roughly equal in number of files, and a target stays in the same shard
+            as other targets are added or removed.
+
+            * `{ShardStrategy.DURATION.value}`: Balance the shards by the durations recorded in
+            `[test].timings_file`, using longest-processing-time-first bin packing. Targets without
+            a recorded duration are assumed to take the average duration. Every shard must use the
+            same timings file in order for the shards to be disjoint.
+            """
+        ),
+    )
+    timings_file = StrOption(
+        default="",
+        advanced=True,
+        help=softwrap(
+            f"""
+            Path to a JSON file, relative to the build root, mapping test target addresses to the
+            duration (in milliseconds) that they took to run.
+
+            If set, the durations of tests which ran during this run (rather than being served
+            from a cache) are merged into the file. The file may be checked in, or shared between
+            CI jobs, to import and export historical durations for `[test].shard_strategy`.
+
+            Durations are removed for targets which no longer exist in a directory that contains
+            tests which this run matched (unless sharding by `{ShardStrategy.HASH.value}`, where
+            only the tests of one shard are known). The file is only written if it changed.
+            """
+        ),
+    )
+    fail_fast = BoolOption(
+        default=False,
+        help=softwrap(
+            """
+            Stop running tests as soon as any test batch fails.
+
+            The batches are run as process slots become available. Once a batch has failed, the
+            batches which are still running are canceled, no further batches are started, and only
+            the failed batch is summarized and reported. If every batch passes, they are all
+            summarized once the last one completes.
             """
         ),
     )
@@ -648,6 +752,11 @@ class TestSubsystem(GoalSubsystem):
     def report_dir(self, distdir: DistDir) -> PurePath:
         return PurePath(self._report_dir.format(distdir=distdir.relpath))
 
+    def report_summary_file(self, distdir: DistDir) -> PurePath | None:
+        if not self._report_summary_file:
+            return None
+        return PurePath(self._report_summary_file.format(distdir=distdir.relpath))
+
 
 class Test(Goal):
     subsystem_cls = TestSubsystem
@@ -787,6 +896,216 @@ async def _get_test_batches(
     ]
 
 
+def _balance_shards_by_duration(
+    keys: Iterable[str], durations: Mapping[str, int], num_shards: int
+) -> list[set[str]]:
+    """Partition the keys into shards of roughly equal total duration.
+
+    Uses longest-processing-time-first bin packing: the keys are assigned in order of descending
+    duration to the shard with the lowest total so far. Keys without a duration are assumed to take
+    the mean of the known durations. The result is deterministic for the same inputs.
+    """
+    unique_keys = set(keys)
+    known = [durations[key] for key in unique_keys if key in durations]
+    default_duration = sum(known) // len(known) if known else 1
+    shards: list[set[str]] = [set() for _ in range(num_shards)]
+    totals = [0] * num_shards
+    for key in sorted(unique_keys, key=lambda k: (-durations.get(k, default_duration), k)):
+        # Ties are broken by shard index, for determinism.
+        shard = min(range(num_shards), key=lambda i: (totals[i], i))
+        shards[shard].add(key)
+        totals[shard] += durations.get(key, default_duration)
+    return shards
+
+
+def _test_duration_directory(key: str) -> str:
+    """The directory of the target with the given address spec, as recorded in a timings file."""
+    path = key.partition(":")[0].partition("@")[0].lstrip("/")
+    # Generated file targets are recorded under the path of their file.
+    return os.path.dirname(path) if os.path.splitext(path)[1] else path
+
+
+def _prune_test_durations(durations: dict[str, int], keys: Iterable[str]) -> None:
+    """Remove the durations of any targets which are not among the given keys, but are in the
+    directory of one of them, as those targets must have been removed or renamed."""
+    keys = set(keys)
+    directories = {_test_duration_directory(key) for key in keys}
+    for key in list(durations):
+        if key not in keys and _test_duration_directory(key) in directories:
+            del durations[key]
+
+
+def _record_test_durations(
+    durations: dict[str, int], results: Iterable[TestResult], run_id: RunId
+) -> None:
+    """Record the durations of the tests which actually ran, as opposed to being cached."""
+    for result in results:
+        metadata = result.result_metadata
+        if (
+            metadata is None
+            or metadata.total_elapsed_ms is None
+            or metadata.source(run_id) != ProcessResultMetadata.Source.RAN
+            or not result.addresses
+        ):
+            continue
+        # NB: Batches report a single duration, which we attribute evenly to their members.
+        duration = metadata.total_elapsed_ms // len(result.addresses)
+        for address in result.addresses:
+            durations[address.spec] = duration
+
+
+@dataclass(frozen=True)
+class _FailFastTestRequest:
+    batch: TestRequest.Batch
+    environment_name: EnvironmentName
+
+
+@dataclass(frozen=True)
+class _FailFastTestResult:
+    result: TestResult
+
+
+class _TestBatchFailed(Exception):
+    """Raised for a failed test batch under `--test-fail-fast`.
+
+    Raising the failure (rather than returning it) causes the `MultiGet` of all batches to fail as
+    soon as any batch fails, which cancels the batches which are still running or waiting for a
+    process slot.
+    """
+
+    def __init__(self, result: TestResult) -> None:
+        super().__init__(f"{result.description} failed.")
+        self.result = result
+
+
+@rule
+async def run_test_batch_failing_fast(request: _FailFastTestRequest) -> _FailFastTestResult:
+    result = await Get(
+        TestResult,
+        {request.batch: TestRequest.Batch, request.environment_name: EnvironmentName},
+    )
+    if result.exit_code:
+        raise _TestBatchFailed(result)
+    return _FailFastTestResult(result)
+
+
+@dataclass(frozen=True)
+class _JUnitSuiteSummary:
+    report: str
+    name: str
+    tests: int
+    failures: int
+    errors: int
+    skipped: int
+    time: float
+
+
+def _summarize_junit_reports(reports: DigestContents) -> list[_JUnitSuiteSummary]:
+    """Summarize each `<testsuite>` in the given JUnit XML reports, without their test cases."""
+    summaries = []
+    for report in reports:
+        if not report.path.endswith(".xml"):
+            continue
+        try:
+            root = ET.fromstring(report.content)
+            suites = [root] if root.tag == "testsuite" else list(root.iter("testsuite"))
+            summaries.extend(
+                _JUnitSuiteSummary(
+                    report=report.path,
+                    name=suite.get("name", ""),
+                    tests=int(suite.get("tests") or 0),
+                    failures=int(suite.get("failures") or 0),
+                    errors=int(suite.get("errors") or 0),
+                    skipped=int(suite.get("skipped") or 0),
+                    time=float(suite.get("time") or 0),
+                )
+                for suite in suites
+            )
+        except (ET.ParseError, ValueError) as e:
+            logger.warning(f"Could not summarize the test report `{report.path}`: {e}")
+    return summaries
+
+
+def _render_junit_summary(summaries: Sequence[_JUnitSuiteSummary]) -> bytes:
+    def attributes(
+        tests: int, failures: int, errors: int, skipped: int, time: float
+    ) -> dict[str, str]:
+        return {
+            "tests": str(tests),
+            "failures": str(failures),
+            "errors": str(errors),
+            "skipped": str(skipped),
+            "time": f"{time:.3f}",
+        }
+
+    root = ET.Element(
+        "testsuites",
+        attributes(
+            sum(s.tests for s in summaries),
+            sum(s.failures for s in summaries),
+            sum(s.errors for s in summaries),
+            sum(s.skipped for s in summaries),
+            sum(s.time for s in summaries),
+        ),
+    )
+    for s in summaries:
+        suite = ET.SubElement(
+            root,
+            "testsuite",
+            {"name": s.name, **attributes(s.tests, s.failures, s.errors, s.skipped, s.time)},
+        )
+        # NB: `file` is not a standard attribute of `<testsuite>`, so it is recorded as a property.
+        properties = ET.SubElement(suite, "properties")
+        ET.SubElement(properties, "property", {"name": "file", "value": s.report})
+    return ET.tostring(root, encoding="utf-8", xml_declaration=True)
+
+
+async def _write_test_reports(
+    results: Iterable[TestResult],
+    workspace: Workspace,
+    report_dir: PurePath,
+    summary_file: PurePath | None,
+    summaries: list[_JUnitSuiteSummary],
+) -> None:
+    """Write the reports of the given results, and then the summary of all reports written so far.
+
+    The summaries of the given results' reports are appended to `summaries`.
+    """
+    reports = await Get(
+        Digest,
+        MergeDigests(result.xml_results.digest for result in results if result.xml_results),
+    )
+    workspace.write_digest(reports, path_prefix=str(report_dir))
+    if summary_file is None:
+        return
+
+    summaries.extend(_summarize_junit_reports(await Get(DigestContents, Digest, reports)))
+    summary_digest = await Get(
+        Digest,
+        CreateDigest([FileContent(str(summary_file), _render_junit_summary(summaries))]),
+    )
+    workspace.write_digest(summary_digest)
+
+
+async def _load_test_durations(timings_file: str) -> dict[str, int]:
+    digest_contents = await Get(
+        DigestContents,
+        PathGlobs([timings_file], glob_match_error_behavior=GlobMatchErrorBehavior.ignore),
+    )
+    if not digest_contents:
+        return {}
+    try:
+        durations = json.loads(digest_contents[0].content)
+        if not isinstance(durations, dict):
+            raise ValueError(
+                "expected a JSON object mapping addresses to durations, but got a "
+                f"`{type(durations).__name__}`"
+            )
+        return {str(key): int(value) for key, value in durations.items()}
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Failed to parse the [test].timings_file `{timings_file}`: {e}")
+
+
 async def _run_debug_tests(
     batches: Iterable[TestRequest.Batch],
     environment_names: Sequence[EnvironmentName],
@@ -841,6 +1160,7 @@ async def run_tests(
     distdir: DistDir,
     run_id: RunId,
     local_environment_name: ChosenLocalEnvironmentName,
+    global_options: GlobalOptions,
 ) -> Test:
     if test_subsystem.debug_adapter:
         goal_description = f"`{test_subsystem.name} --debug-adapter`"
@@ -853,16 +1173,48 @@ async def run_tests(
         no_applicable_targets_behavior = NoApplicableTargetsBehavior.warn
 
     shard, num_shards = parse_shard_spec(test_subsystem.shard, "the [test].shard option")
+    shard_by_duration = num_shards > 0 and test_subsystem.shard_strategy == ShardStrategy.DURATION
+    if shard_by_duration and not test_subsystem.timings_file:
+        raise ValueError(
+            f"`[test].shard_strategy = {ShardStrategy.DURATION.value}` requires "
+            "`[test].timings_file` to be set."
+        )
+    test_durations = (
+        await _load_test_durations(test_subsystem.timings_file)
+        if test_subsystem.timings_file
+        else {}
+    )
+
     targets_to_valid_field_sets = await Get(
         TargetRootsToFieldSets,
         TargetRootsToFieldSetsRequest(
             TestFieldSet,
             goal_description=goal_description,
             no_applicable_targets_behavior=no_applicable_targets_behavior,
-            shard=shard,
-            num_shards=num_shards,
+            shard=0 if shard_by_duration else shard,
+            num_shards=-1 if shard_by_duration else num_shards,
         ),
     )
+    recorded_test_durations = dict(test_durations)
+    # NB: When sharding by hash, the targets of the other shards are unknown, and their durations
+    # must be preserved.
+    if test_subsystem.timings_file and (shard_by_duration or num_shards <= 0):
+        _prune_test_durations(
+            test_durations, (tgt.address.spec for tgt in targets_to_valid_field_sets.targets)
+        )
+    if shard_by_duration:
+        shard_keys = _balance_shards_by_duration(
+            (tgt.address.spec for tgt in targets_to_valid_field_sets.targets),
+            test_durations,
+            num_shards,
+        )[shard]
+        targets_to_valid_field_sets = TargetRootsToFieldSets(
+            {
+                tgt: field_sets
+                for tgt, field_sets in targets_to_valid_field_sets.mapping.items()
+                if tgt.address.spec in shard_keys
+            }
+        )
 
     request_types = union_membership.get(TestRequest)
     test_batches = await _get_test_batches(
@@ -886,54 +1238,116 @@ async def run_tests(
             test_batches, environment_names, test_subsystem, debug_adapter
         )
 
-    results = await MultiGet(
+    test_result_gets = [
         Get(TestResult, {batch: TestRequest.Batch, environment_name: EnvironmentName})
         for batch, environment_name in zip(test_batches, environment_names)
-    )
+    ]
 
-    # Print summary.
-    exit_code = 0
-    if results:
-        console.print_stderr("")
-    for result in sorted(results):
-        if result.exit_code is None:
-            # We end up here, e.g., if we implemented test discovery and found no tests.
-            continue
-        if result.exit_code != 0:
-            exit_code = result.exit_code
-        if result.result_metadata is None:
-            # We end up here, e.g., if compilation failed during self-implemented test discovery.
-            continue
+    def print_summaries(results: Iterable[TestResult]) -> int:
+        exit_code = 0
+        for result in sorted(results):
+            if result.exit_code is None:
+                # We end up here, e.g., if we implemented test discovery and found no tests.
+                continue
+            if result.exit_code != 0:
+                exit_code = result.exit_code
+            if result.result_metadata is None:
+                # We end up here, e.g., if compilation failed during self-implemented test
+                # discovery.
+                continue
 
-        console.print_stderr(_format_test_summary(result, run_id, console))
+            console.print_stderr(_format_test_summary(result, run_id, console))
 
-        if result.extra_output and result.extra_output.files:
-            path_prefix = str(distdir.relpath / "test" / result.path_safe_description)
-            workspace.write_digest(
-                result.extra_output.digest,
-                path_prefix=path_prefix,
+            if result.extra_output and result.extra_output.files:
+                path_prefix = str(distdir.relpath / "test" / result.path_safe_description)
+                workspace.write_digest(
+                    result.extra_output.digest,
+                    path_prefix=path_prefix,
+                )
+                if result.log_extra_output:
+                    logger.info(
+                        f"Wrote extra output from test `{result.addresses[0]}` to `{path_prefix}`."
+                    )
+        return exit_code
+
+    report_dir = test_subsystem.report_dir(distdir) if test_subsystem.report else None
+    summary_file = test_subsystem.report_summary_file(distdir) if report_dir else None
+    junit_summaries: list[_JUnitSuiteSummary] = []
+    all_coverage_data: list[CoverageData] = []
+
+    def handle_results(results: Sequence[TestResult]) -> int:
+        exit_code = print_summaries(results)
+        if test_subsystem.timings_file:
+            _record_test_durations(test_durations, results, run_id)
+        all_coverage_data.extend(
+            result.coverage_data for result in results if result.coverage_data is not None
+        )
+        return exit_code
+
+    exit_code = 0
+    if test_result_gets:
+        console.print_stderr("")
+    if test_subsystem.fail_fast:
+        # All batches are requested at once, so that a failure cancels the batches which are still
+        # running. The results are only available once every batch has passed (or one has failed),
+        # so they are summarized together.
+        try:
+            fail_fast_results = await MultiGet(
+                Get(_FailFastTestResult, _FailFastTestRequest(batch, environment_name))
+                for batch, environment_name in zip(test_batches, environment_names)
             )
-            if result.log_extra_output:
-                logger.info(
-                    f"Wrote extra output from test `{result.addresses[0]}` to `{path_prefix}`."
+            results = tuple(fail_fast_result.result for fail_fast_result in fail_fast_results)
+            failed_fast = False
+        except _TestBatchFailed as e:
+            results = (e.result,)
+            failed_fast = True
+        exit_code = handle_results(results)
+        if report_dir is not None:
+            await _write_test_reports(results, workspace, report_dir, summary_file, junit_summaries)
+        if failed_fast and len(test_result_gets) > 1:
+            console.print_stderr("\nStopped running the remaining tests due to `--test-fail-fast`.")
+    else:
+        # With `--incremental-reports`, run the batches in waves as wide as the local parallelism,
+        # and handle the results of each wave as soon as it completes. Otherwise, run all batches as
+        # a single wave, within which the engine starts each batch as soon as a process slot is
+        # available. Only the parts of each result which are needed later are retained.
+        if report_dir is not None and test_subsystem.incremental_reports:
+            wave_size = max(1, global_options.process_execution_local_parallelism)
+        else:
+            wave_size = max(1, len(test_result_gets))
+        for wave_start in range(0, len(test_result_gets), wave_size):
+            wave_results = await MultiGet(  # noqa: PNT30: this is intentionally sequential
+                test_result_gets[wave_start : wave_start + wave_size]
+            )
+            exit_code = handle_results(wave_results) or exit_code
+            if report_dir is not None:
+                await _write_test_reports(  # noqa: PNT30: this is intentionally sequential
+                    wave_results, workspace, report_dir, summary_file, junit_summaries
                 )
 
-    if test_subsystem.report:
-        report_dir = test_subsystem.report_dir(distdir)
-        merged_reports = await Get(
+    if test_subsystem.timings_file and test_durations != recorded_test_durations:
+        timings_digest = await Get(
             Digest,
-            MergeDigests(result.xml_results.digest for result in results if result.xml_results),
+            CreateDigest(
+                [
+                    FileContent(
+                        test_subsystem.timings_file,
+                        json.dumps(test_durations, indent=2, sort_keys=True).encode(),
+                    )
+                ]
+            ),
         )
-        workspace.write_digest(merged_reports, path_prefix=str(report_dir))
+        workspace.write_digest(timings_digest)
+
+    if report_dir is not None:
         console.print_stderr(f"\nWrote test reports to {report_dir}")
+        if summary_file is not None:
+            console.print_stderr(f"Wrote test report summary to {summary_file}")
 
     if test_subsystem.use_coverage:
         # NB: We must pre-sort the data for itertools.groupby() to work properly, using the same
         # key function for both. However, you can't sort by `types`, so we call `str()` on it.
-        all_coverage_data = sorted(
-            (result.coverage_data for result in results if result.coverage_data is not None),
-            key=lambda cov_data: str(type(cov_data)),
-        )
+        all_coverage_data.sort(key=lambda cov_data: str(type(cov_data)))
 
         coverage_types_to_collection_types = {
             collection_cls.element_type: collection_cls  # type: ignore[misc]
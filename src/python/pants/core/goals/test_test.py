@@ -3,6 +3,9 @@
 
 from __future__ import annotations
 
+import dataclasses
+import json
+import os
 from abc import abstractmethod
 from dataclasses import dataclass
 from functools import partial
@@ -24,6 +27,7 @@ from pants.core.goals.test import (
     CoverageDataCollection,
     CoverageReports,
     RuntimePackageDependenciesField,
+    ShardStrategy,
     ShowOutput,
     Test,
     TestDebugAdapterRequest,
@@ -33,7 +37,14 @@ from pants.core.goals.test import (
     TestResult,
     TestSubsystem,
     TestTimeoutField,
+    _balance_shards_by_duration,
+    _FailFastTestRequest,
+    _FailFastTestResult,
     _format_test_summary,
+    _render_junit_summary,
+    _summarize_junit_reports,
+    _test_duration_directory,
+    _TestBatchFailed,
     build_runtime_package_dependencies,
     run_tests,
 )
@@ -51,8 +62,12 @@ from pants.engine.environment import EnvironmentName
 from pants.engine.fs import (
     EMPTY_DIGEST,
     EMPTY_FILE_DIGEST,
+    CreateDigest,
     Digest,
+    DigestContents,
+    FileContent,
     MergeDigests,
+    PathGlobs,
     Snapshot,
     Workspace,
 )
@@ -73,6 +88,7 @@ from pants.engine.target import (
     TargetRootsToFieldSetsRequest,
 )
 from pants.engine.unions import UnionMembership
+from pants.option.global_options import GlobalOptions
 from pants.option.option_types import SkipOption
 from pants.option.subsystem import Subsystem
 from pants.testutil.option_util import create_goal_subsystem, create_subsystem
@@ -225,9 +241,23 @@ def mock_test_partition(request: MockTestRequest.Batch, _: EnvironmentName) -> T
     return request_type.test_result(request.elements)
 
 
+def mock_fail_fast_test_batch(request: _FailFastTestRequest) -> _FailFastTestResult:
+    result = mock_test_partition(request.batch, request.environment_name)
+    if result.exit_code:
+        raise _TestBatchFailed(result)
+    return _FailFastTestResult(result)
+
+
 @pytest.fixture
 def rule_runner() -> RuleRunner:
-    return RuleRunner()
+    return RuleRunner(
+        rules=[
+            QueryRule(Digest, [CreateDigest]),
+            QueryRule(Digest, [MergeDigests]),
+            QueryRule(DigestContents, [Digest]),
+            QueryRule(DigestContents, [PathGlobs]),
+        ]
+    )
 
 
 def make_target(address: Address | None = None, *, skip: bool = False) -> Target:
@@ -245,9 +275,14 @@ def run_test_rule(
     use_coverage: bool = False,
     report: bool = False,
     report_dir: str = TestSubsystem.default_report_path,
+    incremental_reports: bool = False,
+    report_summary_file: str | None = None,
     output: ShowOutput = ShowOutput.ALL,
     valid_targets: bool = True,
     run_id: RunId = RunId(999),
+    fail_fast: bool = False,
+    local_parallelism: int = 2,
+    timings_file: str = "",
 ) -> tuple[int, str]:
     test_subsystem = create_goal_subsystem(
         TestSubsystem,
@@ -256,11 +291,19 @@ def run_test_rule(
         use_coverage=use_coverage,
         report=report,
         report_dir=report_dir,
+        incremental_reports=incremental_reports,
+        report_summary_file=report_summary_file,
         xml_dir=None,
         output=output,
         extra_env_vars=[],
         shard="",
+        shard_strategy=ShardStrategy.HASH,
+        timings_file=timings_file,
         batch_size=1,
+        fail_fast=fail_fast,
+    )
+    global_options = create_subsystem(
+        GlobalOptions, process_execution_local_parallelism=local_parallelism
     )
     debug_adapter_subsystem = create_subsystem(
         DebugAdapterSubsystem,
@@ -327,6 +370,7 @@ def run_test_rule(
                 DistDir(relpath=Path("dist")),
                 run_id,
                 ChosenLocalEnvironmentName(EnvironmentName(None)),
+                global_options,
             ],
             mock_gets=[
                 MockGet(
@@ -349,6 +393,11 @@ def run_test_rule(
                     input_types=(TestRequest.Batch, EnvironmentName),
                     mock=mock_test_partition,
                 ),
+                MockGet(
+                    output_type=_FailFastTestResult,
+                    input_types=(_FailFastTestRequest,),
+                    mock=mock_fail_fast_test_batch,
+                ),
                 MockGet(
                     output_type=TestDebugRequest,
                     input_types=(TestRequest.Batch, EnvironmentName),
@@ -363,7 +412,23 @@ def run_test_rule(
                 MockGet(
                     output_type=Digest,
                     input_types=(MergeDigests,),
-                    mock=lambda _: EMPTY_DIGEST,
+                    mock=lambda merge_digests: rule_runner.request(Digest, [merge_digests]),
+                ),
+                # Summarize XML results.
+                MockGet(
+                    output_type=DigestContents,
+                    input_types=(Digest,),
+                    mock=lambda digest: rule_runner.request(DigestContents, [digest]),
+                ),
+                MockGet(
+                    output_type=DigestContents,
+                    input_types=(PathGlobs,),
+                    mock=lambda path_globs: rule_runner.request(DigestContents, [path_globs]),
+                ),
+                MockGet(
+                    output_type=Digest,
+                    input_types=(CreateDigest,),
+                    mock=lambda create_digest: rule_runner.request(Digest, [create_digest]),
                 ),
                 MockGet(
                     output_type=CoverageReports,
@@ -428,6 +493,53 @@ def test_summary(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_fail_fast(rule_runner: RuleRunner) -> None:
+    first_bad_address = Address("a", target_name="bad")
+    second_bad_address = Address("b", target_name="bad")
+
+    exit_code, stderr = run_test_rule(
+        rule_runner,
+        request_type=ConditionallySucceedsRequest,
+        targets=[make_target(first_bad_address), make_target(second_bad_address)],
+        fail_fast=True,
+        local_parallelism=1,
+    )
+    assert exit_code == ConditionallySucceedsRequest.exit_code((first_bad_address,))
+    assert stderr == dedent(
+        """\
+
+        ✕ a:bad failed in 1.00s (memoized).
+
+        Stopped running the remaining tests due to `--test-fail-fast`.
+        """
+    )
+
+
+def test_fail_fast_summarizes_passing_batches(rule_runner: RuleRunner) -> None:
+    exit_code, stderr = run_test_rule(
+        rule_runner,
+        request_type=ConditionallySucceedsRequest,
+        targets=[
+            make_target(Address("a", target_name="good")),
+            make_target(Address("b", target_name="good")),
+        ],
+        fail_fast=True,
+        report=True,
+        incremental_reports=True,
+        local_parallelism=1,
+    )
+    assert exit_code == 0
+    assert stderr == dedent(
+        """\
+
+        ✓ a:good succeeded in 1.00s (memoized).
+        ✓ b:good succeeded in 1.00s (memoized).
+
+        Wrote test reports to dist/test/reports
+        """
+    )
+
+
 def _assert_test_summary(
     expected: str,
     *,
@@ -531,6 +643,97 @@ def test_report_dir(rule_runner: RuleRunner) -> None:
     assert f"Wrote test reports to {report_dir}" in stderr
 
 
+def test_incremental_reports(rule_runner: RuleRunner) -> None:
+    reports_dir = Path(rule_runner.build_root, "dist/test/reports")
+    summary_file = Path(rule_runner.build_root, "dist/test/summary.xml")
+    # The reports and summary on disk when each batch was run.
+    reports_before_batch: dict[str, list[str]] = {}
+    summary_before_batch: dict[str, str] = {}
+
+    class ReportingRequest(MockTestRequest):
+        @staticmethod
+        def exit_code(_: Iterable[Address]) -> int:
+            return 0
+
+        @staticmethod
+        def skipped(_: Iterable[Address]) -> bool:
+            return False
+
+        @classmethod
+        def test_result(cls, field_sets: Iterable[MockTestFieldSet]) -> TestResult:
+            result = super().test_result(field_sets)
+            name = result.addresses[0].target_name
+            reports_before_batch[name] = (
+                sorted(os.listdir(reports_dir)) if reports_dir.exists() else []
+            )
+            summary_before_batch[name] = summary_file.read_text() if summary_file.exists() else ""
+            xml_results = rule_runner.make_snapshot(
+                {f"{name}.xml": f'<testsuite name="{name}" tests="1"/>'}
+            )
+            return dataclasses.replace(result, xml_results=xml_results)
+
+    addr1 = Address("", target_name="t1")
+    addr2 = Address("", target_name="t2")
+    addr3 = Address("", target_name="t3")
+    exit_code, stderr = run_test_rule(
+        rule_runner,
+        request_type=ReportingRequest,
+        targets=[make_target(addr1), make_target(addr2), make_target(addr3)],
+        report=True,
+        incremental_reports=True,
+        report_summary_file="{distdir}/test/summary.xml",
+        local_parallelism=2,
+    )
+    assert exit_code == 0
+    assert "Wrote test reports to dist/test/reports" in stderr
+    assert "Wrote test report summary to dist/test/summary.xml" in stderr
+
+    # The batches run in waves of two, and the reports of the first wave were written to disk
+    # before the second wave ran.
+    assert reports_before_batch == {"t1": [], "t2": [], "t3": ["t1.xml", "t2.xml"]}
+    assert 'name="t1"' in summary_before_batch["t3"]
+    assert 'name="t2"' in summary_before_batch["t3"]
+    assert 'name="t3"' not in summary_before_batch["t3"]
+    assert sorted(os.listdir(reports_dir)) == ["t1.xml", "t2.xml", "t3.xml"]
+    assert 'tests="3"' in summary_file.read_text()
+
+
+def test_junit_summary() -> None:
+    summaries = _summarize_junit_reports(
+        DigestContents(
+            [
+                FileContent(
+                    "a.xml",
+                    b'<testsuite name="a" tests="3" failures="1" errors="0" skipped="1" '
+                    b'time="1.5"><testcase name="t"/></testsuite>',
+                ),
+                FileContent(
+                    "b.xml",
+                    b'<testsuites><testsuite name="b1" tests="2" time="0.25"/>'
+                    b'<testsuite name="b2" tests="1" errors="1"/></testsuites>',
+                ),
+                FileContent("c.xml", b"<not xml"),
+                FileContent("d.txt", b"ignored"),
+            ]
+        )
+    )
+    assert [(s.report, s.name, s.tests) for s in summaries] == [
+        ("a.xml", "a", 3),
+        ("b.xml", "b1", 2),
+        ("b.xml", "b2", 1),
+    ]
+    assert _render_junit_summary(summaries).decode().splitlines()[1] == (
+        '<testsuites tests="6" failures="1" errors="1" skipped="1" time="1.750">'
+        '<testsuite name="a" tests="3" failures="1" errors="0" skipped="1" time="1.500">'
+        '<properties><property name="file" value="a.xml" /></properties></testsuite>'
+        '<testsuite name="b1" tests="2" failures="0" errors="0" skipped="0" time="0.250">'
+        '<properties><property name="file" value="b.xml" /></properties></testsuite>'
+        '<testsuite name="b2" tests="1" failures="0" errors="1" skipped="0" time="0.000">'
+        '<properties><property name="file" value="b.xml" /></properties></testsuite>'
+        "</testsuites>"
+    )
+
+
 def test_coverage(rule_runner: RuleRunner) -> None:
     addr1 = Address("", target_name="t1")
     addr2 = Address("", target_name="t2")
@@ -719,6 +922,73 @@ def test_timeout_calculation() -> None:
     assert_timeout_calculated(field_value=10, timeouts_enabled=False, expected=None)
 
 
+def test_balance_shards_by_duration() -> None:
+    durations = {"a": 100, "b": 60, "c": 50, "d": 40, "e": 10}
+    assert _balance_shards_by_duration(durations, durations, 2) == [{"a", "d"}, {"b", "c", "e"}]
+    assert _balance_shards_by_duration(durations, durations, 3) == [
+        {"a"},
+        {"b", "e"},
+        {"c", "d"},
+    ]
+
+    # Keys without a duration are assumed to take the mean duration, of 52 here.
+    assert _balance_shards_by_duration(["a", "b", "c", "d", "e", "new"], durations, 2) == [
+        {"a", "c", "e"},
+        {"b", "new", "d"},
+    ]
+
+    # Without any durations, the keys are spread evenly.
+    assert _balance_shards_by_duration(["a", "b", "c"], {}, 2) == [{"a", "c"}, {"b"}]
+
+
+def test_timings_file(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {"timings.json": json.dumps({"//:t1": 5, "//:removed": 10, "other:t": 7})}
+    )
+    exit_code, _ = run_test_rule(
+        rule_runner,
+        request_type=SuccessfulRequest,
+        targets=[make_target(Address("", target_name="t2"))],
+        run_id=RunId(0),
+        timings_file="timings.json",
+    )
+    assert exit_code == 0
+    # The recorded durations are merged into those which were read from the file, and the
+    # durations of targets which are no longer in the directories of the tests are removed.
+    assert json.loads(rule_runner.read_file("timings.json")) == {"//:t2": 999, "other:t": 7}
+
+    # Memoized results do not update the recorded durations, and so the file is not rewritten.
+    rule_runner.write_files({"timings.json": '{"//:t2": 5}'})
+    run_test_rule(
+        rule_runner,
+        request_type=SuccessfulRequest,
+        targets=[make_target(Address("", target_name="t2"))],
+        run_id=RunId(1),
+        timings_file="timings.json",
+    )
+    assert rule_runner.read_file("timings.json") == '{"//:t2": 5}'
+
+
+def test_test_duration_directory() -> None:
+    assert _test_duration_directory("//:t") == ""
+    assert _test_duration_directory("src/py:t") == "src/py"
+    assert _test_duration_directory("src/py/test_f.py:t") == "src/py"
+    assert _test_duration_directory("src/py/test_f.py:t@k=v") == "src/py"
+    assert _test_duration_directory("src/py:t#gen") == "src/py"
+
+
+@pytest.mark.parametrize("content", ["{", "[1, 2]", '{"//:t1": "fast"}'])
+def test_invalid_timings_file(rule_runner: RuleRunner, content: str) -> None:
+    rule_runner.write_files({"timings.json": content})
+    with pytest.raises(ValueError, match=r"Failed to parse the \[test\]\.timings_file"):
+        run_test_rule(
+            rule_runner,
+            request_type=SuccessfulRequest,
+            targets=[make_target()],
+            timings_file="timings.json",
+        )
+
+
 def test_non_utf8_output() -> None:
     test_result = TestResult(
         exit_code=1,  # "test error" so stdout/stderr are output in message
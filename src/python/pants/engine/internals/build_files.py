@@ -11,7 +11,6 @@ import os.path
 import sys
 import typing
 from dataclasses import dataclass
-from pathlib import PurePath
 from typing import Any, Sequence, cast
 
 from pants.build_graph.address import (
@@ -195,6 +194,44 @@ async def ensure_address_family(request: OptionalAddressFamily) -> AddressFamily
     return request.ensure()
 
 
+@dataclass(frozen=True)
+class AddressFamilyDefaults:
+    """The `__defaults__` and dependency rules in effect for a directory.
+
+    These come from the BUILD files of the directory itself if there are any, or else are inherited
+    from the closest ancestor directory that has BUILD files.
+    """
+
+    defaults: BuildFileDefaults = BuildFileDefaults({})
+    dependents_rules: BuildFileDependencyRules | None = None
+    dependencies_rules: BuildFileDependencyRules | None = None
+
+
+def _parent_dir(path: str) -> str | None:
+    parent = os.path.dirname(path)
+    return parent if parent != path else None
+
+
+@rule
+async def find_address_family_defaults(directory: AddressFamilyDir) -> AddressFamilyDefaults:
+    # N.B.: Each directory only consults its immediate parent, so resolving the defaults for all
+    # directories costs one node per directory, rather than one lookup per ancestor of each
+    # directory. Since the result compares equal when unrelated BUILD files change, edits only
+    # invalidate the directories below the one that changed.
+    maybe_family = await Get(OptionalAddressFamily, AddressFamilyDir, directory)
+    family = maybe_family.address_family
+    if family is not None:
+        return AddressFamilyDefaults(
+            defaults=family.defaults,
+            dependents_rules=family.dependents_rules,
+            dependencies_rules=family.dependencies_rules,
+        )
+    parent_dir = _parent_dir(directory.path)
+    if parent_dir is None:
+        return AddressFamilyDefaults()
+    return await Get(AddressFamilyDefaults, AddressFamilyDir(parent_dir))
+
+
 class BUILDFileEnvVarExtractor(ast.NodeVisitor):
     def __init__(self, filename: str):
         super().__init__()
@@ -268,25 +305,16 @@ async def parse_address_family(
     if not digest_contents and not synthetic_address_maps:
         return OptionalAddressFamily(directory.path)
 
-    defaults = BuildFileDefaults({})
-    dependents_rules: BuildFileDependencyRules | None = None
-    dependencies_rules: BuildFileDependencyRules | None = None
-    parent_dirs = tuple(PurePath(directory.path).parents)
-    if parent_dirs:
-        maybe_parents = await MultiGet(
-            Get(OptionalAddressFamily, AddressFamilyDir(str(parent_dir)))
-            for parent_dir in parent_dirs
-        )
-        for maybe_parent in maybe_parents:
-            if maybe_parent.address_family is not None:
-                family = maybe_parent.address_family
-                defaults = family.defaults
-                dependents_rules = family.dependents_rules
-                dependencies_rules = family.dependencies_rules
-                break
+    parent_dir = _parent_dir(directory.path)
+    if parent_dir is not None:
+        parent_defaults = await Get(AddressFamilyDefaults, AddressFamilyDir(parent_dir))
+    else:
+        parent_defaults = AddressFamilyDefaults()
+    dependents_rules = parent_defaults.dependents_rules
+    dependencies_rules = parent_defaults.dependencies_rules
 
     defaults_parser_state = BuildFileDefaultsParserState.create(
-        directory.path, defaults, registered_target_types, union_membership
+        directory.path, parent_defaults.defaults, registered_target_types, union_membership
     )
     build_file_dependency_rules_class = (
         maybe_build_file_dependency_rules_implementation.build_file_dependency_rules_class
@@ -17,9 +17,9 @@ from pants.engine.addresses import Address, AddressInput, BuildFileAddress
 from pants.engine.env_vars import CompleteEnvironmentVars, EnvironmentVars, EnvironmentVarsRequest
 from pants.engine.fs import DigestContents, FileContent, PathGlobs
 from pants.engine.internals.build_files import (
+    AddressFamilyDefaults,
     AddressFamilyDir,
     BuildFileOptions,
-    OptionalAddressFamily,
     evaluate_preludes,
     parse_address_family,
 )
@@ -85,9 +85,9 @@ def test_parse_address_family_empty() -> None:
                 mock=lambda _: DigestContents([FileContent(path="/dev/null/BUILD", content=b"")]),
             ),
             MockGet(
-                output_type=OptionalAddressFamily,
+                output_type=AddressFamilyDefaults,
                 input_types=(AddressFamilyDir,),
-                mock=lambda _: OptionalAddressFamily("/dev"),
+                mock=lambda _: AddressFamilyDefaults(),
             ),
             MockGet(
                 output_type=SyntheticAddressMaps,
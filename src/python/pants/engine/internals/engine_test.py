@@ -14,6 +14,7 @@ from pants.backend.python.target_types import PythonSourcesGeneratorTarget
 from pants.base.exceptions import IntrinsicError
 from pants.base.specs import Specs
 from pants.base.specs_parser import SpecsParser
+from pants.engine.addresses import Address
 from pants.engine.engine_aware import EngineAwareParameter, EngineAwareReturnType
 from pants.engine.fs import (
     EMPTY_FILE_DIGEST,
@@ -33,11 +34,13 @@ from pants.engine.internals.scheduler import ExecutionError, SchedulerSession
 from pants.engine.internals.scheduler_test_base import SchedulerTestBase
 from pants.engine.process import Process, ProcessCacheScope, ProcessResult
 from pants.engine.rules import Get, MultiGet, rule
+from pants.engine.target import GenericTarget
 from pants.engine.streaming_workunit_handler import (
     StreamingWorkunitContext,
     StreamingWorkunitHandler,
     TargetInfo,
     WorkunitsCallback,
+    _InnerHandler,
 )
 from pants.engine.unions import UnionRule, union
 from pants.goal.run_tracker import RunTracker
@@ -743,6 +746,94 @@ def test_counters(rule_runner: RuleRunner, run_tracker: RunTracker) -> None:
     )
 
 
+def test_callback_metrics(rule_runner: RuleRunner, run_tracker: RunTracker) -> None:
+    tracker = WorkunitTracker()
+    handler = StreamingWorkunitHandler(
+        rule_runner.scheduler,
+        run_tracker=run_tracker,
+        callbacks=[tracker],
+        report_interval_seconds=0.01,
+        max_workunit_verbosity=LogLevel.TRACE,
+        specs=Specs.empty(),
+        options_bootstrapper=create_options_bootstrapper([]),
+        allow_async_completion=False,
+    )
+    with handler:
+        rule_runner.request(
+            ProcessResult,
+            [Process(["/bin/sh", "-c", "true"], description="always true")],
+        )
+
+    assert tracker.finished
+    metrics = handler.context.get_metrics()
+    assert metrics["streaming_workunits_callback_0_calls"] >= 1
+    assert "streaming_workunits_callback_0_total_latency_ms" in metrics
+    assert "streaming_workunits_callback_0_max_latency_ms" in metrics
+
+
+def test_callback_dropped_workunits(
+    rule_runner: RuleRunner, run_tracker: RunTracker, monkeypatch
+) -> None:
+    monkeypatch.setattr(_InnerHandler, "MAX_PENDING_WORKUNITS", 0)
+    tracker = WorkunitTracker()
+    handler = StreamingWorkunitHandler(
+        rule_runner.scheduler,
+        run_tracker=run_tracker,
+        callbacks=[tracker],
+        report_interval_seconds=0.01,
+        max_workunit_verbosity=LogLevel.TRACE,
+        specs=Specs.empty(),
+        options_bootstrapper=create_options_bootstrapper([]),
+        allow_async_completion=False,
+    )
+    with handler:
+        rule_runner.request(
+            ProcessResult,
+            [Process(["/bin/sh", "-c", "true"], description="always true")],
+        )
+
+    # All workunits are dropped, but the final batch is still delivered.
+    assert tracker.finished
+    assert not tracker.started_workunit_chunks
+    assert not tracker.finished_workunit_chunks
+    metrics = handler.context.get_metrics()
+    assert metrics["streaming_workunits_callback_0_dropped_workunits"] > 0
+
+
+def test_build_file_code_cache_metrics(run_tracker: RunTracker) -> None:
+    rule_runner = RuleRunner(target_types=[GenericTarget])
+    rule_runner.write_files({"a/BUILD": "target()", "b/BUILD": "target()"})
+
+    def run(address: Address) -> dict[str, int]:
+        handler = StreamingWorkunitHandler(
+            rule_runner.scheduler,
+            run_tracker=run_tracker,
+            callbacks=[WorkunitTracker()],
+            report_interval_seconds=0.01,
+            max_workunit_verbosity=LogLevel.TRACE,
+            specs=Specs.empty(),
+            options_bootstrapper=create_options_bootstrapper([]),
+            allow_async_completion=False,
+            build_file_parser=rule_runner.build_file_parser,
+        )
+        with handler:
+            rule_runner.get_target(address)
+        return handler.context.get_metrics()
+
+    metrics = run(Address("a"))
+    assert metrics["build_file_code_cache_misses"] == 1
+    assert metrics["build_file_code_cache_hits"] == 0
+    assert metrics["build_file_code_cache_persisted_hits"] == 0
+
+    # The metrics only cover the BUILD files which were parsed during each run.
+    metrics = run(Address("b"))
+    assert metrics["build_file_code_cache_misses"] == 1
+
+    rule_runner.new_session("unchanged")
+    metrics = run(Address("a"))
+    assert metrics["build_file_code_cache_misses"] == 0
+
+
 def test_more_complicated_engine_aware(rule_runner: RuleRunner, run_tracker: RunTracker) -> None:
     tracker = WorkunitTracker()
     handler = StreamingWorkunitHandler(
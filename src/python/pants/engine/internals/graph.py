@@ -9,9 +9,10 @@ import itertools
 import json
 import logging
 import os.path
+from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import PurePath
-from typing import Any, Iterable, Iterator, NamedTuple, NewType, Sequence, Type, cast
+from typing import Any, Iterable, Iterator, Mapping, NamedTuple, NewType, Sequence, Type, cast
 
 from pants.base.deprecated import warn_or_error
 from pants.base.specs import AncestorGlobSpec, RawSpecsWithoutFileOwners, RecursiveGlobSpec
@@ -621,52 +622,51 @@ class CycleException(Exception):
 
 
 def _detect_cycles(
-    roots: tuple[Address, ...], dependency_mapping: dict[Address, tuple[Address, ...]]
+    roots: tuple[Address, ...],
+    dependency_mapping: Mapping[Address, tuple[Address, ...]],
+    components: tuple[tuple[Address, ...], ...],
 ) -> None:
-    path_stack: OrderedSet[Address] = OrderedSet()
+    # The strongly connected components rule out the common case of there being no cycles at all,
+    # without walking the graph.
+    if not any(
+        len(component) > 1 or component[0] in dependency_mapping[component[0]]
+        for component in components
+    ):
+        return
+
+    # NB: This is an iterative DFS from the roots, to avoid recursion limits on deep graphs. The
+    # path to each address (including any file addresses) is tracked so that a cycle is reported
+    # along with how it was reached. File-level dependencies are cycle tolerant, so a back edge is
+    # only reported if there are no file addresses in the cycle, which `files_in_path` (the number
+    # of file addresses in each prefix of the path) answers without rescanning the path.
+    path: list[Address] = []
+    path_indexes: dict[Address, int] = {}
+    files_in_path: list[int] = []
     visited: set[Address] = set()
 
-    def maybe_report_cycle(address: Address) -> None:
-        # NB: File-level dependencies are cycle tolerant.
-        if address.is_file_target or address not in path_stack:
-            return
-
-        # The path of the cycle is shorter than the entire path to the cycle: if the suffix of
-        # the path representing the cycle contains a file dep, it is ignored.
-        in_cycle = False
-        for path_address in path_stack:
-            if in_cycle and path_address.is_file_target:
-                # There is a file address inside the cycle: do not report it.
-                return
-            elif in_cycle:
-                # Not a file address.
-                continue
-            else:
-                # We're entering the suffix of the path that contains the cycle if we've reached
-                # the address in question.
-                in_cycle = path_address == address
-        # If we did not break out early, it's because there were no file addresses in the cycle.
-        raise CycleException(address, (*path_stack, address))
-
-    def visit(address: Address):
-        if address in visited:
-            maybe_report_cycle(address)
-            return
-        path_stack.add(address)
+    def enter(address: Address) -> Iterator[Address]:
+        path_indexes[address] = len(path)
+        files_in_path.append((files_in_path[-1] if path else 0) + address.is_file_target)
+        path.append(address)
         visited.add(address)
-
-        for dep_address in dependency_mapping[address]:
-            visit(dep_address)
-
-        path_stack.remove(address)
+        return iter(dependency_mapping[address])
 
     for root in roots:
-        visit(root)
-        if path_stack:
-            raise AssertionError(
-                f"The stack of visited nodes should have been empty at the end of recursion, "
-                f"but it still contained: {path_stack}"
-            )
+        if root in visited:
+            continue
+        stack = [enter(root)]
+        while stack:
+            dep_address = next(stack[-1], None)
+            if dep_address is None:
+                stack.pop()
+                del path_indexes[path.pop()]
+                files_in_path.pop()
+            elif dep_address not in visited:
+                stack.append(enter(dep_address))
+            elif dep_address in path_indexes and not dep_address.is_file_target:
+                cycle_start = path_indexes[dep_address]
+                if files_in_path[-1] == files_in_path[cycle_start]:
+                    raise CycleException(dep_address, (*path, dep_address))
 
 
 @dataclass(frozen=True)
@@ -680,6 +680,8 @@ class _DependencyMapping:
     mapping: FrozenDict[Address, tuple[Address, ...]]
     visited: FrozenOrderedSet[Target]
     roots_as_targets: Collection[Target]
+    # The strongly connected components of the `mapping`, in reverse topological order.
+    components: tuple[tuple[Address, ...], ...]
 
 
 @rule
@@ -730,13 +732,23 @@ async def transitive_dependency_mapping(request: _DependencyMappingRequest) -> _
         )
         visited.update(queued)
 
+    # Because this is Tarjan's SCC (TODO: update signature to guarantee), components are returned
+    # in reverse topological order. They are computed once here to be shared by cycle detection
+    # and `coarsened_targets`.
+    components = tuple(
+        tuple(component)
+        for component in native_engine.strongly_connected_components(
+            list(dependency_mapping.items())
+        )
+    )
+
     # NB: We use `roots_as_targets` to get the root addresses, rather than `request.roots`. This
     # is because expanding from the `Addresses` -> `Targets` may have resulted in generated
     # targets being used, so we need to use `roots_as_targets` to have this expansion.
     # TODO(#12871): Fix this to not be based on generated targets.
-    _detect_cycles(tuple(t.address for t in roots_as_targets), dependency_mapping)
+    _detect_cycles(tuple(t.address for t in roots_as_targets), dependency_mapping, components)
     return _DependencyMapping(
-        FrozenDict(dependency_mapping), FrozenOrderedSet(visited), roots_as_targets
+        FrozenDict(dependency_mapping), FrozenOrderedSet(visited), roots_as_targets, components
     )
 
 
@@ -798,13 +810,10 @@ async def coarsened_targets(
         t.address: t for t in [*dependency_mapping.visited, *dependency_mapping.roots_as_targets]
     }
 
-    # Because this is Tarjan's SCC (TODO: update signature to guarantee), components are returned
-    # in reverse topological order. We can thus assume when building the structure shared
-    # `CoarsenedTarget` instances that each instance will already have had its dependencies
+    # Components are in reverse topological order. We can thus assume when building the structure
+    # shared `CoarsenedTarget` instances that each instance will already have had its dependencies
     # constructed.
-    components = native_engine.strongly_connected_components(
-        list(dependency_mapping.mapping.items())
-    )
+    components = dependency_mapping.components
 
     coarsened_targets: dict[Address, CoarsenedTarget] = {}
     root_coarsened_targets = []
@@ -910,6 +919,25 @@ class Owners(FrozenDict[Address, IsPrimary]):
     pass
 
 
+def _files_by_ancestor_dir(files: Iterable[str]) -> dict[str, list[str]]:
+    """Index each file under every directory which (transitively) contains it.
+
+    Since the `SourcesField` of a target may only match files in its own directory or below, this
+    allows the files which it could possibly match to be found with a single lookup of its
+    `spec_path`.
+    """
+    index: dict[str, list[str]] = defaultdict(list)
+    for file in files:
+        directory = os.path.dirname(file)
+        while True:
+            index[directory].append(file)
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                break
+            directory = parent
+    return index
+
+
 @rule(desc="Find which targets own certain files", _masked_types=[EnvironmentName])
 async def find_owners(
     owners_request: OwnersRequest,
@@ -982,10 +1010,18 @@ async def find_owners(
             for tgt in candidate_tgts
         )
 
+        sources_list = list(sources_set)
+        # NB: Unlike `SourcesField`s, secondary owner fields are not validated to only refer to
+        # files below their target, and so are matched against all of the files.
+        files_by_ancestor_dir = _files_by_ancestor_dir(sources_list)
         for candidate_tgt, bfa in zip(candidate_tgts, build_file_addresses):
-            matching_files = set(
-                candidate_tgt.get(SourcesField).filespec_matcher.matches(list(sources_set))
-            )
+            candidate_files = files_by_ancestor_dir.get(candidate_tgt.address.spec_path)
+            if candidate_files:
+                matching_files = set(
+                    candidate_tgt.get(SourcesField).filespec_matcher.matches(candidate_files)
+                )
+            else:
+                matching_files = set()
             is_primary = bool(matching_files)
 
             # Also consider secondary ownership, meaning it's not a `SourcesField` field with
@@ -997,9 +1033,7 @@ async def find_owners(
                 if isinstance(field, SecondaryOwnerMixin)
             )
             for secondary_owner_field in secondary_owner_fields:
-                matching_files.update(
-                    secondary_owner_field.filespec_matcher.matches(list(sources_set))
-                )
+                matching_files.update(secondary_owner_field.filespec_matcher.matches(sources_list))
 
             if not matching_files and not (
                 owners_request.match_if_owning_build_file_included_in_sources
@@ -27,6 +27,7 @@ from pants.engine.internals.graph import (
     _DependencyMapping,
     _DependencyMappingRequest,
     _TargetParametrizations,
+    _files_by_ancestor_dir,
 )
 from pants.engine.internals.native_engine import AddressParseException
 from pants.engine.internals.parametrize import Parametrize, _TargetParametrizationsRequest
@@ -611,6 +612,39 @@ def test_dep_cycle_indirect(transitive_targets_rule_runner: RuleRunner) -> None:
     )
 
 
+def test_dep_cycle_via_file_address(transitive_targets_rule_runner: RuleRunner) -> None:
+    # The reported path includes how the cycle was reached from the root, including any file
+    # addresses on the way.
+    transitive_targets_rule_runner.write_files(
+        {
+            "f.txt": "",
+            "BUILD": dedent(
+                """\
+                target(name='root', dependencies=['f.txt:gen'])
+                generator(name='gen', sources=['f.txt'], dependencies=[':t1'])
+                target(name='t1', dependencies=[':t2'])
+                target(name='t2', dependencies=[':t1'])
+                """
+            ),
+        }
+    )
+    with pytest.raises(ExecutionError) as e:
+        transitive_targets_rule_runner.request(
+            TransitiveTargets,
+            [TransitiveTargetsRequest([Address("", target_name="root")])],
+        )
+    (cycle_exception,) = e.value.wrapped_exceptions
+    assert isinstance(cycle_exception, CycleException)
+    assert cycle_exception.subject == Address("", target_name="t1")
+    assert cycle_exception.path == (
+        Address("", target_name="root"),
+        Address("", relative_file_path="f.txt", target_name="gen"),
+        Address("", target_name="t1"),
+        Address("", target_name="t2"),
+        Address("", target_name="t1"),
+    )
+
+
 def test_dep_no_cycle_indirect(transitive_targets_rule_runner: RuleRunner) -> None:
     transitive_targets_rule_runner.write_files(
         {
@@ -835,6 +869,16 @@ def assert_owners(
     assert set(result) == expected
 
 
+def test_files_by_ancestor_dir() -> None:
+    index = _files_by_ancestor_dir(["a/b/f1.txt", "a/f2.txt", "c/f3.txt", "f4.txt"])
+    assert index == {
+        "": ["a/b/f1.txt", "a/f2.txt", "c/f3.txt", "f4.txt"],
+        "a": ["a/b/f1.txt", "a/f2.txt"],
+        "a/b": ["a/b/f1.txt"],
+        "c": ["c/f3.txt"],
+    }
+
+
 def test_owners_source_file_does_not_exist(owners_rule_runner: RuleRunner) -> None:
     """Test when a source file belongs to a target, even though the file does not actually exist.
 
@@ -707,6 +707,7 @@ def graph_visualize(scheduler: PyScheduler, session: PySession, path: str) -> No
 def graph_invalidate_paths(scheduler: PyScheduler, paths: Iterable[str]) -> int: ...
 def graph_invalidate_all_paths(scheduler: PyScheduler) -> int: ...
 def graph_invalidate_all(scheduler: PyScheduler) -> None: ...
+def graph_evict_all(scheduler: PyScheduler) -> int: ...
 def check_invalidation_watcher_liveness(scheduler: PyScheduler) -> None: ...
 def validate_reachability(scheduler: PyScheduler) -> None: ...
 def rule_graph_consumed_types(
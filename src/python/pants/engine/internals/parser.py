@@ -3,17 +3,23 @@
 
 from __future__ import annotations
 
+import hashlib
+import importlib.util
 import inspect
 import itertools
 import logging
+import marshal
+import os
 import re
 import threading
+import time
 import tokenize
 from dataclasses import dataclass
 from difflib import get_close_matches
 from io import StringIO
 from pathlib import PurePath
-from typing import Any, Callable, Iterable, Mapping, TypeVar
+from types import CodeType
+from typing import Any, Callable, Iterable, Mapping, NamedTuple, TypeVar
 
 from pants.base.deprecated import warn_or_error
 from pants.base.exceptions import MappingError
@@ -25,6 +31,7 @@ from pants.engine.internals.dep_rules import BuildFileDependencyRulesParserState
 from pants.engine.internals.target_adaptor import TargetAdaptor
 from pants.engine.target import Field, ImmutableValue, RegisteredTargetTypes
 from pants.engine.unions import UnionMembership
+from pants.util.dirutil import safe_concurrent_creation, safe_rmtree, touch
 from pants.util.docutil import doc_url
 from pants.util.frozendict import FrozenDict
 from pants.util.memo import memoized_property
@@ -292,6 +299,60 @@ class Registrar:
         return resolve_field_default
 
 
+# Persisted compiled BUILD files which have not been used for this long are garbage collected, as
+# are the least recently used entries beyond the maximum total size. Collection runs at most once
+# per interval, when a Parser is created.
+_PERSISTED_CODE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60
+_PERSISTED_CODE_MAX_SIZE_BYTES = 256 * 1024 * 1024
+_PERSISTED_CODE_GC_INTERVAL_SECONDS = 24 * 60 * 60
+_PERSISTED_CODE_GC_MARKER = ".last_gc"
+
+
+class CodeCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+    persisted_hits: int
+
+
+def garbage_collect_persisted_code(
+    code_cache_dir: str, *, current_dir: str, max_age_seconds: float, max_size_bytes: int
+) -> None:
+    """Delete the persisted compiled BUILD files which have not been used within the maximum age,
+    and then the least recently used files until the total size is within the maximum.
+
+    The directories for other bytecode magic numbers than `current_dir`, which were written by other
+    interpreter versions, are deleted entirely.
+    """
+    with os.scandir(code_cache_dir) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False) and entry.path != current_dir:
+                safe_rmtree(entry.path)
+
+    files: list[tuple[float, int, str]] = []
+    for root, _, filenames in os.walk(current_dir):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+    # Delete the least recently used files first.
+    files.sort()
+    oldest_mtime_to_keep = time.time() - max_age_seconds
+    total_size = sum(size for _, size, _ in files)
+    for mtime, size, path in files:
+        if mtime >= oldest_mtime_to_keep and total_size <= max_size_bytes:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total_size -= size
+
+
 class Parser:
     def __init__(
         self,
@@ -301,6 +362,7 @@ class Parser:
         union_membership: UnionMembership,
         object_aliases: BuildFileAliases,
         ignore_unrecognized_symbols: bool,
+        code_cache_dir: str | None = None,
     ) -> None:
         self._symbols_info, self._parse_state = self._generate_symbols(
             build_root,
@@ -309,6 +371,25 @@ class Parser:
             union_membership,
         )
         self.ignore_unrecognized_symbols = ignore_unrecognized_symbols
+        # N.B.: The Parser is a singleton for the lifetime of the scheduler, so in pantsd this cache
+        # lets re-parses of unchanged BUILD files (e.g. due to a changed ancestor `__defaults__`)
+        # skip compiling. It is keyed by filepath, since that is embedded in the code object, so an
+        # edited BUILD file replaces its stale entry.
+        self._code_cache: dict[str, tuple[bytes, CodeType]] = {}
+        self._code_cache_hits = 0
+        self._code_cache_misses = 0
+        # If set, compiled code is additionally persisted to this directory, so that a new
+        # scheduler (e.g. after pantsd restarts) can skip compiling unchanged BUILD files. Entries
+        # are keyed by the filepath and content, and are segregated by the bytecode magic number
+        # since marshalled code is only loadable by the interpreter version which produced it.
+        self._persisted_code_dir = (
+            os.path.join(code_cache_dir, importlib.util.MAGIC_NUMBER.hex())
+            if code_cache_dir
+            else None
+        )
+        self._code_cache_persisted_hits = 0
+        if code_cache_dir and self._persisted_code_dir:
+            self._maybe_garbage_collect_persisted_code(code_cache_dir, self._persisted_code_dir)
 
     @staticmethod
     def _generate_symbols(
@@ -360,6 +441,80 @@ class Parser:
     def symbols(self) -> FrozenDict[str, Any]:
         return self._symbols_info.symbols
 
+    def code_cache_info(self) -> CodeCacheInfo:
+        return CodeCacheInfo(
+            hits=self._code_cache_hits,
+            misses=self._code_cache_misses,
+            currsize=len(self._code_cache),
+            persisted_hits=self._code_cache_persisted_hits,
+        )
+
+    def _compile(self, filepath: str, build_file_content: str) -> CodeType:
+        content_digest = hashlib.sha256(build_file_content.encode()).digest()
+        cached = self._code_cache.get(filepath)
+        if cached is not None and cached[0] == content_digest:
+            self._code_cache_hits += 1
+            return cached[1]
+        self._code_cache_misses += 1
+
+        persisted_code_path = None
+        if self._persisted_code_dir:
+            key = hashlib.sha256(filepath.encode() + b"\0" + content_digest).hexdigest()
+            persisted_code_path = os.path.join(self._persisted_code_dir, key[:2], key[2:])
+        code = self._load_persisted_code(persisted_code_path) if persisted_code_path else None
+        if code is None:
+            code = compile(build_file_content, filepath, "exec", dont_inherit=True)
+            if persisted_code_path:
+                self._persist_code(persisted_code_path, code)
+        else:
+            self._code_cache_persisted_hits += 1
+
+        self._code_cache[filepath] = (content_digest, code)
+        return code
+
+    @staticmethod
+    def _load_persisted_code(path: str) -> CodeType | None:
+        try:
+            with open(path, "rb") as f:
+                code = marshal.load(f)
+            # Record the use of the entry, for garbage collection.
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            logger.debug(f"Ignoring unreadable compiled BUILD file at {path}: {e}")
+            return None
+        return code if isinstance(code, CodeType) else None
+
+    @staticmethod
+    def _maybe_garbage_collect_persisted_code(code_cache_dir: str, persisted_code_dir: str) -> None:
+        marker = os.path.join(code_cache_dir, _PERSISTED_CODE_GC_MARKER)
+        try:
+            if time.time() - os.path.getmtime(marker) < _PERSISTED_CODE_GC_INTERVAL_SECONDS:
+                return
+        except OSError:
+            pass
+        try:
+            touch(marker)
+        except OSError as e:
+            logger.debug(f"Failed to garbage collect compiled BUILD files in {code_cache_dir}: {e}")
+            return
+        garbage_collect_persisted_code(
+            code_cache_dir,
+            current_dir=persisted_code_dir,
+            max_age_seconds=_PERSISTED_CODE_MAX_AGE_SECONDS,
+            max_size_bytes=_PERSISTED_CODE_MAX_SIZE_BYTES,
+        )
+
+    @staticmethod
+    def _persist_code(path: str, code: CodeType) -> None:
+        try:
+            with safe_concurrent_creation(path) as tmp_path:
+                with open(tmp_path, "wb") as f:
+                    marshal.dump(code, f)
+        except OSError as e:
+            logger.debug(f"Failed to persist compiled BUILD file to {path}: {e}")
+
     def parse(
         self,
         filepath: str,
@@ -385,11 +540,12 @@ class Parser:
             **extra_symbols.symbols,
         }
 
+        code = self._compile(filepath, build_file_content)
+
         if self.ignore_unrecognized_symbols:
             defined_symbols = set()
             while True:
                 try:
-                    code = compile(build_file_content, filepath, "exec", dont_inherit=True)
                     exec(code, global_symbols)
                 except NameError as e:
                     bad_symbol = _extract_symbol_from_name_error(e)
@@ -416,7 +572,6 @@ class Parser:
             return self._parse_state.parsed_targets()
 
         try:
-            code = compile(build_file_content, filepath, "exec", dont_inherit=True)
             exec(code, global_symbols)
         except NameError as e:
             valid_symbols = sorted(s for s in global_symbols.keys() if s != "__builtins__")
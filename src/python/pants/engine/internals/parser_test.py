@@ -3,6 +3,10 @@
 
 from __future__ import annotations
 
+import os
+import time
+from pathlib import Path
+
 import pytest
 
 from pants.build_graph.build_file_aliases import BuildFileAliases
@@ -14,6 +18,7 @@ from pants.engine.internals.parser import (
     ParseError,
     Parser,
     _extract_symbol_from_name_error,
+    garbage_collect_persisted_code,
 )
 from pants.engine.target import RegisteredTargetTypes
 from pants.engine.unions import UnionMembership
@@ -125,3 +130,104 @@ def test_unrecognized_symbol(defaults_parser_state: BuildFileDefaultsParserState
 @pytest.mark.parametrize("symbol", ["a", "bad", "BAD", "a___b_c", "a231", "áç"])
 def test_extract_symbol_from_name_error(symbol: str) -> None:
     assert _extract_symbol_from_name_error(NameError(f"name '{symbol}' is not defined")) == symbol
+
+
+def test_compiled_code_cache(defaults_parser_state: BuildFileDefaultsParserState) -> None:
+    parser = Parser(
+        build_root="",
+        registered_target_types=RegisteredTargetTypes({"tgt": GenericTarget}),
+        union_membership=UnionMembership({}),
+        object_aliases=BuildFileAliases(),
+        ignore_unrecognized_symbols=False,
+    )
+
+    def parse(filepath: str, content: str) -> list[str]:
+        return [
+            str(adaptor.name)
+            for adaptor in parser.parse(
+                filepath,
+                content,
+                BuildFilePreludeSymbols(FrozenDict(), ()),
+                EnvironmentVars({}),
+                False,
+                defaults_parser_state,
+                dependents_rules=None,
+                dependencies_rules=None,
+            )
+        ]
+
+    assert parse("a/BUILD", "tgt(name='a')") == ["a"]
+    assert parse("a/BUILD", "tgt(name='a')") == ["a"]
+    assert parse("b/BUILD", "tgt(name='a')") == ["a"]
+    assert parser.code_cache_info() == (1, 2, 2, 0)
+
+    assert parse("a/BUILD", "tgt(name='edited')") == ["edited"]
+    assert parser.code_cache_info() == (1, 3, 2, 0)
+
+
+def test_persisted_compiled_code_cache(
+    tmp_path, defaults_parser_state: BuildFileDefaultsParserState
+) -> None:
+    def create_parser() -> Parser:
+        return Parser(
+            build_root="",
+            registered_target_types=RegisteredTargetTypes({"tgt": GenericTarget}),
+            union_membership=UnionMembership({}),
+            object_aliases=BuildFileAliases(),
+            ignore_unrecognized_symbols=False,
+            code_cache_dir=str(tmp_path),
+        )
+
+    def parse(parser: Parser, filepath: str, content: str) -> list[str]:
+        return [
+            str(adaptor.name)
+            for adaptor in parser.parse(
+                filepath,
+                content,
+                BuildFilePreludeSymbols(FrozenDict(), ()),
+                EnvironmentVars({}),
+                False,
+                defaults_parser_state,
+                dependents_rules=None,
+                dependencies_rules=None,
+            )
+        ]
+
+    first_parser = create_parser()
+    assert parse(first_parser, "a/BUILD", "tgt(name='a')") == ["a"]
+    assert first_parser.code_cache_info() == (0, 1, 1, 0)
+
+    # A new parser (e.g. in a restarted pantsd) loads the persisted code for unchanged content.
+    second_parser = create_parser()
+    assert parse(second_parser, "a/BUILD", "tgt(name='a')") == ["a"]
+    assert parse(second_parser, "b/BUILD", "tgt(name='a')") == ["a"]
+    assert parse(second_parser, "a/BUILD", "tgt(name='edited')") == ["edited"]
+    assert second_parser.code_cache_info() == (0, 3, 2, 1)
+
+
+def test_garbage_collect_persisted_code(tmp_path) -> None:
+    current_dir = tmp_path / "current"
+    now = time.time()
+
+    def write(path: Path, size: int, age: float) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * size)
+        os.utime(path, (now - age, now - age))
+        return path
+
+    stale = write(current_dir / "aa" / "stale", 10, age=100)
+    least_recent = write(current_dir / "bb" / "least_recent", 10, age=30)
+    recent = write(current_dir / "bb" / "recent", 10, age=20)
+    most_recent = write(current_dir / "cc" / "most_recent", 10, age=10)
+    other_interpreter = write(tmp_path / "other" / "aa" / "entry", 10, age=0)
+
+    garbage_collect_persisted_code(
+        str(tmp_path), current_dir=str(current_dir), max_age_seconds=50, max_size_bytes=20
+    )
+    # The stale entry exceeds the maximum age, and then the least recently used entry exceeds the
+    # maximum size.
+    assert not stale.exists()
+    assert not least_recent.exists()
+    assert recent.exists()
+    assert most_recent.exists()
+    assert not other_interpreter.parent.parent.exists()
@@ -142,6 +142,7 @@ class Scheduler:
         self.include_trace_on_error = include_trace_on_error
         self._visualize_to_dir = visualize_to_dir
         self._visualize_run_count = 0
+        self._graph_evictions = 0
         # Validate and register all provided and intrinsic tasks.
         rule_index = RuleIndex.create(rules)
         tasks = register_rules(rule_index, union_membership)
@@ -294,6 +295,23 @@ class Scheduler:
     def invalidate_all(self) -> None:
         native_engine.graph_invalidate_all(self.py_scheduler)
 
+    def evict_graph(self) -> int:
+        """Drop the memoized values of all nodes in the graph which are not running, in order to
+        reclaim memory, and return the number of nodes which were evicted.
+
+        Unlike `invalidate_all`, which keeps the previous value of each node in order to be able to
+        clean it rather than re-run it, this drops the previous values too. And unlike restarting
+        the daemon, this retains the Scheduler itself (including its rule graph and store).
+        """
+        evicted = native_engine.graph_evict_all(self.py_scheduler)
+        self._graph_evictions += 1
+        return evicted
+
+    @property
+    def graph_evictions(self) -> int:
+        """The number of times that `evict_graph` has been called over the Scheduler's lifetime."""
+        return self._graph_evictions
+
     def check_invalidation_watcher_liveness(self) -> None:
         native_engine.check_invalidation_watcher_liveness(self.py_scheduler)
 
@@ -439,7 +457,9 @@ class SchedulerSession:
 
     def metrics(self) -> dict[str, int]:
         """Returns metrics for this SchedulerSession as a dict of metric name to metric value."""
-        return native_engine.scheduler_metrics(self.py_scheduler, self.py_session)
+        metrics = native_engine.scheduler_metrics(self.py_scheduler, self.py_session)
+        metrics["graph_evictions"] = self._scheduler.graph_evictions
+        return metrics
 
     def live_items(self) -> tuple[list[Any], dict[str, tuple[int, int]]]:
         """Return all Python objects held by the Scheduler."""
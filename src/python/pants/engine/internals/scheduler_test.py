@@ -1,7 +1,9 @@
 # Copyright 2015 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+import gc
 import re
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from textwrap import dedent
@@ -57,6 +59,43 @@ def test_use_params() -> None:
         rule_runner.request(str, [a])
 
 
+@dataclass(frozen=True)
+class Retained:
+    s: str
+
+
+@rule
+def create_retained(a: A) -> Retained:
+    return Retained(str(a))
+
+
+def test_evict_graph() -> None:
+    rule_runner = RuleRunner(
+        rules=[create_retained, QueryRule(Retained, [A])],
+        inherent_environment=None,
+    )
+    scheduler = rule_runner.scheduler.scheduler
+
+    retained = weakref.ref(rule_runner.request(Retained, [A()]))
+    gc.collect()
+    assert retained() == Retained(str(A()))
+
+    # Invalidation keeps the previous value of each node, so that it can be cleaned rather than
+    # re-run.
+    scheduler.invalidate_all()
+    gc.collect()
+    assert retained() is not None
+
+    # Whereas eviction releases it.
+    assert scheduler.evict_graph() > 0
+    assert scheduler.graph_evictions == 1
+    gc.collect()
+    assert retained() is None
+
+    # And the evicted nodes are recomputed when requested again.
+    assert rule_runner.request(Retained, [A()]) == Retained(str(A()))
+
+
 @dataclass(frozen=True)
 class C:
     pass
@@ -5,9 +5,11 @@ from __future__ import annotations
 
 import logging
 import threading
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Callable, Iterable, Sequence, Tuple
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, NamedTuple, Sequence, Tuple
 
 from pants.base.specs import Specs
 from pants.core.util_rules.environments import determine_bootstrap_environment
@@ -15,6 +17,7 @@ from pants.engine.addresses import Addresses
 from pants.engine.environment import EnvironmentName
 from pants.engine.fs import Digest, DigestContents, FileDigest, Snapshot
 from pants.engine.internals.native_engine import PyThreadLocals
+from pants.engine.internals.parser import CodeCacheInfo, Parser
 from pants.engine.internals.scheduler import SchedulerSession, Workunit
 from pants.engine.internals.selectors import Params
 from pants.engine.rules import Get, MultiGet, QueryRule, collect_rules, rule
@@ -67,6 +70,14 @@ class StreamingWorkunitContext:
     _run_tracker: RunTracker
     _specs: Specs
     _options_bootstrapper: OptionsBootstrapper
+    # Metrics about the WorkunitsCallbacks themselves, which are recorded by their threads via
+    # `_record_callback_metric`.
+    _callback_metrics: dict[str, int] = field(default_factory=dict, compare=False)
+    _callback_metrics_lock: threading.Lock = field(default_factory=threading.Lock, compare=False)
+    # The Parser for BUILD files, and its code cache stats at the start of the run, so that the
+    # metrics for the run can exclude earlier runs in the same pantsd.
+    _build_file_parser: Parser | None = None
+    _build_file_code_cache_baseline: CodeCacheInfo | None = None
 
     @property
     def run_tracker(self) -> RunTracker:
@@ -90,8 +101,45 @@ class StreamingWorkunitContext:
         return self._scheduler.ensure_remote_has_recursive(digests)
 
     def get_metrics(self) -> dict[str, int]:
-        """Invoke the internal get_metrics function, which returns metrics for the Session."""
-        return self._scheduler.get_metrics()
+        """Invoke the internal get_metrics function, which returns metrics for the Session.
+
+        This additionally includes `streaming_workunits_callback_<index>_*` metrics for each
+        registered WorkunitsCallback (by its index in the registered callbacks): the number of calls
+        made to it, its total and maximum latency, and the number of workunits which were dropped
+        because it was falling behind.
+
+        If the BUILD file Parser was provided, it also includes `build_file_code_cache_*` metrics
+        for the BUILD files parsed during the run: the number whose compiled code was reused from
+        memory (`hits`) or not (`misses`), and how many of those misses were loaded from the
+        compiled code persisted by an earlier scheduler (`persisted_hits`).
+        """
+        with self._callback_metrics_lock:
+            callback_metrics = dict(self._callback_metrics)
+        return {
+            **self._scheduler.get_metrics(),
+            **callback_metrics,
+            **self._build_file_code_cache_metrics(),
+        }
+
+    def _record_callback_metric(self, name: str, value: int, *, maximum: bool = False) -> None:
+        """Add the value to the named callback metric, or with `maximum=True`, replace it with the
+        value if the value is larger."""
+        with self._callback_metrics_lock:
+            previous = self._callback_metrics.get(name, 0)
+            self._callback_metrics[name] = max(previous, value) if maximum else previous + value
+
+    def _build_file_code_cache_metrics(self) -> dict[str, int]:
+        if self._build_file_parser is None:
+            return {}
+        info = self._build_file_parser.code_cache_info()
+        baseline = self._build_file_code_cache_baseline
+        if baseline is not None:
+            info = CodeCacheInfo(*(current - previous for current, previous in zip(info, baseline)))
+        return {
+            "build_file_code_cache_hits": info.hits,
+            "build_file_code_cache_misses": info.misses,
+            "build_file_code_cache_persisted_hits": info.persisted_hits,
+        }
 
     def get_observation_histograms(self) -> dict[str, Any]:
         """Invoke the internal get_observation_histograms function, which serializes histograms
@@ -237,6 +285,7 @@ class StreamingWorkunitHandler:
         report_interval_seconds: float,
         allow_async_completion: bool,
         max_workunit_verbosity: LogLevel,
+        build_file_parser: Parser | None = None,
     ) -> None:
         scheduler = scheduler.isolated_shallow_clone("streaming_workunit_handler_session")
         self.callbacks = callbacks
@@ -245,6 +294,10 @@ class StreamingWorkunitHandler:
             _run_tracker=run_tracker,
             _specs=specs,
             _options_bootstrapper=options_bootstrapper,
+            _build_file_parser=build_file_parser,
+            _build_file_code_cache_baseline=(
+                build_file_parser.code_cache_info() if build_file_parser else None
+            ),
         )
         self.thread_runner = (
             _InnerHandler(
@@ -274,7 +327,89 @@ class StreamingWorkunitHandler:
             self.thread_runner.join()
 
 
+class _WorkunitsBatch(NamedTuple):
+    started_workunits: tuple[Workunit, ...]
+    completed_workunits: tuple[Workunit, ...]
+    finished: bool
+
+
+class _CallbackRunner(threading.Thread):
+    """Calls a single WorkunitsCallback with batches of workunits on a dedicated thread.
+
+    At most `max_pending_workunits` workunits are queued for the callback: if it falls further
+    behind than that, the workunits of new batches are dropped (and counted in its
+    `dropped_workunits` metric), so that a slow callback neither blocks the other callbacks nor
+    accumulates unbounded memory. The final batch is always delivered.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        callback: WorkunitsCallback,
+        context: StreamingWorkunitContext,
+        thread_locals: PyThreadLocals,
+        max_pending_workunits: int,
+    ) -> None:
+        super().__init__(daemon=True)
+        self.callback = callback
+        self.context = context
+        self.thread_locals = thread_locals
+        self.max_pending_workunits = max_pending_workunits
+        self._pending: deque[_WorkunitsBatch] = deque()
+        self._pending_workunits = 0
+        self._condition = threading.Condition()
+        self._metrics_prefix = f"streaming_workunits_callback_{index}"
+
+    def _record_metric(self, name: str, value: int, *, maximum: bool = False) -> None:
+        self.context._record_callback_metric(
+            f"{self._metrics_prefix}_{name}", value, maximum=maximum
+        )
+
+    def submit(self, batch: _WorkunitsBatch) -> None:
+        workunits = len(batch.started_workunits) + len(batch.completed_workunits)
+        with self._condition:
+            if self._pending_workunits + workunits > self.max_pending_workunits:
+                self._record_metric("dropped_workunits", workunits)
+                if not batch.finished:
+                    return
+                batch, workunits = _WorkunitsBatch((), (), finished=True), 0
+            self._pending.append(batch)
+            self._pending_workunits += workunits
+            self._condition.notify()
+
+    def run(self) -> None:
+        self.thread_locals.set_for_current_thread()
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                batch = self._pending.popleft()
+                self._pending_workunits -= len(batch.started_workunits) + len(
+                    batch.completed_workunits
+                )
+
+            start = time.monotonic()
+            self.callback(
+                started_workunits=batch.started_workunits,
+                completed_workunits=batch.completed_workunits,
+                finished=batch.finished,
+                context=self.context,
+            )
+            latency_ms = int((time.monotonic() - start) * 1000)
+            self._record_metric("calls", 1)
+            self._record_metric("total_latency_ms", latency_ms)
+            self._record_metric("max_latency_ms", latency_ms, maximum=True)
+            if batch.finished:
+                return
+
+
 class _InnerHandler(threading.Thread):
+    # The maximum number of workunits to queue for each callback before dropping workunits.
+    MAX_PENDING_WORKUNITS = 100_000
+    # The maximum time to wait for the polling thread, and then for each callback which cannot
+    # finish asynchronously, at the end of a run.
+    END_TIMEOUT_SECONDS = 60.0
+
     def __init__(
         self,
         scheduler: Any,
@@ -291,24 +426,35 @@ class _InnerHandler(threading.Thread):
         self.report_interval = report_interval
         self.callbacks = callbacks
         self.max_workunit_verbosity = max_workunit_verbosity
-        # TODO: Have a thread per callback so that some callbacks can always finish async even
-        #  if others must be finished synchronously.
-        self.block_until_complete = not allow_async_completion or any(
-            callback.can_finish_async is False for callback in self.callbacks
-        )
         # Get the parent thread's thread locals. Note that this thread has not yet started
         # as we are only in the constructor.
         self.thread_locals = PyThreadLocals.get_for_current_thread()
+        # Each callback runs in its own thread, so that a slow callback does not delay the others,
+        # and so that callbacks which can finish async do so even if others must be waited for.
+        self.callback_runners = tuple(
+            _CallbackRunner(
+                index, callback, context, self.thread_locals, self.MAX_PENDING_WORKUNITS
+            )
+            for index, callback in enumerate(self.callbacks)
+        )
+        self.blocking_callback_runners = tuple(
+            runner
+            for runner in self.callback_runners
+            if not allow_async_completion or runner.callback.can_finish_async is False
+        )
+        self._poll_lock = threading.Lock()
 
     def poll_workunits(self, *, finished: bool) -> None:
-        workunits = self.scheduler.poll_workunits(self.max_workunit_verbosity)
-        for callback in self.callbacks:
-            callback(
-                started_workunits=workunits["started"],
-                completed_workunits=workunits["completed"],
-                finished=finished,
-                context=self.context,
-            )
+        with self._poll_lock:
+            workunits = self.scheduler.poll_workunits(self.max_workunit_verbosity)
+            batch = _WorkunitsBatch(workunits["started"], workunits["completed"], finished)
+            for runner in self.callback_runners:
+                runner.submit(batch)
+
+    def start(self) -> None:
+        for runner in self.callback_runners:
+            runner.start()
+        super().start()
 
     def run(self) -> None:
         # First, set the thread's thread locals to the parent thread's in order to propagate the
@@ -317,23 +463,45 @@ class _InnerHandler(threading.Thread):
         while not self.stop_request.is_set():
             self.poll_workunits(finished=False)
             self.stop_request.wait(timeout=self.report_interval)
-        else:
-            # Make one final call. Note that this may run after the Pants run has already
-            # completed, depending on whether the thread was joined or not.
-            self.poll_workunits(finished=True)
+
+    def join(self, timeout: float | None = END_TIMEOUT_SECONDS) -> None:
+        """Wait for the polling thread, and for every callback to have handled the final batch."""
+        self._join_threads((self, *self.callback_runners), timeout)
 
     def end(self) -> None:
         self.stop_request.set()
-        if self.block_until_complete:
+        # NB: The final batch is sent from the calling thread (rather than by the polling thread
+        # once it observes the stop request), so that it is sent even if the polling thread died.
+        self._join_threads((self,), self.END_TIMEOUT_SECONDS)
+        self.poll_workunits(finished=True)
+        if self.blocking_callback_runners:
             logger.debug(
-                "Async completion is disabled: waiting for workunit callbacks to complete..."
+                "Async completion is disabled for some workunit callbacks: waiting for them to "
+                "complete..."
             )
-            super().join()
+            self._join_threads(self.blocking_callback_runners, self.END_TIMEOUT_SECONDS)
         else:
             logger.debug(
                 "Async completion is enabled: workunit callbacks will complete in the background."
             )
 
+    @staticmethod
+    def _join_threads(threads: Iterable[threading.Thread], timeout: float | None) -> None:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in threads:
+            if thread is threading.current_thread() or not thread.is_alive():
+                continue
+            # NB: `Thread.join` is called directly, since `_InnerHandler` overrides `join` to also
+            # join its callback runners.
+            threading.Thread.join(
+                thread, None if deadline is None else max(0.0, deadline - time.monotonic())
+            )
+            if thread.is_alive():
+                logger.warning(
+                    f"Timed out after {timeout} seconds waiting for workunit callbacks to complete."
+                )
+                return
+
 
 def rules():
     return [
@@ -18,7 +18,6 @@ from dataclasses import dataclass
 from enum import Enum
 from pathlib import PurePath
 from typing import (
-    AbstractSet,
     Any,
     Callable,
     ClassVar,
@@ -241,6 +240,101 @@ class FieldDefaults:
 _F = TypeVar("_F", bound=Field)
 
 
+@final
+class _FieldLayout:
+    """The registered field types of a Target type, shared by all instances of that type.
+
+    Instances store their fields in a tuple, in the order of `field_types`. Lookups of field types
+    which are not registered directly (i.e. superclasses of registered fields) are resolved to a
+    slot once, and then memoized.
+    """
+
+    __slots__ = ("field_types", "_exact_slots", "_resolved_slots")
+
+    def __init__(self, field_types: Iterable[type[Field]]) -> None:
+        self.field_types: tuple[type[Field], ...] = tuple(field_types)
+        self._exact_slots: dict[type[Field], int] = {
+            field_type: slot for slot, field_type in enumerate(self.field_types)
+        }
+        self._resolved_slots: dict[type[Field], int | None] = dict(self._exact_slots)
+
+    def exact_slot(self, field_type: type[Field]) -> int:
+        return self._exact_slots[field_type]
+
+    def slot(self, requested_field: type[Field]) -> int | None:
+        """The slot of the requested field, or of the first registered subclass of it."""
+        try:
+            return self._resolved_slots[requested_field]
+        except KeyError:
+            slot = next(
+                (
+                    slot
+                    for slot, field_type in enumerate(self.field_types)
+                    if issubclass(field_type, requested_field)
+                ),
+                None,
+            )
+            self._resolved_slots[requested_field] = slot
+            return slot
+
+
+@final
+class _FieldValues(Mapping["type[Field]", Field]):
+    """A read-only view of the fields of a Target, by their registered type."""
+
+    __slots__ = ("_layout", "_fields")
+
+    def __init__(self, layout: _FieldLayout, fields: tuple[Field, ...]) -> None:
+        self._layout = layout
+        self._fields = fields
+
+    def __getitem__(self, field_type: type[Field]) -> Field:
+        return self._fields[self._layout.exact_slot(field_type)]
+
+    def __iter__(self) -> Iterator[type[Field]]:
+        return iter(self._layout.field_types)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __hash__(self) -> int:
+        return hash(self._fields)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+def _create_field(field_type: type[Field], raw_value: Any, address: Address) -> Field:
+    return field_type(raw_value, address)
+
+
+@final
+class _SharedFields:
+    """Field instances shared between targets which are created from the same raw values.
+
+    Target generators create many targets from a single template of raw values, so the fields of
+    the generated targets can be hydrated once and shared, rather than duplicated per target. Only
+    fields which do not retain their `Address` (i.e. which are not `AsyncFieldMixin`s) are shared.
+    """
+
+    __slots__ = ("_fields",)
+
+    def __init__(self) -> None:
+        # Keyed by the identity of the raw value, which is retained to keep that identity stable.
+        self._fields: dict[tuple[type[Field], int], tuple[Any, Field]] = {}
+
+    def create(self, field_type: type[Field], raw_value: Any, address: Address) -> Field:
+        if issubclass(field_type, AsyncFieldMixin):
+            return field_type(raw_value, address)
+        key = (field_type, id(raw_value))
+        entry = self._fields.get(key)
+        if entry is not None and entry[0] is raw_value:
+            return entry[1]
+        field = field_type(raw_value, address)
+        self._fields[key] = (raw_value, field)
+        return field
+
+
 @dataclass(frozen=True)
 class Target:
     """A Target represents an addressable set of metadata.
@@ -263,7 +357,8 @@ class Target:
 
     # These get calculated in the constructor
     address: Address
-    field_values: FrozenDict[type[Field], Field]
+    _field_layout: _FieldLayout
+    _fields: tuple[Field, ...]
     residence_dir: str
     name_explicitly_set: bool
     description_of_origin: str
@@ -282,6 +377,7 @@ class Target:
         residence_dir: str | None = None,
         ignore_unrecognized_fields: bool = False,
         description_of_origin: str | None = None,
+        _shared_fields: _SharedFields | None = None,
     ) -> None:
         """Create a target.
 
@@ -323,14 +419,18 @@ class Target:
         )
         object.__setattr__(self, "name_explicitly_set", name_explicitly_set)
         try:
+            field_layout = self._class_field_layout(union_membership)
+            object.__setattr__(self, "_field_layout", field_layout)
             object.__setattr__(
                 self,
-                "field_values",
+                "_fields",
                 self._calculate_field_values(
                     unhydrated_values,
                     address,
+                    field_layout,
                     union_membership,
                     ignore_unrecognized_fields=ignore_unrecognized_fields,
+                    shared_fields=_shared_fields,
                 ),
             )
 
@@ -345,12 +445,15 @@ class Target:
         self,
         unhydrated_values: dict[str, Any],
         address: Address,
+        field_layout: _FieldLayout,
         # See `__init__`.
         union_membership: UnionMembership | None,
         *,
         ignore_unrecognized_fields: bool,
-    ) -> FrozenDict[type[Field], Field]:
-        all_field_types = self.class_field_types(union_membership)
+        shared_fields: _SharedFields | None,
+    ) -> tuple[Field, ...]:
+        all_field_types = field_layout.field_types
+        create_field = shared_fields.create if shared_fields is not None else _create_field
         field_values = {}
         aliases_to_field_types = self._get_field_aliases_to_field_types(all_field_types)
 
@@ -373,18 +476,22 @@ class Target:
                     f"the target type `{self.alias}`: {sorted(valid_aliases)}.",
                 )
             field_type = aliases_to_field_types[alias]
-            field_values[field_type] = field_type(value, address)
+            field_values[field_type] = create_field(field_type, value, address)
 
         # For undefined fields, mark the raw value as missing.
-        for field_type in all_field_types:
-            if field_type in field_values:
-                continue
-            field_values[field_type] = field_type(NO_VALUE, address)
-        return FrozenDict(
-            sorted(
-                field_values.items(),
-                key=lambda field_type_to_val_pair: field_type_to_val_pair[0].alias,
-            )
+        return tuple(
+            field_values[field_type]
+            if field_type in field_values
+            else create_field(field_type, NO_VALUE, address)
+            for field_type in all_field_types
+        )
+
+    @final
+    @classmethod
+    @memoized_method
+    def _class_field_layout(cls, union_membership: UnionMembership | None) -> _FieldLayout:
+        return _FieldLayout(
+            sorted(cls.class_field_types(union_membership), key=lambda field_type: field_type.alias)
         )
 
     @final
@@ -399,6 +506,11 @@ class Target:
                 aliases_to_field_types[field_type.deprecated_alias] = field_type
         return aliases_to_field_types
 
+    @final
+    @property
+    def field_values(self) -> Mapping[type[Field], Field]:
+        return _FieldValues(self._field_layout, self._fields)
+
     @final
     @property
     def field_types(self) -> KeysView[Type[Field]]:
@@ -409,7 +521,7 @@ class Target:
         pass
 
     def __repr__(self) -> str:
-        fields = ", ".join(str(field) for field in self.field_values.values())
+        fields = ", ".join(str(field) for field in self._fields)
         return (
             f"{self.__class__}("
             f"address={self.address}, "
@@ -420,21 +532,28 @@ class Target:
         )
 
     def __str__(self) -> str:
-        fields = ", ".join(str(field) for field in self.field_values.values())
+        fields = ", ".join(str(field) for field in self._fields)
         address = f"address=\"{self.address}\"{', ' if fields else ''}"
         return f"{self.alias}({address}{fields})"
 
     def __hash__(self) -> int:
-        return hash((self.__class__, self.address, self.residence_dir, self.field_values))
+        return hash((self.__class__, self.address, self.residence_dir, self._fields))
 
     def __eq__(self, other: Union[Target, Any]) -> bool:
         if not isinstance(other, Target):
             return NotImplemented
-        return (self.__class__, self.address, self.residence_dir, self.field_values) == (
+        return (
+            self.__class__,
+            self.address,
+            self.residence_dir,
+            self._field_layout.field_types,
+            self._fields,
+        ) == (
             other.__class__,
             other.address,
             other.residence_dir,
-            other.field_values,
+            other._field_layout.field_types,
+            other._fields,
         )
 
     @final
@@ -451,39 +570,12 @@ class Target:
 
         return tuple(result)
 
-    @final
-    @classmethod
-    def _find_registered_field_subclass(
-        cls, requested_field: Type[_F], *, registered_fields: Iterable[Type[Field]]
-    ) -> Optional[Type[_F]]:
-        """Check if the Target has registered a subclass of the requested Field.
-
-        This is necessary to allow targets to override the functionality of common fields. For
-        example, you could subclass `Tags` to define `CustomTags` with a different default. At the
-        same time, we still want to be able to call `tgt.get(Tags)`, in addition to
-        `tgt.get(CustomTags)`.
-        """
-        subclass = next(
-            (
-                registered_field
-                for registered_field in registered_fields
-                if issubclass(registered_field, requested_field)
-            ),
-            None,
-        )
-        return subclass
-
     @final
     def _maybe_get(self, field: Type[_F]) -> Optional[_F]:
-        result = self.field_values.get(field, None)
-        if result is not None:
-            return cast(_F, result)
-        field_subclass = self._find_registered_field_subclass(
-            field, registered_fields=self.field_values.keys()
-        )
-        if field_subclass is not None:
-            return cast(_F, self.field_values[field_subclass])
-        return None
+        slot = self._field_layout.slot(field)
+        if slot is None:
+            return None
+        return cast(_F, self._fields[slot])
 
     @final
     def __getitem__(self, field: Type[_F]) -> _F:
@@ -530,22 +622,6 @@ class Target:
             return result
         return field(default_raw_value, self.address)
 
-    @final
-    @classmethod
-    def _has_fields(
-        cls, fields: Iterable[Type[Field]], *, registered_fields: AbstractSet[Type[Field]]
-    ) -> bool:
-        unrecognized_fields = [field for field in fields if field not in registered_fields]
-        if not unrecognized_fields:
-            return True
-        for unrecognized_field in unrecognized_fields:
-            maybe_subclass = cls._find_registered_field_subclass(
-                unrecognized_field, registered_fields=registered_fields
-            )
-            if maybe_subclass is None:
-                return False
-        return True
-
     @final
     def has_field(self, field: Type[Field]) -> bool:
         """Check that this target has registered the requested field.
@@ -564,7 +640,7 @@ class Target:
         custom subclass `CustomTags`, both `tgt.has_fields([Tags])` and
         `python_tgt.has_fields([CustomTags])` will return True.
         """
-        return self._has_fields(fields, registered_fields=self.field_values.keys())
+        return all(self._field_layout.slot(field) is not None for field in fields)
 
     @final
     @classmethod
@@ -596,7 +672,8 @@ class Target:
     ) -> bool:
         """Behaves like `Target.has_fields()`, but works as a classmethod rather than an instance
         method."""
-        return cls._has_fields(fields, registered_fields=cls.class_field_types(union_membership))
+        field_layout = cls._class_field_layout(union_membership)
+        return all(field_layout.slot(field) is not None for field in fields)
 
     @final
     @classmethod
@@ -1231,6 +1308,9 @@ def _generate_file_level_targets(
         else FrozenOrderedSet()
     )
 
+    # The generated targets share the fields which are not overridden per file.
+    shared_fields = _SharedFields()
+
     def gen_tgt(address: Address, full_fp: str, generated_target_fields: dict[str, Any]) -> Target:
         if add_dependencies_on_all_siblings:
             if union_membership and not generated_target_cls.class_has_field(
@@ -1253,6 +1333,7 @@ def _generate_file_level_targets(
             address,
             union_membership=union_membership,
             residence_dir=os.path.dirname(full_fp),
+            _shared_fields=shared_fields,
         )
 
     result = tuple(
@@ -42,6 +42,7 @@ from pants.engine.target import (
     StringSequenceField,
     Target,
     ValidNumbers,
+    _SharedFields,
     generate_file_based_overrides_field_help_message,
     get_shard,
     parse_shard_spec,
@@ -201,6 +202,52 @@ def test_get_field() -> None:
     ).value == (not UnrelatedField.default)
 
 
+def test_field_values() -> None:
+    tgt = FortranTarget({FortranVersion.alias: "dev0"}, Address("", target_name="lib"))
+    other_tgt = FortranTarget({}, Address("", target_name="other"))
+
+    # The fields are ordered by alias.
+    assert list(tgt.field_values) == [FortranExtensions, FortranVersion]
+    assert list(tgt.field_types) == [FortranExtensions, FortranVersion]
+    assert dict(tgt.field_values) == {
+        FortranExtensions: FortranExtensions(None, tgt.address),
+        FortranVersion: FortranVersion("dev0", tgt.address),
+    }
+    assert tgt.field_values != other_tgt.field_values
+    # Only registered types (rather than superclasses of them) are keys.
+    assert StringField not in tgt.field_values
+    assert tgt[StringField] == tgt[FortranVersion]
+
+    # The layout of the fields is shared between instances of the same target type.
+    assert tgt._field_layout is other_tgt._field_layout
+
+
+def test_shared_fields() -> None:
+    shared_fields = _SharedFields()
+    extensions = ["FortranExt1"]
+
+    def create(name: str, version: str) -> FortranTarget:
+        return FortranTarget(
+            {FortranExtensions.alias: extensions, FortranVersion.alias: version},
+            Address("", target_name=name),
+            _shared_fields=shared_fields,
+        )
+
+    tgt1 = create("t1", "dev0")
+    tgt2 = create("t2", "dev1")
+    assert tgt1[FortranExtensions] is tgt2[FortranExtensions]
+    assert tgt1[FortranVersion] is not tgt2[FortranVersion]
+    assert tgt2[FortranVersion].value == "dev1"
+    # Equal raw values which are not the same object are not shared.
+    tgt3 = FortranTarget(
+        {FortranExtensions.alias: ["FortranExt1"]},
+        Address("", target_name="t3"),
+        _shared_fields=shared_fields,
+    )
+    assert tgt3[FortranExtensions] is not tgt1[FortranExtensions]
+    assert tgt3[FortranExtensions] == tgt1[FortranExtensions]
+
+
 def test_field_hydration_is_eager() -> None:
     with pytest.raises(InvalidTargetException) as exc:
         FortranTarget(
@@ -7,6 +7,8 @@ import base64
 import logging
 from collections import Counter
 from dataclasses import dataclass
+from sys import getsizeof
+from typing import Any, Iterable, Iterator, Mapping
 
 from pants.engine.internals.scheduler import Workunit
 from pants.engine.rules import collect_rules, rule
@@ -16,6 +18,7 @@ from pants.engine.streaming_workunit_handler import (
     WorkunitsCallbackFactory,
     WorkunitsCallbackFactoryRequest,
 )
+from pants.engine.target import Field, Target, WrappedTarget
 from pants.engine.unions import UnionRule
 from pants.option.option_types import BoolOption
 from pants.option.subsystem import Subsystem
@@ -51,6 +54,9 @@ class StatsAggregatorSubsystem(Subsystem):
             Keys are the total size in bytes, the count, and the name. Note that the total size
             is for all instances added together, so you can use total_size // count to get the
             average size.
+
+            Entries named `(target) <alias>` summarize the targets of each target type, wherever
+            they are held.
             """
         ),
         advanced=True,
@@ -112,6 +118,22 @@ class StatsAggregatorCallback(WorkunitsCallback):
             entries.extend(
                 (size, count, f"(native) {name}") for name, (count, size) in rust_sizes.items()
             )
+
+            # Targets are mostly held inside of other types (such as `GeneratedTargets`), so also
+            # attribute their sizes to their target types. Fields which are shared between targets
+            # are only counted for the first target which holds them.
+            target_ids: set[int] = set()
+            target_count_by_type: Counter[str] = Counter()
+            target_sizes_by_type: Counter[str] = Counter()
+            for target in _live_targets(items):
+                if id(target) in target_ids:
+                    continue
+                target_count_by_type[target.alias] += 1
+                target_sizes_by_type[target.alias] += _target_size(target, target_ids)
+            entries.extend(
+                (size, target_count_by_type[alias], f"(target) {alias}")
+                for alias, size in target_sizes_by_type.items()
+            )
             memory_lines = "\n".join(
                 f"  {size}\t\t{count}\t\t{name}" for size, count, name in sorted(entries)
             )
@@ -150,6 +172,32 @@ class StatsAggregatorCallback(WorkunitsCallback):
             )
 
 
+def _live_targets(items: Iterable[Any]) -> Iterator[Target]:
+    """Find the targets which are held directly by, or by collections within, the given items."""
+    for item in items:
+        if isinstance(item, Target):
+            yield item
+        elif isinstance(item, WrappedTarget):
+            yield item.target
+        elif isinstance(item, Mapping):
+            yield from (value for value in item.values() if isinstance(value, Target))
+        elif isinstance(item, tuple):
+            yield from (value for value in item if isinstance(value, Target))
+
+
+def _target_size(target: Target, ids: set[int]) -> int:
+    """The approximate size of the target and of its fields, excluding any objects in `ids`."""
+    size = 0
+    for o in (target, vars(target), *target.field_values.values()):
+        if id(o) not in ids:
+            ids.add(id(o))
+            size += getsizeof(o)
+            if isinstance(o, Field) and id(o.value) not in ids:
+                ids.add(id(o.value))
+                size += getsizeof(o.value)
+    return size
+
+
 @dataclass(frozen=True)
 class StatsAggregatorCallbackFactoryRequest:
     """A unique request type that is installed to trigger construction of the WorkunitsCallback."""
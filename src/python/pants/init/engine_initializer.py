@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, ClassVar, Iterable, Mapping, cast
@@ -66,6 +67,9 @@ class GraphScheduler:
 
     scheduler: Scheduler
     goal_map: Any
+    # The Parser for BUILD files, which is held for the lifetime of the Scheduler so that its code
+    # cache (and the stats of that cache) survive graph invalidation.
+    build_file_parser: Parser
 
     def new_session(
         self,
@@ -86,7 +90,7 @@ class GraphScheduler:
             cancellation_latch=cancellation_latch,
         )
         console = Console(use_colors=use_colors, session=session if dynamic_ui else None)
-        return GraphSession(session, console, self.goal_map)
+        return GraphSession(session, console, self.goal_map, self.build_file_parser)
 
 
 @dataclass(frozen=True)
@@ -96,6 +100,7 @@ class GraphSession:
     scheduler_session: SchedulerSession
     console: Console
     goal_map: Any
+    build_file_parser: Parser
 
     # NB: Keep this in sync with the method `run_goal_rules`.
     goal_param_types: ClassVar[tuple[type, ...]] = (Specs, Console, Workspace, EnvironmentName)
@@ -210,6 +215,9 @@ class EngineInitializer:
             engine_visualize_to=bootstrap_options.engine_visualize_to,
             watch_filesystem=bootstrap_options.watch_filesystem,
             is_bootstrap=is_bootstrap,
+            build_file_code_cache_dir=os.path.join(
+                bootstrap_options.pants_workdir, "build_file_code_cache"
+            ),
         )
 
     @staticmethod
@@ -229,6 +237,7 @@ class EngineInitializer:
         engine_visualize_to: str | None = None,
         watch_filesystem: bool = True,
         is_bootstrap: bool = False,
+        build_file_code_cache_dir: str | None = None,
     ) -> GraphScheduler:
         build_root_path = build_root or get_buildroot()
 
@@ -240,13 +249,7 @@ class EngineInitializer:
 
         @rule
         def parser_singleton() -> Parser:
-            return Parser(
-                build_root=build_root_path,
-                registered_target_types=registered_target_types,
-                union_membership=union_membership,
-                object_aliases=build_configuration.registered_aliases,
-                ignore_unrecognized_symbols=is_bootstrap,
-            )
+            return build_file_parser
 
         @rule
         def bootstrap_status() -> BootstrapStatus:
@@ -306,6 +309,15 @@ class EngineInitializer:
             )
         )
 
+        build_file_parser = Parser(
+            build_root=build_root_path,
+            registered_target_types=registered_target_types,
+            union_membership=union_membership,
+            object_aliases=build_configuration.registered_aliases,
+            ignore_unrecognized_symbols=is_bootstrap,
+            code_cache_dir=build_file_code_cache_dir,
+        )
+
         # param types for goals with the `USES_ENVIRONMENT` behaviour (see `goal.py`)
         environment_selecting_goal_param_types = [
             t for t in GraphSession.goal_param_types if t != EnvironmentName
@@ -359,7 +371,7 @@ class EngineInitializer:
             watch_filesystem=watch_filesystem,
         )
 
-        return GraphScheduler(scheduler, goal_map)
+        return GraphScheduler(scheduler, goal_map, build_file_parser)
 
 
 class GoalNotActivatedException(Exception):
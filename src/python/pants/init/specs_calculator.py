@@ -2,7 +2,7 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
 import logging
-from typing import cast
+from typing import Optional, cast
 
 from pants.base.specs import AddressLiteralSpec, FileLiteralSpec, RawSpecs, Specs
 from pants.base.specs_parser import SpecsParser
@@ -10,6 +10,7 @@ from pants.core.util_rules.environments import determine_bootstrap_environment
 from pants.core.util_rules.system_binaries import GitBinary
 from pants.engine.addresses import AddressInput
 from pants.engine.environment import EnvironmentName
+from pants.engine.fs import PathGlobs, Snapshot
 from pants.engine.internals.scheduler import SchedulerSession
 from pants.engine.internals.selectors import Params
 from pants.engine.rules import QueryRule
@@ -68,7 +69,14 @@ def calculate_specs(
             "The `--changed-*` options are only available if Git is used for the repository."
         )
 
-    changed_files = tuple(changed_options.changed_files(maybe_git_worktree.git_worktree))
+    worktree_snapshot: Optional[Snapshot] = None
+    if changed_options.incremental and global_options.pantsd and not changed_options.diffspec:
+        # The engine keeps this Snapshot up to date by watching the filesystem, so after the first
+        # run only the files which have been edited are re-read.
+        (worktree_snapshot,) = session.product_request(Snapshot, [PathGlobs(["**"])])
+    changed_files = tuple(
+        changed_options.changed_files(maybe_git_worktree.git_worktree, worktree_snapshot)
+    )
     file_literal_specs = tuple(FileLiteralSpec(f) for f in changed_files)
 
     changed_request = ChangedRequest(changed_files, changed_options.dependents)
@@ -1,187 +1,177 @@
 # Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+"""Rules to assemble and strip JAR files so that they are reproducible.
+
+Both operations are implemented in-process (rather than by running a tool), since they run once
+per compiled target.
+"""
+
+from __future__ import annotations
+
+import io
+import zipfile
 from dataclasses import dataclass
-from typing import Tuple
-
-import pkg_resources
-
-from pants.core.goals.generate_lockfiles import DEFAULT_TOOL_LOCKFILE, GenerateToolLockfileSentinel
-from pants.engine.fs import AddPrefix, CreateDigest, Digest, Directory, FileContent
-from pants.engine.internals.native_engine import MergeDigests, RemovePrefix
-from pants.engine.process import FallibleProcessResult, ProcessResult
-from pants.engine.rules import Get, MultiGet, collect_rules, rule
-from pants.engine.unions import UnionRule
-from pants.jvm.jdk_rules import InternalJdk, JvmProcess
-from pants.jvm.resolve.coursier_fetch import ToolClasspath, ToolClasspathRequest
-from pants.jvm.resolve.jvm_tool import GenerateJvmLockfileFromTool, GenerateJvmToolLockfileSentinel
+from pathlib import PurePath
+from typing import Iterable, Tuple
+
+from pants.engine.fs import (
+    CreateDigest,
+    Digest,
+    DigestContents,
+    DigestSubset,
+    FileContent,
+    PathGlobs,
+)
+from pants.engine.rules import Get, collect_rules, rule
 from pants.util.logging import LogLevel
-from pants.util.ordered_set import FrozenOrderedSet
 
-_STRIP_JAR_BASENAME = "StripJar.java"
-_OUTPUT_PATH = "__stripped_jars"
+# NB: This matches the timestamp used by the `reproducible-build-maven-plugin`, which was
+# previously used to strip JARs.
+_REPRODUCIBLE_DATE_TIME = (2000, 1, 1, 0, 0, 0)
+
+_MANIFEST_DIR = "META-INF/"
+_MANIFEST_PATH = "META-INF/MANIFEST.MF"
+
+# Manifest attributes (compared case-insensitively) which vary between builds of the same JAR.
+_NON_REPRODUCIBLE_MANIFEST_ATTRIBUTES = frozenset(
+    {
+        "bnd-lastmodified",
+        "build-date",
+        "build-jdk",
+        "build-jdk-spec",
+        "build-time",
+        "built-by",
+        "created-by",
+        "tool",
+    }
+)
 
 
-class StripJarToolLockfileSentinel(GenerateJvmToolLockfileSentinel):
-    resolve_name = "strip-jar"
+@dataclass(frozen=True)
+class CreateJarRequest:
+    """Assemble the files in `digest` into a reproducible JAR at `path`.
 
+    Directory entries are added for the parents of each file, entries are sorted (after the
+    manifest, if any), and all timestamps are fixed.
+    """
 
-@dataclass(frozen=True)
-class StripJarRequest:
     digest: Digest
-    filenames: Tuple[str, ...]
+    path: str
 
 
 @dataclass(frozen=True)
-class FallibleStripJarResult:
-    process_result: FallibleProcessResult
+class StripJarRequest:
+    """Rewrite each of the given JARs in `digest` so that they are reproducible.
 
+    The result contains only the rewritten JARs.
+    """
 
-@dataclass(frozen=True)
-class StripJarCompiledClassfiles:
     digest: Digest
+    filenames: Tuple[str, ...]
 
 
-@rule(level=LogLevel.DEBUG)
-async def strip_jar(
-    processor_classfiles: StripJarCompiledClassfiles,
-    jdk: InternalJdk,
-    request: StripJarRequest,
-) -> Digest:
-    filenames = list(request.filenames)
-
-    if len(filenames) == 0:
-        return request.digest
-
-    input_path = "__jars_to_strip"
-    toolcp_relpath = "__toolcp"
-    processorcp_relpath = "__processorcp"
-
-    lockfile_request = await Get(GenerateJvmLockfileFromTool, StripJarToolLockfileSentinel())
-
-    tool_classpath, prefixed_jars_digest = await MultiGet(
-        Get(
-            ToolClasspath,
-            ToolClasspathRequest(lockfile=lockfile_request),
-        ),
-        Get(Digest, AddPrefix(request.digest, input_path)),
-    )
-
-    extra_immutable_input_digests = {
-        toolcp_relpath: tool_classpath.digest,
-        processorcp_relpath: processor_classfiles.digest,
+def _entry_sort_key(name: str) -> tuple[int, str]:
+    # NB: `JarInputStream` expects the manifest (and its directory) to be the first entries.
+    if name == _MANIFEST_DIR:
+        return (0, name)
+    if name == _MANIFEST_PATH:
+        return (1, name)
+    return (2, name)
+
+
+def _zip_info(name: str) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(name, date_time=_REPRODUCIBLE_DATE_TIME)
+    # NB: The creating system is otherwise platform dependent.
+    info.create_system = 3
+    if name.endswith("/"):
+        info.compress_type = zipfile.ZIP_STORED
+        info.external_attr = (0o40755 << 16) | 0x10
+    else:
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = 0o644 << 16
+    return info
+
+
+def _write_jar(entries: Iterable[tuple[str, bytes]]) -> bytes:
+    """Write a JAR containing the given entries, ignoring all but the first entry for each name."""
+    unique_entries: dict[str, bytes] = {}
+    for name, content in entries:
+        unique_entries.setdefault(name, content)
+
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, "w") as jar:
+        for name in sorted(unique_entries, key=_entry_sort_key):
+            jar.writestr(_zip_info(name), unique_entries[name])
+    return output.getvalue()
+
+
+def create_jar_content(files: Iterable[tuple[str, bytes]]) -> bytes:
+    """Create the content of a reproducible JAR containing the given files, and their parent
+    directories."""
+    files = list(files)
+    directories = {
+        f"{parent}/"
+        for path, _ in files
+        for parent in PurePath(path).parents
+        if parent != PurePath(".")
     }
-
-    process_result = await Get(
-        ProcessResult,
-        JvmProcess(
-            jdk=jdk,
-            classpath_entries=[
-                *tool_classpath.classpath_entries(toolcp_relpath),
-                processorcp_relpath,
-            ],
-            argv=["org.pantsbuild.stripjar.StripJar", input_path, _OUTPUT_PATH, *filenames],
-            input_digest=prefixed_jars_digest,
-            extra_immutable_input_digests=extra_immutable_input_digests,
-            output_directories=(_OUTPUT_PATH,),
-            extra_nailgun_keys=extra_immutable_input_digests,
-            description=f"Stripping jar {filenames[0]}",
-            level=LogLevel.DEBUG,
-        ),
+    return _write_jar([*((directory, b"") for directory in directories), *files])
+
+
+def strip_manifest(content: bytes) -> bytes:
+    """Remove the attributes of the main section of a manifest which vary between builds."""
+    lines = content.decode("utf-8").splitlines(keepends=True)
+    stripped_lines = []
+    in_main_section = True
+    skipping_attribute = False
+    for line in lines:
+        if not line.strip():
+            in_main_section = False
+        elif in_main_section and line.startswith(" "):
+            # A continuation of the previous attribute.
+            if skipping_attribute:
+                continue
+        elif in_main_section:
+            name = line.partition(":")[0].strip().lower()
+            skipping_attribute = name in _NON_REPRODUCIBLE_MANIFEST_ATTRIBUTES
+            if skipping_attribute:
+                continue
+        stripped_lines.append(line)
+    return "".join(stripped_lines).encode("utf-8")
+
+
+def strip_jar_content(content: bytes) -> bytes:
+    """Rewrite the content of a JAR with sorted entries, fixed timestamps and a stripped
+    manifest."""
+    with zipfile.ZipFile(io.BytesIO(content)) as jar:
+        entries = [(info.filename, jar.read(info)) for info in jar.infolist()]
+    return _write_jar(
+        (name, strip_manifest(data) if name == _MANIFEST_PATH else data) for name, data in entries
     )
 
-    return await Get(Digest, RemovePrefix(process_result.output_digest, _OUTPUT_PATH))
 
-
-def _load_strip_jar_source() -> bytes:
-    return pkg_resources.resource_string(__name__, _STRIP_JAR_BASENAME)
+@rule(level=LogLevel.DEBUG)
+async def create_jar(request: CreateJarRequest) -> Digest:
+    contents = await Get(DigestContents, Digest, request.digest)
+    jar = create_jar_content((file_content.path, file_content.content) for file_content in contents)
+    return await Get(Digest, CreateDigest([FileContent(request.path, jar)]))
 
 
-# TODO(13879): Consolidate compilation of wrapper binaries to common rules.
-@rule
-async def build_processors(jdk: InternalJdk) -> StripJarCompiledClassfiles:
-    dest_dir = "classfiles"
-    lockfile_request = await Get(GenerateJvmLockfileFromTool, StripJarToolLockfileSentinel())
-    materialized_classpath, source_digest = await MultiGet(
-        Get(
-            ToolClasspath,
-            ToolClasspathRequest(prefix="__toolcp", lockfile=lockfile_request),
-        ),
-        Get(
-            Digest,
-            CreateDigest(
-                [
-                    FileContent(
-                        path=_STRIP_JAR_BASENAME,
-                        content=_load_strip_jar_source(),
-                    ),
-                    Directory(dest_dir),
-                ]
-            ),
-        ),
-    )
+@rule(level=LogLevel.DEBUG)
+async def strip_jar(request: StripJarRequest) -> Digest:
+    if len(request.filenames) == 0:
+        return request.digest
 
-    merged_digest = await Get(
+    contents = await Get(DigestContents, DigestSubset(request.digest, PathGlobs(request.filenames)))
+    return await Get(
         Digest,
-        MergeDigests(
-            (
-                materialized_classpath.digest,
-                source_digest,
-            )
-        ),
-    )
-
-    process_result = await Get(
-        ProcessResult,
-        JvmProcess(
-            jdk=jdk,
-            classpath_entries=[f"{jdk.java_home}/lib/tools.jar"],
-            argv=[
-                "com.sun.tools.javac.Main",
-                "-cp",
-                ":".join(materialized_classpath.classpath_entries()),
-                "-d",
-                dest_dir,
-                _STRIP_JAR_BASENAME,
-            ],
-            input_digest=merged_digest,
-            output_directories=(dest_dir,),
-            description=f"Compile {_STRIP_JAR_BASENAME} with javac",
-            level=LogLevel.DEBUG,
-            # NB: We do not use nailgun for this process, since it is launched exactly once.
-            use_nailgun=False,
-        ),
-    )
-    stripped_classfiles_digest = await Get(
-        Digest, RemovePrefix(process_result.output_digest, dest_dir)
-    )
-    return StripJarCompiledClassfiles(digest=stripped_classfiles_digest)
-
-
-@rule
-def generate_strip_jar_lockfile_request(
-    _: StripJarToolLockfileSentinel,
-) -> GenerateJvmLockfileFromTool:
-    return GenerateJvmLockfileFromTool(
-        artifact_inputs=FrozenOrderedSet(
-            {
-                "io.github.zlika:reproducible-build-maven-plugin:0.16",
-            }
-        ),
-        artifact_option_name="n/a",
-        lockfile_option_name="n/a",
-        resolve_name=StripJarToolLockfileSentinel.resolve_name,
-        read_lockfile_dest=DEFAULT_TOOL_LOCKFILE,
-        write_lockfile_dest="src/python/pants/jvm/strip_jar/strip_jar.lock",
-        default_lockfile_resource=(
-            "pants.jvm.strip_jar",
-            "strip_jar.lock",
+        CreateDigest(
+            FileContent(file_content.path, strip_jar_content(file_content.content))
+            for file_content in contents
         ),
     )
 
 
 def rules():
-    return [
-        *collect_rules(),
-        UnionRule(GenerateToolLockfileSentinel, StripJarToolLockfileSentinel),
-    ]
+    return collect_rules()
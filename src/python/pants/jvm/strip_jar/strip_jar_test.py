@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import io
+import zipfile
 from textwrap import dedent
 
 import pytest
@@ -17,6 +19,7 @@ from pants.core.util_rules.archive import rules as archive_rules
 from pants.core.util_rules.system_binaries import BashBinary, UnzipBinary
 from pants.engine.addresses import Addresses
 from pants.engine.internals.graph import rules as graph_rules
+from pants.engine.fs import CreateDigest, DigestContents, FileContent
 from pants.engine.internals.native_engine import Digest, MergeDigests, Snapshot
 from pants.engine.process import Process, ProcessResult
 from pants.jvm import jdk_rules
@@ -25,7 +28,7 @@ from pants.jvm.classpath import rules as classpath_rules
 from pants.jvm.resolve import jvm_tool
 from pants.jvm.resolve.coursier_test_util import EMPTY_JVM_LOCKFILE
 from pants.jvm.strip_jar import strip_jar
-from pants.jvm.strip_jar.strip_jar import StripJarRequest
+from pants.jvm.strip_jar.strip_jar import CreateJarRequest, StripJarRequest, strip_manifest
 from pants.jvm.testutil import maybe_skip_jdk_test
 from pants.jvm.util_rules import rules as util_rules
 from pants.testutil.rule_runner import PYTHON_BOOTSTRAP_ENV, QueryRule, RuleRunner
@@ -52,6 +55,7 @@ def rule_runner() -> RuleRunner:
             QueryRule(ProcessResult, (Process,)),
             QueryRule(Classpath, (Addresses,)),
             QueryRule(Digest, (StripJarRequest,)),
+            QueryRule(Digest, (CreateJarRequest,)),
         ],
         target_types=[
             JavaSourcesGeneratorTarget,
@@ -120,3 +124,58 @@ def test_strip_jar(rule_runner: RuleRunner) -> None:
     )
 
     assert process_result.stdout.decode() == "2000-01-01\n"
+
+
+
+def test_create_jar(rule_runner: RuleRunner) -> None:
+    def create_jar(files: dict[str, bytes]) -> bytes:
+        digest = rule_runner.request(
+            Digest, [CreateDigest(FileContent(path, content) for path, content in files.items())]
+        )
+        jar = rule_runner.request(Digest, [CreateJarRequest(digest, "out.jar")])
+        return rule_runner.request(DigestContents, [jar])[0].content
+
+    files = {
+        "org/pantsbuild/B.class": b"b",
+        "org/pantsbuild/A.class": b"a",
+        "META-INF/MANIFEST.MF": b"Manifest-Version: 1.0\n",
+    }
+    jar = create_jar(files)
+    with zipfile.ZipFile(io.BytesIO(jar)) as zf:
+        assert [info.filename for info in zf.infolist()] == [
+            "META-INF/",
+            "META-INF/MANIFEST.MF",
+            "org/",
+            "org/pantsbuild/",
+            "org/pantsbuild/A.class",
+            "org/pantsbuild/B.class",
+        ]
+        assert {info.date_time for info in zf.infolist()} == {(2000, 1, 1, 0, 0, 0)}
+        assert zf.read("org/pantsbuild/A.class") == b"a"
+
+    # The same files must always produce the same JAR.
+    assert create_jar(dict(reversed(files.items()))) == jar
+
+
+def test_strip_manifest() -> None:
+    manifest = dedent(
+        """\
+        Manifest-Version: 1.0
+        Created-By: 11.0.2 (Oracle Corporation)
+        Built-By: somebody-with-a-very-long-name-which-does-not-fit-on-a-single-line-of-t
+         he-manifest
+        Main-Class: org.pantsbuild.example.Example
+
+        Name: org/pantsbuild/example/
+        Built-By: somebody
+        """
+    )
+    assert strip_manifest(manifest.encode()).decode() == dedent(
+        """\
+        Manifest-Version: 1.0
+        Main-Class: org.pantsbuild.example.Example
+
+        Name: org/pantsbuild/example/
+        Built-By: somebody
+        """
+    )
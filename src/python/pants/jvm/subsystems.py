@@ -94,8 +94,9 @@ class JvmSubsystem(Subsystem):
             """
             When enabled, JAR files produced by JVM tools will have timestamps stripped.
 
-            Because some compilers do not support this step as a native operation, it can have a
-            performance cost, and is not enabled by default.
+            JARs produced by `javac` are always reproducible. For other tools, timestamps are
+            stripped in-process by rewriting each JAR, which has a (small) performance cost, so
+            this is not enabled by default.
             """
         ),
         advanced=True,
@@ -992,11 +992,13 @@ class BootstrapOptions:
             """
             The maximum memory usage of the pantsd process.
 
-            When the maximum memory is exceeded, the daemon will restart gracefully,
-            although all previous in-memory caching will be lost. Setting too low means that
-            you may miss out on some caching, whereas setting too high may over-consume
-            resources and may result in the operating system killing Pantsd due to memory
-            overconsumption (e.g. via the OOM killer).
+            When 80% of the maximum memory is exceeded, the daemon will evict the in-memory
+            graph of memoized rule results (while keeping the daemon itself running). If the
+            maximum memory is exceeded even so, the daemon will restart gracefully, although
+            all previous in-memory caching will be lost. Setting too low
+            means that you may miss out on some caching, whereas setting too high may
+            over-consume resources and may result in the operating system killing Pantsd due to
+            memory overconsumption (e.g. via the OOM killer).
 
             You can suffix with `GiB`, `MiB`, `KiB`, or `B` to indicate the unit, e.g.
             `2GiB` or `2.12GiB`. A bare number will be in bytes.
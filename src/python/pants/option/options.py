@@ -16,7 +16,6 @@ from pants.option.option_util import is_list_option
 from pants.option.option_value_container import OptionValueContainer, OptionValueContainerBuilder
 from pants.option.parser import Parser
 from pants.option.scope import GLOBAL_SCOPE, GLOBAL_SCOPE_CONFIG_SECTION, ScopeInfo
-from pants.util.memo import memoized_method
 from pants.util.ordered_set import FrozenOrderedSet, OrderedSet
 from pants.util.strutil import softwrap
 
@@ -189,6 +188,8 @@ class Options:
         self._bootstrap_option_values = bootstrap_option_values
         self._known_scope_to_info = known_scope_to_info
         self._allow_unknown_options = allow_unknown_options
+        # The parsed option values for each (scope, check_deprecations) pair: see `for_scope`.
+        self._values_by_scope: dict[tuple[str, bool], OptionValueContainer] = {}
 
     @property
     def specs(self) -> list[str]:
@@ -252,6 +253,16 @@ class Options:
         deprecated_scope = self.known_scope_to_info[scope].deprecated_scope
         if deprecated_scope:
             self.get_parser(deprecated_scope).register(*args, **kwargs)
+        # NB: The values of other scopes may depend on this one via deprecated scopes, so we
+        # invalidate all of them rather than only this scope's.
+        self.invalidate_values()
+
+    def invalidate_values(self) -> None:
+        """Discard the option values that `for_scope` has computed, so that they will be re-parsed.
+
+        This is necessary after mutating the underlying parsers, e.g. by registering new options.
+        """
+        self._values_by_scope.clear()
 
     def registration_function_for_subsystem(self, subsystem_cls):
         """Returns a function for registering options on the given scope."""
@@ -333,17 +344,24 @@ class Options:
             allow_unknown_flags=self._allow_unknown_options,
         )
 
-    # TODO: Eagerly precompute backing data for this?
-    @memoized_method
     def for_scope(self, scope: str, check_deprecations: bool = True) -> OptionValueContainer:
         """Return the option values for the given scope.
 
         Values are attributes of the returned object, e.g., options.foo.
-        Computed lazily per scope.
+        Computed lazily per scope, and cached until `invalidate_values` is called.
 
         :API: public
         """
+        key = (scope, check_deprecations)
+        values = self._values_by_scope.get(key)
+        if values is None:
+            values = self._compute_values_for_scope(scope, check_deprecations)
+            self._values_by_scope[key] = values
+        return values
 
+    def _compute_values_for_scope(
+        self, scope: str, check_deprecations: bool
+    ) -> OptionValueContainer:
         values_builder = OptionValueContainerBuilder()
         flags_in_scope = self._scope_to_flags.get(scope, [])
         parse_args_request = self._make_parse_args_request(flags_in_scope, values_builder)
@@ -375,13 +393,14 @@ class Options:
 
         pairs = []
         parser = self.get_parser(scope)
+        values = self.for_scope(scope)
         # Sort the arguments, so that the fingerprint is consistent.
         for _, kwargs in sorted(parser.option_registrations_iter()):
             if not kwargs.get("fingerprint", True):
                 continue
             if daemon_only and not kwargs.get("daemon", False):
                 continue
-            val = self.for_scope(scope)[kwargs["dest"]]
+            val = values[kwargs["dest"]]
             # If we have a list then we delegate to the fingerprinting implementation of the members.
             if is_list_option(kwargs):
                 val_type = kwargs.get("member_type", str)
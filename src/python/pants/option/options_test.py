@@ -503,6 +503,31 @@ def test_scope_deprecation_default_config_section(caplog) -> None:
     assert not caplog.records
 
 
+# ----------------------------------------------------------------------------------------
+# Caching.
+# ----------------------------------------------------------------------------------------
+
+
+def test_for_scope_cached_until_invalidated() -> None:
+    def register(opts: Options) -> None:
+        opts.register(GLOBAL_SCOPE, "--opt", type=int, default=1)
+
+    options = create_options([GLOBAL_SCOPE, "scope"], register)
+    global_options = options.for_global_scope()
+    assert global_options.opt == 1
+    assert options.for_global_scope() is global_options
+
+    # Registering an option invalidates the previously computed values.
+    options.register("scope", "--other-opt", type=int, default=2)
+    assert options.for_global_scope() is not global_options
+    assert options.for_scope("scope").other_opt == 2
+
+    scope_options = options.for_scope("scope")
+    options.invalidate_values()
+    assert options.for_scope("scope") is not scope_options
+    assert options.for_scope("scope").other_opt == 2
+
+
 # ----------------------------------------------------------------------------------------
 # Legacy Unittest TestCase.
 # ----------------------------------------------------------------------------------------
@@ -1,6 +1,7 @@
 # Copyright 2016 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+import gc
 import logging
 import time
 from typing import Optional, Tuple, cast
@@ -27,6 +28,9 @@ class SchedulerService(PantsService):
     INVALIDATION_POLL_INTERVAL = 0.5
     # A grace period after startup that we will wait before enforcing our pid.
     PIDFILE_GRACE_PERIOD = 5
+    # The fraction of the maximum memory usage above which the graph is evicted, in order to avoid
+    # reaching the maximum (at which point the daemon restarts, losing all of its warm state).
+    MEMORY_EVICTION_WATERMARK = 0.8
 
     def __init__(
         self,
@@ -48,6 +52,8 @@ class SchedulerService(PantsService):
         :param pid: This processes' pid.
         :param max_memory_usage_in_bytes: The maximum memory usage of the process: the service will
                                           shut down if it observes more than this amount in use.
+                                          Before that, it evicts the graph if it observes more than
+                                          `MEMORY_EVICTION_WATERMARK` of this amount in use.
         """
         super().__init__()
         self._graph_helper = graph_scheduler
@@ -70,6 +76,10 @@ class SchedulerService(PantsService):
         self._pidfile = pidfile
         self._pid = pid
         self._max_memory_usage_in_bytes = max_memory_usage_in_bytes
+        self._eviction_watermark_in_bytes = int(
+            max_memory_usage_in_bytes * self.MEMORY_EVICTION_WATERMARK
+        )
+        self._next_eviction_in_bytes = self._eviction_watermark_in_bytes
 
     def _get_snapshot(self, globs: Tuple[str, ...], poll: bool) -> Optional[Snapshot]:
         """Returns a Snapshot of the input globs.
@@ -122,15 +132,50 @@ class SchedulerService(PantsService):
         if int(pid_from_file) != self._pid:
             raise Exception(f"Another instance of pantsd is running at {pid_from_file}")
 
+    def _memory_usage_in_bytes(self) -> int:
+        return cast(int, psutil.Process(self._pid).memory_info()[0])
+
     def _check_memory_usage(self):
-        memory_usage_in_bytes = psutil.Process(self._pid).memory_info()[0]
+        bytes_per_mib = 1_048_576
+        memory_usage_in_bytes = self._memory_usage_in_bytes()
+        if (
+            memory_usage_in_bytes > self._next_eviction_in_bytes
+            or memory_usage_in_bytes > self._max_memory_usage_in_bytes
+        ):
+            # Evict the memoized values in the graph before resorting to a restart (which discards
+            # all of the daemon's warm state).
+            evicted = self._scheduler.evict_graph()
+            gc.collect()
+            memory_usage_after_eviction_in_bytes = self._memory_usage_in_bytes()
+            # NB: The allocator may not return all of the released memory to the OS, so rather than
+            # evicting again as soon as the usage is above the watermark, wait for it to grow by a
+            # meaningful amount.
+            self._next_eviction_in_bytes = max(
+                self._eviction_watermark_in_bytes,
+                memory_usage_after_eviction_in_bytes
+                + (self._max_memory_usage_in_bytes - self._eviction_watermark_in_bytes) // 2,
+            )
+            self._logger.info(
+                softwrap(
+                    f"""
+                    pantsd process {self._pid} was using
+                    {memory_usage_in_bytes / bytes_per_mib:.2f} MiB of memory (above
+                    {self.MEMORY_EVICTION_WATERMARK:.0%} of the `--pantsd-max-memory-usage` limit
+                    of {self._max_memory_usage_in_bytes / bytes_per_mib:.2f} MiB): evicted
+                    {evicted} graph nodes, which reduced its memory usage to
+                    {memory_usage_after_eviction_in_bytes / bytes_per_mib:.2f} MiB.
+                    """
+                )
+            )
+            memory_usage_in_bytes = memory_usage_after_eviction_in_bytes
+
         if memory_usage_in_bytes > self._max_memory_usage_in_bytes:
-            bytes_per_mib = 1_048_576
             raise Exception(
                 softwrap(
                     f"""
-                    pantsd process {self._pid} was using {memory_usage_in_bytes / bytes_per_mib:.2f}
-                    MiB of memory (above the `--pantsd-max-memory-usage` limit of
+                    pantsd process {self._pid} was using
+                    {memory_usage_in_bytes / bytes_per_mib:.2f} MiB of memory even after evicting
+                    the graph (above the `--pantsd-max-memory-usage` limit of
                     {self._max_memory_usage_in_bytes / bytes_per_mib:.2f} MiB).
                     """
                 )
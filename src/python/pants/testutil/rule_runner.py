@@ -336,27 +336,25 @@ class RuleRunner:
         local_execution_root_dir = global_options.local_execution_root_dir
         named_caches_dir = global_options.named_caches_dir
 
-        self._set_new_session(
-            EngineInitializer.setup_graph_extended(
-                pants_ignore_patterns=GlobalOptions.compute_pants_ignore(
-                    self.build_root, global_options
-                ),
-                use_gitignore=False,
-                local_store_options=local_store_options,
-                local_execution_root_dir=local_execution_root_dir,
-                named_caches_dir=named_caches_dir,
-                build_root=self.build_root,
-                build_configuration=self.build_config,
-                # Each Scheduler that is created borrows the global executor, which is shut down `atexit`.
-                executor=EXECUTOR.to_borrowed(),
-                execution_options=ExecutionOptions.from_options(
-                    global_options, dynamic_remote_options
-                ),
-                ca_certs_path=ca_certs_path,
-                engine_visualize_to=None,
-                is_bootstrap=is_bootstrap,
-            ).scheduler
+        graph_scheduler = EngineInitializer.setup_graph_extended(
+            pants_ignore_patterns=GlobalOptions.compute_pants_ignore(
+                self.build_root, global_options
+            ),
+            use_gitignore=False,
+            local_store_options=local_store_options,
+            local_execution_root_dir=local_execution_root_dir,
+            named_caches_dir=named_caches_dir,
+            build_root=self.build_root,
+            build_configuration=self.build_config,
+            # Each Scheduler that is created borrows the global executor, which is shut down `atexit`.
+            executor=EXECUTOR.to_borrowed(),
+            execution_options=ExecutionOptions.from_options(global_options, dynamic_remote_options),
+            ca_certs_path=ca_certs_path,
+            engine_visualize_to=None,
+            is_bootstrap=is_bootstrap,
         )
+        self.build_file_parser = graph_scheduler.build_file_parser
+        self._set_new_session(graph_scheduler.scheduler)
 
     def __repr__(self) -> str:
         return f"RuleRunner(build_root={self.build_root})"
@@ -713,7 +711,7 @@ def run_rule_with_mocks(
     if not isinstance(res, (CoroutineType, GeneratorType)):
         return res  # type: ignore[misc,return-value]
 
-    def get(res: Get | Effect):
+    def find_provider(res: Get | Effect) -> Callable[..., Any]:
         provider = next(
             (
                 mock_get.mock
@@ -736,21 +734,37 @@ def run_rule_with_mocks(
         )
         if provider is None:
             raise AssertionError(f"Rule requested: {res}, which cannot be satisfied.")
-        return provider(*res.inputs)
+        return provider
 
     rule_coroutine = res
     rule_input = None
+    rule_error: Exception | None = None
     while True:
         try:
-            res = rule_coroutine.send(rule_input)
-            if isinstance(res, (Get, Effect)):
-                rule_input = get(res)
-            elif type(res) in (tuple, list):
-                rule_input = [get(g) for g in res]  # type: ignore[attr-defined]
+            if rule_error is None:
+                res = rule_coroutine.send(rule_input)
             else:
-                return res  # type: ignore[misc,return-value]
+                res = rule_coroutine.throw(rule_error)
         except StopIteration as e:
             return e.value  # type: ignore[no-any-return]
+        rule_input, rule_error = None, None
+        # NB: A request which no mock can satisfy is a bug in the test, so it is raised from here
+        # rather than into the rule, where it could be caught.
+        if isinstance(res, (Get, Effect)):
+            provider = find_provider(res)
+            try:
+                rule_input = provider(*res.inputs)
+            except Exception as e:
+                # As in the engine, a failed `Get` raises its error in the rule which requested it.
+                rule_error = e
+        elif type(res) in (tuple, list):
+            providers = [(find_provider(g), g.inputs) for g in res]  # type: ignore[attr-defined]
+            try:
+                rule_input = [provider(*inputs) for provider, inputs in providers]
+            except Exception as e:
+                rule_error = e
+        else:
+            return res  # type: ignore[misc,return-value]
 
 
 @contextmanager
@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Iterable, Iterator, Mapping, TypeVar, cast, overload
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Mapping, TypeVar, cast, overload
 
 from pants.util.memo import memoized_method
 from pants.util.strutil import softwrap
@@ -20,6 +20,10 @@ class FrozenDict(Mapping[K, V]):
     are not safe to use.
     """
 
+    # Whether the values stored in `_data` are the values of the mapping (and so whether `_hash`
+    # and `_data` may be used directly to compare instances).
+    _stores_values: ClassVar[bool] = True
+
     @overload
     def __init__(self, __items: Iterable[tuple[K, V]], **kwargs: V) -> None:
         ...
@@ -39,6 +43,13 @@ class FrozenDict(Mapping[K, V]):
                 f"{type(self).__name__} was called with {len(item)} positional arguments but it expects one."
             )
 
+        if item and not kwargs and type(item[0]) is FrozenDict:
+            # The other instance is immutable, so we share its data and hash rather than copying
+            # and re-hashing them.
+            self._data = item[0]._data
+            self._hash = item[0]._hash
+            return
+
         # NB: Keep the variable name `_data` in sync with `externs/mod.rs`.
         self._data = dict(item[0]) if item else dict()
         self._data.update(**kwargs)
@@ -86,9 +97,17 @@ class FrozenDict(Mapping[K, V]):
         return reversed(tuple(self._data))
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, FrozenDict):
             return NotImplemented
-        return tuple(self.items()) == tuple(other.items())
+        if not (self._stores_values and other._stores_values):
+            return tuple(self.items()) == tuple(other.items())
+        if self._hash != other._hash:
+            return False
+        # NB: Comparing the dicts and then their keys avoids allocating a tuple per item, while
+        # remaining sensitive to order.
+        return self._data == other._data and list(self._data) == list(other._data)
 
     def __lt__(self, other: Any) -> bool:
         if not isinstance(other, FrozenDict):
@@ -124,6 +143,8 @@ class FrozenDict(Mapping[K, V]):
 class LazyFrozenDict(FrozenDict[K, V]):
     """A lazy version of `FrozenDict` where the values are not loaded until referenced."""
 
+    _stores_values = False
+
     @overload
     def __init__(
         self, __items: Iterable[tuple[K, Callable[[], V]]], **kwargs: Callable[[], V]
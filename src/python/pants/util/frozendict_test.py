@@ -99,6 +99,16 @@ def test_eq() -> None:
     assert fd1 != d1
 
 
+def test_copy_shares_data() -> None:
+    fd1 = FrozenDict({"a": 0, "b": 1})
+    fd2 = FrozenDict(fd1)
+    assert fd2 == fd1
+    assert fd2._data is fd1._data
+    # Keyword arguments require a copy.
+    assert FrozenDict(fd1, c=2) == FrozenDict({"a": 0, "b": 1, "c": 2})
+    assert fd1 == FrozenDict({"a": 0, "b": 1})
+
+
 @pytest.mark.xfail(reason="FrozenDict equality broken for different insertion orders.")
 def test_eq_different_orders() -> None:
     fd1 = FrozenDict({"a": 0, "b": 1})
@@ -167,6 +177,12 @@ def test_lazy_frozen_dict() -> None:
     # Hash value should be stable regardless if we've loaded the values or not.
     assert hash(ld1) == hashvalue
 
+    # Equality compares the loaded values, rather than the loaders.
+    ld2 = LazyFrozenDict({"a": lambda: "4321", "b": lambda: "dcba"})
+    assert hash(ld1) != hash(ld2)
+    assert ld1 == ld2
+    assert ld1 == FrozenDict({"a": "4321", "b": "dcba"})
+
 
 def test_frozendict_dot_frozen() -> None:
     a = {1: 2}
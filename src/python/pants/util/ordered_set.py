@@ -20,6 +20,7 @@ from typing import AbstractSet, Any, Hashable, Iterable, Iterator, MutableSet, S
 T = TypeVar("T")
 T_co = TypeVar("T_co", covariant=True)
 _TAbstractOrderedSet = TypeVar("_TAbstractOrderedSet", bound="_AbstractOrderedSet")
+_TFrozenOrderedSet = TypeVar("_TFrozenOrderedSet", bound="FrozenOrderedSet")
 
 
 class _AbstractOrderedSet(AbstractSet[T]):
@@ -60,9 +61,8 @@ class _AbstractOrderedSet(AbstractSet[T]):
         """Returns True if other is the same type with the same elements and same order."""
         if not isinstance(other, self.__class__):
             return NotImplemented
-        return len(self._items) == len(other._items) and all(
-            x == y for x, y in zip(self._items, other._items)
-        )
+        # NB: Comparing lists of the keys runs the element-wise comparison in C.
+        return len(self._items) == len(other._items) and list(self._items) == list(other._items)
 
     def __or__(self: _TAbstractOrderedSet, other: Iterable[T]) -> _TAbstractOrderedSet:  # type: ignore[override]
         return self.union(other)
@@ -89,6 +89,12 @@ class _AbstractOrderedSet(AbstractSet[T]):
         # The parent class's implementation of this is backwards.
         return self.intersection(other)
 
+    def __sub__(self: _TAbstractOrderedSet, other: AbstractSet[Any]) -> _TAbstractOrderedSet:
+        # NB: Like `set`, and unlike `difference()`, only other sets may be subtracted.
+        if not isinstance(other, AbstractSet):
+            return NotImplemented
+        return self.difference(other)
+
     def intersection(self: _TAbstractOrderedSet, *others: Iterable[T]) -> _TAbstractOrderedSet:
         """Returns elements in common between all sets.
 
@@ -203,8 +209,69 @@ class FrozenOrderedSet(_AbstractOrderedSet[T_co], Hashable):  # type: ignore[typ
     """
 
     def __init__(self, iterable: Iterable[T_co] | None = None) -> None:
+        if isinstance(iterable, FrozenOrderedSet):
+            # The other instance is immutable, so we share its items (and hash, if computed)
+            # rather than copying them.
+            self._items = iterable._items
+            self.__hash: int | None = iterable.__hash
+            return
         super().__init__(iterable)
-        self.__hash: int | None = None
+        self.__hash = None
+
+    def _derive(self: _TFrozenOrderedSet, items: dict[T_co, None]) -> _TFrozenOrderedSet:
+        """Create an instance of this class which takes ownership of the given `items`.
+
+        Because instances are immutable, `items` may be (and when an operation leaves this set
+        unchanged, is) the `_items` of this instance.
+        """
+        cls = self.__class__
+        if cls.__init__ is not FrozenOrderedSet.__init__:
+            # Subclasses may normalize their input (e.g. by sorting it), so must be constructed via
+            # their own constructor.
+            return cls(items)
+        derived = cls.__new__(cls)
+        derived._items = items
+        derived.__hash = self.__hash if items is self._items else None
+        return derived
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if (
+            isinstance(other, self.__class__)
+            and self.__hash is not None
+            and other.__hash is not None
+            and self.__hash != other.__hash
+        ):
+            return False
+        return super().__eq__(other)
+
+    def union(self: _TFrozenOrderedSet, *others: Iterable[T_co]) -> _TFrozenOrderedSet:
+        """Combines all unique items.
+
+        Each item's order is defined by its first appearance.
+        """
+        items = dict.fromkeys(itertools.chain(self._items, *others))
+        return self._derive(self._items if len(items) == len(self._items) else items)
+
+    def intersection(self: _TFrozenOrderedSet, *others: Iterable[T_co]) -> _TFrozenOrderedSet:
+        """Returns elements in common between all sets.
+
+        Order is defined only by the first set.
+        """
+        if not others:
+            return self._derive(self._items)
+        common = set.intersection(*(set(other) for other in others))
+        items = dict.fromkeys(filter(common.__contains__, self._items))
+        return self._derive(self._items if len(items) == len(self._items) else items)
+
+    def difference(self: _TFrozenOrderedSet, *others: Iterable[T_co]) -> _TFrozenOrderedSet:
+        """Returns all elements that are in this set but not the others."""
+        other = set().union(*others)
+        if not other:
+            return self._derive(self._items)
+        items = dict.fromkeys(itertools.filterfalse(other.__contains__, self._items))
+        return self._derive(self._items if len(items) == len(self._items) else items)
 
     def __hash__(self) -> int:
         if self.__hash is None:
@@ -80,6 +80,42 @@ def test_frozen_is_hashable() -> None:
 
     set2 = FrozenOrderedSet("abcd")
     assert hash(set1) != hash(set2)
+    assert set1 != set2
+
+
+def test_frozen_derived_sets_share_items() -> None:
+    set1 = FrozenOrderedSet("abc")
+    for derived in (
+        copy(set1),
+        FrozenOrderedSet(set1),
+        set1 | "cba",
+        set1.union(),
+        set1 & "abcd",
+        set1 - {"x", "y", "z"},
+        set1.difference(),
+    ):
+        assert derived == set1
+        assert derived is not set1
+        assert derived._items is set1._items
+
+    assert list(set1 | "dc") == ["a", "b", "c", "d"]
+    assert list(set1 & "cb") == ["b", "c"]
+    assert list(set1 - {"b"}) == ["a", "c"]
+    with pytest.raises(TypeError):
+        set1 - "b"  # type: ignore[operator]
+    assert list(set1) == ["a", "b", "c"]
+
+
+def test_frozen_derived_sets_use_subclass_constructor() -> None:
+    class SortedFrozenOrderedSet(FrozenOrderedSet[str]):
+        def __init__(self, iterable=()) -> None:
+            super().__init__(sorted(iterable))
+
+    set1 = SortedFrozenOrderedSet("cab")
+    assert list(set1) == ["a", "b", "c"]
+    assert list(set1 | "da") == ["a", "b", "c", "d"]
+    assert type(set1 | "d") is SortedFrozenOrderedSet
+    assert type(set1 - {"a"}) is SortedFrozenOrderedSet
 
 
 @pytest.mark.parametrize("cls", [OrderedSet, FrozenOrderedSet])
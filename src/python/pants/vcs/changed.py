@@ -3,8 +3,10 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import PurePath
 from typing import List, cast
 
 from pants.backend.project_info import dependents
@@ -13,16 +15,17 @@ from pants.base.build_environment import get_buildroot
 from pants.base.deprecated import resolve_conflicting_options
 from pants.engine.addresses import Address, Addresses
 from pants.engine.collection import Collection
+from pants.engine.fs import Snapshot, SnapshotDiff
 from pants.engine.internals.graph import Owners, OwnersRequest
 from pants.engine.internals.mapper import SpecsFilter
 from pants.engine.rules import Get, collect_rules, rule
 from pants.engine.target import UnexpandedTargets
-from pants.option.option_types import EnumOption, StrOption
+from pants.option.option_types import BoolOption, EnumOption, StrOption
 from pants.option.option_value_container import OptionValueContainer
 from pants.option.subsystem import Subsystem
 from pants.util.docutil import doc_url
 from pants.util.ordered_set import FrozenOrderedSet
-from pants.util.strutil import help_text
+from pants.util.strutil import help_text, softwrap
 from pants.vcs.git import GitWorktree
 
 
@@ -106,6 +109,7 @@ class ChangedOptions:
     since: str | None
     diffspec: str | None
     dependents: DependentsOption
+    incremental: bool = False
 
     @classmethod
     def from_options(cls, options: OptionValueContainer) -> ChangedOptions:
@@ -117,20 +121,32 @@ class ChangedOptions:
             old_container=options,
             new_container=options,
         )
-        return cls(options.since, options.diffspec, dependents)
+        return cls(options.since, options.diffspec, dependents, options.incremental)
 
     @property
     def provided(self) -> bool:
         return bool(self.since) or bool(self.diffspec)
 
-    def changed_files(self, git_worktree: GitWorktree) -> list[str]:
-        """Determines the files changed according to SCM/workspace and options."""
+    def changed_files(
+        self, git_worktree: GitWorktree, worktree_snapshot: Snapshot | None = None
+    ) -> list[str]:
+        """Determines the files changed according to SCM/workspace and options.
+
+        If a `Snapshot` of the worktree is given, the changes are computed incrementally from the
+        changes computed by a previous run (under `pantsd`).
+        """
         if self.diffspec:
             return cast(
                 List[str], git_worktree.changes_in(self.diffspec, relative_to=get_buildroot())
             )
 
         changes_since = self.since or git_worktree.current_rev_identifier
+        if worktree_snapshot is not None:
+            return sorted(
+                incremental_changed_files(
+                    git_worktree, changes_since, worktree_snapshot, relative_to=get_buildroot()
+                )
+            )
         return cast(
             List[str],
             git_worktree.changed_files(
@@ -139,6 +155,71 @@ class ChangedOptions:
         )
 
 
+@dataclass(frozen=True)
+class _WorktreeChanges:
+    """The files changed in a worktree, for particular commits and contents of the worktree."""
+
+    commit_ids: tuple[str, ...]
+    snapshot: Snapshot
+    committed: frozenset[str]
+    uncommitted: frozenset[str]
+
+
+# Beyond this many files changed between runs, it is cheaper to let git scan the whole worktree.
+_MAX_INCREMENTALLY_CHANGED_FILES = 1000
+
+# The changes computed by the previous run for each worktree and base commit. These outlive a run
+# under `pantsd`.
+_previous_worktree_changes: dict[tuple[str, str], _WorktreeChanges] = {}
+
+
+def incremental_changed_files(
+    git_worktree: GitWorktree,
+    changes_since: str,
+    worktree_snapshot: Snapshot,
+    relative_to: PurePath | str,
+) -> set[str]:
+    """Compute the changed files as `GitWorktree.changed_files` does, but incrementally.
+
+    The committed changes can only differ from those of the previous run if HEAD or the base commit
+    has moved. Otherwise, only the files which differ between the previous and current `Snapshot`
+    of the worktree (which the engine keeps up to date by watching the filesystem) need to be
+    compared to HEAD.
+    """
+    commit_ids = git_worktree.rev_parse("HEAD", changes_since)
+    key = (str(git_worktree.worktree), changes_since)
+    previous = _previous_worktree_changes.get(key)
+
+    touched: set[str] | None = None
+    if previous is not None and previous.commit_ids == commit_ids:
+        diff = SnapshotDiff.from_snapshots(previous.snapshot, worktree_snapshot)
+        touched = {*diff.our_unique_files, *diff.their_unique_files, *diff.changed_files}
+        # An edited `.gitignore` may change whether any other file is untracked.
+        if len(touched) > _MAX_INCREMENTALLY_CHANGED_FILES or any(
+            os.path.basename(f) == ".gitignore" for f in touched
+        ):
+            touched = None
+
+    if previous is None or touched is None:
+        committed = git_worktree.committed_changes(changes_since, relative_to=relative_to)
+        uncommitted = git_worktree.uncommitted_changes(
+            include_untracked=True, relative_to=relative_to
+        )
+    else:
+        committed = set(previous.committed)
+        uncommitted = set(previous.uncommitted - touched)
+        uncommitted.update(
+            git_worktree.uncommitted_changes(
+                paths=sorted(touched), include_untracked=True, relative_to=relative_to
+            )
+        )
+
+    _previous_worktree_changes[key] = _WorktreeChanges(
+        commit_ids, worktree_snapshot, frozenset(committed), frozenset(uncommitted)
+    )
+    return committed | uncommitted
+
+
 class Changed(Subsystem):
     options_scope = "changed"
     help = help_text(
@@ -161,6 +242,23 @@ class Changed(Subsystem):
         default=DependentsOption.NONE,
         help="Include direct or transitive dependents of changed targets.",
     )
+    incremental = BoolOption(
+        default=False,
+        advanced=True,
+        help=softwrap(
+            """
+            When running with `pantsd`, compute the changes for `--changed-since` incrementally
+            from the changes computed by the previous run, rather than scanning the whole worktree
+            with `git` each time.
+
+            The filesystem watcher of `pantsd` tracks which files have been edited since the
+            previous run, and only those files are compared to `HEAD`. The worktree is scanned in
+            full whenever `HEAD` or the `--changed-since` commit moves, or a `.gitignore` file is
+            edited. The first run fingerprints every file in the repository, so this only pays off
+            for repeated runs against a long-lived `pantsd`.
+            """
+        ),
+    )
     dependees = EnumOption(
         default=DependentsOption.NONE,
         help="Include direct or transitive dependents of changed targets.",
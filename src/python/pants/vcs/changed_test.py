@@ -0,0 +1,87 @@
+# Copyright 2026 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from pants.core.util_rules.system_binaries import GitBinary
+from pants.testutil.rule_runner import RuleRunner
+from pants.util.contextutil import environment_as
+from pants.vcs import changed
+from pants.vcs.changed import incremental_changed_files
+from pants.vcs.git import GitWorktree
+
+
+@pytest.fixture(autouse=True)
+def reset_previous_worktree_changes() -> Iterator[None]:
+    # The changes of the previous run deliberately outlive it, so must not leak between tests.
+    changed._previous_worktree_changes.clear()
+    yield
+    changed._previous_worktree_changes.clear()
+
+
+@pytest.fixture
+def worktree(tmp_path: Path) -> Path:
+    wt = tmp_path / "worktree"
+    wt.mkdir()
+    return wt
+
+
+@pytest.fixture
+def gitdir(tmp_path: Path) -> Path:
+    return tmp_path / "gitdir"
+
+
+def run_git(gitdir: Path, worktree: Path, *args: str) -> None:
+    subprocess.check_call(
+        ["git", f"--git-dir={gitdir}", f"--work-tree={worktree}", *args], cwd=worktree
+    )
+
+
+@pytest.fixture
+def git(gitdir: Path, worktree: Path) -> Iterator[GitWorktree]:
+    with environment_as(GIT_CONFIG_GLOBAL="/dev/null"):
+        run_git(gitdir, worktree, "init")
+        run_git(gitdir, worktree, "config", "user.email", "you@example.com")
+        run_git(gitdir, worktree, "config", "user.name", "Your Name")
+
+        readme_file = worktree / "README"
+        readme_file.touch()
+        run_git(gitdir, worktree, "add", "README")
+        run_git(gitdir, worktree, "commit", "--message", "Add README.")
+        readme_file.write_bytes("Hello World.❤".encode())
+        run_git(gitdir, worktree, "commit", "--all", "--message", "Update README.")
+
+        yield GitWorktree(binary=GitBinary(path="git"), gitdir=gitdir, worktree=worktree)
+
+
+def test_incremental_changed_files(gitdir: Path, worktree: Path, git: GitWorktree) -> None:
+    rule_runner = RuleRunner()
+
+    def changed_files(files: dict[str, str]) -> set[str]:
+        return incremental_changed_files(
+            git, "HEAD^", rule_runner.make_snapshot(files), relative_to=worktree
+        )
+
+    assert {"README"} == changed_files({"README": "v1"})
+
+    # Only files which differ from the previous Snapshot are re-examined.
+    (worktree / "INSTALL").write_text("make install")
+    assert {"README"} == changed_files({"README": "v1"})
+    assert {"README", "INSTALL"} == changed_files({"README": "v1", "INSTALL": "make install"})
+
+    # Moving HEAD causes a full scan.
+    run_git(gitdir, worktree, "add", "INSTALL")
+    run_git(gitdir, worktree, "commit", "--message", "Add INSTALL.")
+    assert {"INSTALL"} == changed_files({"README": "v1", "INSTALL": "make install"})
+
+    readme_file = worktree / "README"
+    readme_file.write_text("v2")
+    assert {"INSTALL", "README"} == changed_files({"README": "v2", "INSTALL": "make install"})
+    readme_file.write_bytes("Hello World.❤".encode())
+    assert {"INSTALL"} == changed_files({"README": "v3", "INSTALL": "make install"})
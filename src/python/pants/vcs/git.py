@@ -75,25 +75,57 @@ class GitWorktree(EngineAwareReturnType):
         include_untracked: bool = False,
         relative_to: PurePath | str | None = None,
     ) -> set[str]:
+        files = self.uncommitted_changes(
+            include_untracked=include_untracked, relative_to=relative_to
+        )
+        if from_commit:
+            files.update(self.committed_changes(from_commit, relative_to=relative_to))
+        return files
+
+    def committed_changes(
+        self, from_commit: str, relative_to: PurePath | str | None = None
+    ) -> set[str]:
+        """The files changed on the current branch since it diverged from `from_commit`."""
         relative_to = PurePath(relative_to) if relative_to is not None else self.worktree
-        rel_suffix = ["--", str(relative_to)]
+        # Grab the diff from the merge-base to HEAD using ... syntax.  This ensures we have just
+        # the changes that have occurred on the current branch.
+        committed_cmd = ["diff", "--name-only", from_commit + "...HEAD", "--", str(relative_to)]
+        committed_changes = self._git_binary._invoke_unsandboxed(
+            self._create_git_cmdline(committed_cmd)
+        )
+        # git will report changed files relative to the worktree: re-relativize to relative_to
+        return {self._fix_git_relative_path(f, relative_to) for f in committed_changes.split()}
+
+    def uncommitted_changes(
+        self,
+        paths: Iterable[str] | None = None,
+        include_untracked: bool = False,
+        relative_to: PurePath | str | None = None,
+    ) -> set[str]:
+        """The files which differ from HEAD in the worktree.
+
+        If `paths` (relative to `relative_to`) are given, only those paths are inspected, which is
+        much faster than scanning the whole worktree.
+        """
+        relative_to = PurePath(relative_to) if relative_to is not None else self.worktree
+        if paths is None:
+            rel_suffix = ["--", str(relative_to)]
+        else:
+            rel_suffix = ["--", *(str(relative_to / path) for path in paths)]
+            if len(rel_suffix) == 1:
+                return set()
+        # NB: The paths are not globs, so they must be matched literally.
+        git_options = ["--literal-pathspecs"] if paths is not None else []
         uncommitted_changes = self._git_binary._invoke_unsandboxed(
             self._create_git_cmdline(
-                ["diff", "--name-only", "HEAD"] + rel_suffix,
+                [*git_options, "diff", "--name-only", "HEAD"] + rel_suffix,
             )
         )
 
         files = set(uncommitted_changes.splitlines())
-        if from_commit:
-            # Grab the diff from the merge-base to HEAD using ... syntax.  This ensures we have just
-            # the changes that have occurred on the current branch.
-            committed_cmd = ["diff", "--name-only", from_commit + "...HEAD"] + rel_suffix
-            committed_changes = self._git_binary._invoke_unsandboxed(
-                self._create_git_cmdline(committed_cmd)
-            )
-            files.update(committed_changes.split())
         if include_untracked:
             untracked_cmd = [
+                *git_options,
                 "ls-files",
                 "--other",
                 "--exclude-standard",
@@ -106,6 +138,13 @@ class GitWorktree(EngineAwareReturnType):
         # git will report changed files relative to the worktree: re-relativize to relative_to
         return {self._fix_git_relative_path(f, relative_to) for f in files}
 
+    def rev_parse(self, *revs: str) -> tuple[str, ...]:
+        """Resolve the given revisions to commit ids."""
+        output = self._git_binary._invoke_unsandboxed(
+            self._create_git_cmdline(["rev-parse", *revs])
+        )
+        return tuple(output.splitlines())
+
     def changes_in(self, diffspec: str, relative_to: PurePath | str | None = None) -> set[str]:
         relative_to = PurePath(relative_to) if relative_to is not None else self.worktree
         cmd = ["diff-tree", "--no-commit-id", "--name-only", "-r", diffspec]
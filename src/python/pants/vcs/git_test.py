@@ -264,6 +264,18 @@ def test_commit_with_new_untracked_file_adds_file(worktree: Path, git: MutatingG
     assert set() == git.changed_files(include_untracked=True)
 
 
+def test_uncommitted_changes_in_paths(worktree: Path, git: MutatingGitWorktree) -> None:
+    (worktree / "INSTALL").write_text("make install")
+    (worktree / "dir" / "f").write_text("edited")
+    (worktree / "dir" / "[g]").write_text("untracked")
+
+    assert {"INSTALL", "dir/f", "dir/[g]"} == git.uncommitted_changes(include_untracked=True)
+    assert {"dir/f"} == git.uncommitted_changes(paths=["dir/f", "README"], include_untracked=True)
+    assert {"dir/[g]"} == git.uncommitted_changes(paths=["dir/[g]"], include_untracked=True)
+    assert set() == git.uncommitted_changes(paths=["dir/[g]"])
+    assert set() == git.uncommitted_changes(paths=[])
+
+
 def test_bad_ref_stderr_issues_13396(git: MutatingGitWorktree) -> None:
     with pytest.raises(
         GitBinaryException, match=re.escape("fatal: bad revision 'remote/dne...HEAD'\n")
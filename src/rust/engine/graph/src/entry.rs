@@ -776,6 +776,42 @@ impl<N: Node> Entry<N> {
     };
   }
 
+  ///
+  /// If this Node is not running, drops its value (and any previous value) in order to release the
+  /// memory that it retains, and returns true.
+  ///
+  /// Unlike `clear`, no previous result is preserved, so the Node will re-run from scratch rather
+  /// than being cleaned. Its Generation is incremented so that its dependents and pollers observe
+  /// the re-run as a change.
+  ///
+  pub(crate) fn evict(&mut self) -> bool {
+    let mut state = self.state.lock();
+    let (run_token, generation) = match *state {
+      EntryState::Running { .. } => return false,
+      EntryState::NotStarted {
+        run_token,
+        generation,
+        ..
+      }
+      | EntryState::Completed {
+        run_token,
+        generation,
+        ..
+      } => (run_token, generation),
+    };
+
+    test_trace_log!("Evicting node {:?}", self.node);
+
+    // NB: Dropping the previous state notifies any pollers, which will re-request the Node.
+    *state = EntryState::NotStarted {
+      run_token: run_token.next(),
+      generation: generation.next(),
+      pollers: Vec::new(),
+      previous_result: None,
+    };
+    true
+  }
+
   ///
   /// Dirties this Node, which will cause it to examine its dependencies the next time it is
   /// requested, and re-run if any of them have changed generations.
@@ -231,6 +231,32 @@ impl<N: Node> InnerGraph<N> {
     }
   }
 
+  ///
+  /// Drops the values (and previous values) of all Nodes which are not running, along with their
+  /// dependency edges, and returns the number of Nodes which were evicted.
+  ///
+  fn evict(&mut self) -> usize {
+    let mut evicted_ids = HashSet::default();
+    for &eid in self.nodes.values() {
+      if let Some(entry) = self.pg.node_weight_mut(eid) {
+        if entry.evict() {
+          evicted_ids.insert(eid);
+        }
+      }
+    }
+
+    // Evicted Nodes will re-run from scratch rather than being cleaned, so their dependency edges
+    // are no longer needed.
+    self.pg.retain_edges(|pg, edge| {
+      if let Some((src, _)) = pg.edge_endpoints(edge) {
+        !evicted_ids.contains(&src)
+      } else {
+        true
+      }
+    });
+    evicted_ids.len()
+  }
+
   ///
   /// Clears the values of all "invalidation root" Nodes and dirties their transitive dependents.
   ///
@@ -650,6 +676,18 @@ impl<N: Node> Graph<N> {
     inner.clear()
   }
 
+  ///
+  /// Drops the values of all Nodes in the Graph which are not running, in order to release the
+  /// memory that they retain.
+  ///
+  /// Unlike `clear`, which preserves the previous value of each Node so that it can be cleaned
+  /// rather than re-run, this releases the previous values too: evicted Nodes re-run from scratch.
+  ///
+  pub fn evict(&self) -> usize {
+    let mut inner = self.inner.lock();
+    inner.evict()
+  }
+
   pub fn invalidate_from_roots<P: Fn(&N) -> bool>(
     &self,
     log_dirtied: bool,
@@ -73,6 +73,37 @@ async fn invalidate_and_clean() {
   );
 }
 
+#[tokio::test]
+async fn evict() {
+  let graph = empty_graph();
+  let context = graph.context(TContext::new());
+
+  // Create three nodes.
+  assert_eq!(
+    graph.create(TNode::new(2), &context).await,
+    Ok(vec![T(0, 0), T(1, 0), T(2, 0)])
+  );
+  assert_eq!(graph.evict(), 3);
+  assert_eq!(graph.len(), 3);
+
+  // Confirm that no previous values were retained to clean against: all of the Nodes re-run.
+  assert_eq!(
+    graph.create(TNode::new(2), &context).await,
+    Ok(vec![T(0, 0), T(1, 0), T(2, 0)])
+  );
+  assert_eq!(
+    context.runs(),
+    vec![
+      TNode::new(2),
+      TNode::new(1),
+      TNode::new(0),
+      TNode::new(2),
+      TNode::new(1),
+      TNode::new(0)
+    ]
+  );
+}
+
 #[tokio::test]
 async fn invalidate_and_rerun() {
   let graph = empty_graph();
@@ -114,6 +114,7 @@ fn native_engine(py: Python, m: &PyModule) -> PyO3Result<()> {
   m.add_function(wrap_pyfunction!(graph_invalidate_paths, m)?)?;
   m.add_function(wrap_pyfunction!(graph_invalidate_all_paths, m)?)?;
   m.add_function(wrap_pyfunction!(graph_invalidate_all, m)?)?;
+  m.add_function(wrap_pyfunction!(graph_evict_all, m)?)?;
   m.add_function(wrap_pyfunction!(graph_len, m)?)?;
   m.add_function(wrap_pyfunction!(graph_visualize, m)?)?;
 
@@ -1218,6 +1219,15 @@ fn graph_invalidate_all(py: Python, py_scheduler: &PyScheduler) {
     .enter(|| py.allow_threads(|| py_scheduler.0.invalidate_all()))
 }
 
+#[pyfunction]
+fn graph_evict_all(py: Python, py_scheduler: &PyScheduler) -> u64 {
+  py_scheduler
+    .0
+    .core
+    .executor
+    .enter(|| py.allow_threads(|| py_scheduler.0.evict_all() as u64))
+}
+
 #[pyfunction]
 fn check_invalidation_watcher_liveness(py_scheduler: &PyScheduler) -> PyO3Result<()> {
   py_scheduler
@@ -116,6 +116,13 @@ impl Scheduler {
     self.core.graph.clear();
   }
 
+  ///
+  /// Evict the values of all Nodes in the graph which are not running, in order to release memory.
+  ///
+  pub fn evict_all(&self) -> usize {
+    self.core.graph.evict()
+  }
+
   ///
   /// Return Scheduler and per-Session metrics.
   ///